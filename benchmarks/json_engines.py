@@ -0,0 +1,75 @@
+import argparse
+import random
+import string
+from collections.abc import Callable
+from importlib.util import find_spec
+from timeit import repeat
+from typing import Any
+
+from iokit import Json, Jsonl
+from iokit.extensions.json import JsonEngine
+
+ENGINES: tuple[JsonEngine, ...] = ("stdlib", "orjson", "ujson")
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_letters, k=rng.randint(3, 12)))
+
+
+def _record(rng: random.Random, index: int) -> dict[str, Any]:
+    return {
+        "id": index,
+        "name": _word(rng),
+        "score": rng.random(),
+        "tags": [_word(rng) for _ in range(rng.randint(0, 5))],
+        "active": rng.random() > 0.5,  # noqa: PLR2004
+        "meta": {"source": _word(rng), "version": rng.randint(1, 10)},
+    }
+
+
+def _config(rng: random.Random, size: int) -> dict[str, Any]:
+    return {f"section_{i}": _record(rng, i) for i in range(size)}
+
+
+def _timeit(func: Callable[[], object], number: int) -> float:
+    return min(repeat(func, number=number, repeat=5)) / number
+
+
+def _report(title: str, timings: dict[str, tuple[float, float]]) -> None:
+    print(f"\n{title}")
+    print(f"{'engine':<8} {'encode, ms':>12} {'decode, ms':>12}")
+    for engine, (encode, decode) in timings.items():
+        print(f"{engine:<8} {encode * 1e3:>12.3f} {decode * 1e3:>12.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare JSON engines used by Json and Jsonl")
+    parser.add_argument("--config-size", type=int, default=20_000)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(1337)  # noqa: S311
+    config = _config(rng, args.config_size)
+    records = [_record(rng, i) for i in range(args.records)]
+    engines = [e for e in ENGINES if e == "stdlib" or find_spec(e) is not None]
+
+    config_timings: dict[str, tuple[float, float]] = {}
+    records_timings: dict[str, tuple[float, float]] = {}
+    for engine in engines:
+        json_state = Json(config, compact=True, engine=engine)
+        jsonl_state = Jsonl(records, engine=engine)
+        config_timings[engine] = (
+            _timeit(lambda e=engine: Json(config, compact=True, engine=e), args.number),
+            _timeit(lambda e=engine, s=json_state: s.load(engine=e), args.number),
+        )
+        records_timings[engine] = (
+            _timeit(lambda e=engine: Jsonl(records, engine=e), args.number),
+            _timeit(lambda e=engine, s=jsonl_state: s.load(engine=e), args.number),
+        )
+    _report(f"Json config ({len(Json(config, compact=True).data) >> 10} KiB)", config_timings)
+    _report(f"Jsonl records ({args.records} lines)", records_timings)
+
+
+if __name__ == "__main__":
+    main()
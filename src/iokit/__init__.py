@@ -1,8 +1,15 @@
 __version__ = "0.3.4"
 __all__ = [
+    "AsyncLocalStorage",
+    "AsyncMemoryStorage",
+    "AsyncStorage",
+    "AsyncStorageAdapter",
+    "CacheStats",
+    "CachedStorage",
     "ChecksumMixin",
     "Csv",
     "Dat",
+    "Downloader",
     "Enc",
     "Env",
     "Flac",
@@ -10,31 +17,52 @@ __all__ = [
     "Jpeg",
     "Json",
     "Jsonl",
+    "JsonlWriter",
+    "Lz4",
     "Mp3",
     "Npy",
     "Ogg",
+    "PackStorage",
+    "PipelineStats",
     "Png",
     "ReadOnlyStorage",
+    "RecordInfo",
     "SecretState",
+    "SqliteStorage",
     "State",
     "Storage",
+    "Streamable",
     "Tar",
+    "TarArchive",
+    "TarWriter",
+    "TieredStorage",
     "Tsv",
     "Txt",
     "Wav",
     "Waveform",
+    "Xz",
     "Yaml",
     "Zip",
+    "ZipArchive",
+    "ZipWriter",
+    "Zst",
     "auto_state",
+    "checksum_tree",
+    "clear_key_cache",
     "decrypt",
+    "decrypt_stream",
     "download_file",
     "encrypt",
+    "encrypt_stream",
     "filter_states",
     "find_state",
     "load_file",
+    "migrate_layout",
     "save_file",
     "save_temp",
+    "set_key_cache_size",
     "supported_extensions",
+    "verify_tree",
 ]
 
 
@@ -49,21 +77,55 @@ from .extensions import (
     Jpeg,
     Json,
     Jsonl,
+    JsonlWriter,
+    Lz4,
     Mp3,
     Npy,
     Ogg,
     Png,
     SecretState,
     Tar,
+    TarArchive,
+    TarWriter,
     Tsv,
     Txt,
     Wav,
     Waveform,
+    Xz,
     Yaml,
     Zip,
+    ZipArchive,
+    ZipWriter,
+    Zst,
     auto_state,
+    clear_key_cache,
     decrypt,
+    decrypt_stream,
     encrypt,
+    encrypt_stream,
+    set_key_cache_size,
+)
+from .state import State, Streamable, filter_states, find_state, supported_extensions
+from .storage import (
+    AsyncLocalStorage,
+    AsyncMemoryStorage,
+    AsyncStorage,
+    AsyncStorageAdapter,
+    CachedStorage,
+    CacheStats,
+    Downloader,
+    PackStorage,
+    PipelineStats,
+    ReadOnlyStorage,
+    RecordInfo,
+    SqliteStorage,
+    Storage,
+    TieredStorage,
+    checksum_tree,
+    download_file,
+    load_file,
+    migrate_layout,
+    save_file,
+    save_temp,
+    verify_tree,
 )
-from .state import State, filter_states, find_state, supported_extensions
-from .storage import ReadOnlyStorage, Storage, download_file, load_file, save_file, save_temp
@@ -1,27 +1,32 @@
-__all__ = ["ChecksumMixin"]
+__all__ = [
+    "ChecksumMixin",
+    "Hasher",
+    "new_hasher",
+    "stream_hexdigest",
+    "stream_hexdigest_many",
+]
 
 import hashlib
-from collections.abc import Generator, Iterator
-from contextlib import contextmanager
-from io import BytesIO
-from typing import Literal, Protocol
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO, Literal, Protocol
 
 import xxhash
+from typing_extensions import Buffer
 
-CHUNK_SIZE = 4096
+CHUNK_SIZE = 1 << 20
 
 HashAlgorithm = Literal["xxh32", "xxh64", "xxh128", "sha256", "md5", "sha1", "blake2b", "blake2s"]
 
 
-class _HashAlgorithmProtocol(Protocol):
+class Hasher(Protocol):
     def hexdigest(self) -> str:
         pass
 
-    def update(self, data: bytes) -> None:
+    def update(self, data: Buffer, /) -> None:
         pass
 
 
-def _get_hash_algorithm(algorithm: HashAlgorithm) -> _HashAlgorithmProtocol:  # noqa: PLR0911
+def new_hasher(algorithm: HashAlgorithm) -> Hasher:  # noqa: PLR0911
     match algorithm:
         case "xxh32":
             return xxhash.xxh32()
@@ -44,49 +49,59 @@ def _get_hash_algorithm(algorithm: HashAlgorithm) -> _HashAlgorithmProtocol:  #
             raise ValueError(msg)
 
 
-@contextmanager
-def _buffer(data: object) -> Generator[BytesIO, None, None]:
-    close = False
-    if hasattr(data, "buffer"):
-        buffer = data.buffer
-        close = True
-    elif isinstance(data, bytes):
-        buffer = BytesIO(data)
-        close = True
-    elif hasattr(data, "data"):
-        data = data.data
-        buffer = BytesIO(data.data)
-        close = True
-    else:
-        buffer = data
-        buffer.seek(0)
-
-    try:
-        yield buffer
-
-    finally:
-        if close:
-            buffer.close()
-
-
-def _iterate_chuncks(
-    data: object,
+def _iterate_chunks(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Buffer]:
+    if chunk_size <= 0:
+        msg = f"Chunk size must be positive, got {chunk_size}"
+        raise ValueError(msg)
+    readinto = getattr(stream, "readinto", None)
+    if readinto is None:
+        yield from iter(lambda: stream.read(chunk_size), b"")
+        return
+    chunk = memoryview(bytearray(chunk_size))
+    while size := readinto(chunk):
+        yield chunk[:size]
+
+
+def _hexdigests(
+    algorithms: Iterable[HashAlgorithm],
+    chunks: Iterable[Buffer],
+) -> dict[HashAlgorithm, str]:
+    hash_objects = {algorithm: new_hasher(algorithm) for algorithm in algorithms}
+    for chunk in chunks:
+        for hash_object in hash_objects.values():
+            hash_object.update(chunk)
+    return {algorithm: obj.hexdigest() for algorithm, obj in hash_objects.items()}
+
+
+def stream_hexdigest_many(
+    stream: BinaryIO,
+    algorithms: Iterable[HashAlgorithm],
+    *,
     chunk_size: int = CHUNK_SIZE,
-) -> Iterator[bytes]:
-    with _buffer(data) as buffer:
-        yield from iter(lambda: buffer.read(chunk_size), b"")
+) -> dict[HashAlgorithm, str]:
+    return _hexdigests(algorithms, _iterate_chunks(stream, chunk_size=chunk_size))
 
 
-def _hexdigest(algorithm: HashAlgorithm, data: object) -> str:
-    hash_object = _get_hash_algorithm(algorithm)
-    for chunk in _iterate_chuncks(data):
-        hash_object.update(chunk)
-    return hash_object.hexdigest()
+def stream_hexdigest(
+    stream: BinaryIO,
+    algorithm: HashAlgorithm,
+    *,
+    chunk_size: int = CHUNK_SIZE,
+) -> str:
+    return stream_hexdigest_many(stream, [algorithm], chunk_size=chunk_size)[algorithm]
 
 
 class ChecksumMixin:
+    @property
+    def memory(self) -> memoryview:
+        msg = "Property 'memory' must be implemented in a subclass"
+        raise NotImplementedError(msg)
+
+    def hexdigest_many(self, algorithms: Iterable[HashAlgorithm]) -> dict[HashAlgorithm, str]:
+        return _hexdigests(algorithms, [self.memory])
+
     def hexdigest(self, algorithm: HashAlgorithm) -> str:
-        return _hexdigest(algorithm=algorithm, data=self)
+        return self.hexdigest_many([algorithm])[algorithm]
 
     def hexdigest_assert(self, algorithm: HashAlgorithm, hexdigest: str) -> None:
         if (checksum := self.hexdigest(algorithm)) != hexdigest:
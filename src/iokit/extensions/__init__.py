@@ -9,35 +9,59 @@ __all__ = [
     "Jpeg",
     "Json",
     "Jsonl",
+    "JsonlWriter",
+    "Lz4",
     "Mp3",
     "Npy",
     "Ogg",
     "Png",
     "SecretState",
     "Tar",
+    "TarArchive",
+    "TarWriter",
     "Tsv",
     "Txt",
     "Wav",
     "Waveform",
+    "Xz",
     "Yaml",
     "Zip",
+    "ZipArchive",
+    "ZipWriter",
+    "Zst",
     "auto_state",
+    "clear_key_cache",
     "decrypt",
+    "decrypt_stream",
     "encrypt",
+    "encrypt_stream",
+    "set_key_cache_size",
 ]
 
 from .audio import Flac, Mp3, Ogg, Wav, Waveform
 from .auto import auto_state
 from .dat import Dat
-from .enc import Enc, SecretState, decrypt, encrypt
+from .enc import (
+    Enc,
+    SecretState,
+    clear_key_cache,
+    decrypt,
+    decrypt_stream,
+    encrypt,
+    encrypt_stream,
+    set_key_cache_size,
+)
 from .env import Env
 from .gz import Gzip
 from .image import Jpeg, Png
 from .json import Json
-from .jsonl import Jsonl
+from .jsonl import Jsonl, JsonlWriter
+from .lz4 import Lz4
 from .npy import Npy
 from .table import Csv, Tsv
-from .tar import Tar
+from .tar import Tar, TarArchive, TarWriter
 from .txt import Txt
+from .xz import Xz
 from .yaml import Yaml
-from .zip import Zip
+from .zip import Zip, ZipArchive, ZipWriter
+from .zst import Zst
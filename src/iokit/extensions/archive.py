@@ -0,0 +1,71 @@
+__all__ = ["Archive"]
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
+from fnmatch import fnmatch
+from types import TracebackType
+from typing import IO
+
+from typing_extensions import Self
+
+from iokit.state import State
+
+
+class Archive(ABC):
+    @abstractmethod
+    def names(self) -> list[str]:
+        msg = "Method 'names' must be implemented in a subclass"
+        raise NotImplementedError(msg)
+
+    @abstractmethod
+    def open(self, name: str) -> IO[bytes]:
+        msg = "Method 'open' must be implemented in a subclass"
+        raise NotImplementedError(msg)
+
+    @abstractmethod
+    def time(self, name: str) -> datetime | None:
+        msg = "Method 'time' must be implemented in a subclass"
+        raise NotImplementedError(msg)
+
+    @abstractmethod
+    def close(self) -> None:
+        msg = "Method 'close' must be implemented in a subclass"
+        raise NotImplementedError(msg)
+
+    def _read(self, name: str) -> bytes | memoryview:
+        with self.open(name) as stream:
+            return stream.read()
+
+    def __getitem__(self, name: str) -> State:
+        return State(self._read(name), name=name, time=self.time(name)).cast()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.names()
+
+    def __iter__(self) -> Iterator[State]:
+        for name in self.names():
+            yield self[name]
+
+    def __len__(self) -> int:
+        return len(self.names())
+
+    def filter(self, pattern: str) -> Iterator[State]:
+        for name in self.names():
+            if fnmatch(name, pattern):
+                yield self[name]
+
+    def _missing(self, name: str) -> FileNotFoundError:
+        msg = f"State not found: {name!r}"
+        return FileNotFoundError(msg)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -9,9 +9,9 @@ from pandas import DataFrame
 from iokit.state import State, StateName
 
 from .audio import Waveform
+from .codec import Compression, compress
 from .dat import Dat
 from .enc import Enc, SecretState
-from .gz import Gzip
 from .json import Json
 from .npy import Npy
 from .table import Csv, Tsv
@@ -24,7 +24,7 @@ def auto_state(  # noqa: C901, PLR0911, PLR0913, PLR0912
     /,
     name: str | StateName = "",
     *,
-    compression: int | bool | None = None,
+    compression: Compression | None = None,
     password: str | None = None,
     waveform_to: Literal["wav", "flac", "mp3", "ogg"] = "wav",
     dataframe_to: Literal["csv", "tsv"] = "csv",
@@ -51,7 +51,7 @@ def auto_state(  # noqa: C901, PLR0911, PLR0913, PLR0912
             dataframe_to=dataframe_to,
             builtin_to=builtin_to,
         )
-        return Gzip(state, time=time, compression=int(compression))
+        return compress(state, compression, time=time)
     match data:
         case ndarray():
             return Npy(data, name=name, time=time)
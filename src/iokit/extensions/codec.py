@@ -0,0 +1,40 @@
+__all__ = ["Codec", "Compression", "compress"]
+
+from datetime import datetime
+from typing import Literal
+
+from iokit.state import State
+
+from .gz import Gzip
+from .lz4 import Lz4
+from .xz import Xz
+from .zst import Zst
+
+Codec = Literal["gzip", "zstd", "lz4", "xz"]
+Compression = int | bool | Codec | tuple[Codec, int]
+
+_CODECS: dict[str, type[Gzip | Zst | Lz4 | Xz]] = {
+    "gzip": Gzip,
+    "zstd": Zst,
+    "lz4": Lz4,
+    "xz": Xz,
+}
+
+
+def compress(state: State, compression: Compression, *, time: datetime | None = None) -> State:
+    match compression:
+        case bool() | int():
+            return Gzip(state, compression=int(compression), time=time)
+        case str():
+            codec, level = compression, None
+        case (str() as codec, int() as level):
+            pass
+        case other:
+            msg = f"Unsupported compression: {other!r}"
+            raise ValueError(msg)
+    if codec not in _CODECS:
+        msg = f"Unknown compression codec '{codec}', expected one of {sorted(_CODECS)}"
+        raise ValueError(msg)
+    if level is None:
+        return _CODECS[codec](state, time=time)
+    return _CODECS[codec](state, compression=level, time=time)
@@ -1,20 +1,50 @@
-__all__ = ["Enc", "SecretState", "decrypt", "encrypt"]
+__all__ = [
+    "Enc",
+    "SecretState",
+    "clear_key_cache",
+    "decrypt",
+    "decrypt_stream",
+    "encrypt",
+    "encrypt_stream",
+    "set_key_cache_size",
+]
 
+import os
 import struct
-from collections.abc import Iterator
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from hashlib import sha256
+from hashlib import blake2b, sha256
+from io import SEEK_END
+from itertools import chain
+from threading import Lock
+from typing import BinaryIO, Literal
 
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.algorithms import AES
 from cryptography.hazmat.primitives.ciphers.base import Cipher
 from cryptography.hazmat.primitives.ciphers.modes import GCM
-from cryptography.hazmat.primitives.padding import PKCS7
+from cryptography.hazmat.primitives.hashes import SHA256
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+from cryptography.hazmat.primitives.padding import PKCS7, PaddingContext
 from typing_extensions import Self
 
 from iokit.state import State, StateName
 
 DEFAULT_SALT = b"170309"
+KEY_CACHE_SIZE = 32
+CHUNK_SIZE = 1 << 20
+
+KeyDerivation = Literal["legacy", "pbkdf2", "scrypt"]
+
+_MAGIC = b"IOKE"
+_VERSION = 1
+_KDF_IDS: dict[KeyDerivation, int] = {"pbkdf2": 1, "scrypt": 2}
+_KDF_NAMES = {value: key for key, value in _KDF_IDS.items()}
+_HEADER = struct.Struct("!4sBB12s")
+_TAG_SIZE = 16
+_LENGTH = struct.Struct("!Q")
 
 
 def _to_bytes(data: bytes | str) -> bytes:
@@ -29,18 +59,91 @@ def _get_hash(data: bytes) -> bytes:
     return hasher.digest()
 
 
-def _generate_key(password: bytes, salt: bytes) -> bytes:
+def _legacy_key(password: bytes, salt: bytes) -> bytes:
     password += salt
     for _ in range(390_000):
         password = _get_hash(password)
     return password
 
 
+def _pbkdf2_key(password: bytes, salt: bytes) -> bytes:
+    return PBKDF2HMAC(algorithm=SHA256(), length=32, salt=salt, iterations=390_000).derive(password)
+
+
+def _scrypt_key(password: bytes, salt: bytes) -> bytes:
+    return Scrypt(salt=salt, length=32, n=2**14, r=8, p=1).derive(password)
+
+
+_KEY_DERIVATIONS: dict[KeyDerivation, Callable[[bytes, bytes], bytes]] = {
+    "legacy": _legacy_key,
+    "pbkdf2": _pbkdf2_key,
+    "scrypt": _scrypt_key,
+}
+
+
+class _KeyCache:
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._keys: OrderedDict[bytes, bytes] = OrderedDict()
+        self._secret = os.urandom(32)
+        self._lock = Lock()
+
+    def _fingerprint(self, kdf: KeyDerivation, password: bytes, salt: bytes) -> bytes:
+        hasher = blake2b(key=self._secret)
+        for part in (kdf.encode("utf-8"), password, salt):
+            hasher.update(struct.pack("!Q", len(part)))
+            hasher.update(part)
+        return hasher.digest()
+
+    def derive(self, kdf: KeyDerivation, password: bytes, salt: bytes) -> bytes:
+        fingerprint = self._fingerprint(kdf, password, salt)
+        with self._lock:
+            if (key := self._keys.get(fingerprint)) is not None:
+                self._keys.move_to_end(fingerprint)
+                return key
+        key = _KEY_DERIVATIONS[kdf](password, salt)
+        with self._lock:
+            self._keys[fingerprint] = key
+            self._evict()
+        return key
+
+    def _evict(self) -> None:
+        while len(self._keys) > self._maxsize:
+            self._keys.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            msg = f"Key cache size must be non-negative, got {maxsize}"
+            raise ValueError(msg)
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+
+
+_key_cache = _KeyCache(KEY_CACHE_SIZE)
+
+
+def set_key_cache_size(size: int) -> None:
+    _key_cache.resize(size)
+
+
+def clear_key_cache() -> None:
+    _key_cache.clear()
+
+
+def _generate_key(password: bytes, salt: bytes, kdf: KeyDerivation = "legacy") -> bytes:
+    return _key_cache.derive(kdf, password, salt)
+
+
 def _cipher(key: bytes, salt: bytes) -> Cipher[GCM]:
     return Cipher(algorithm=AES(key), mode=GCM(_get_hash(salt)))
 
 
-def encrypt(data: bytes, password: bytes, salt: bytes) -> bytes:
+def _encrypt_legacy(data: bytes, password: bytes, salt: bytes) -> bytes:
     key = _generate_key(password=password, salt=salt)
     padder = PKCS7(128).padder()
     encryptor = _cipher(key=key, salt=salt).encryptor()
@@ -50,11 +153,11 @@ def encrypt(data: bytes, password: bytes, salt: bytes) -> bytes:
     return ct + tag
 
 
-def decrypt(data: bytes, password: bytes, salt: bytes) -> bytes:
+def _decrypt_legacy(data: bytes, password: bytes, salt: bytes) -> bytes:
     key = _generate_key(password=password, salt=salt)
     unpadder = PKCS7(128).unpadder()
     decryptor = _cipher(key=key, salt=salt).decryptor()
-    ct, tag = data[:-16], data[-16:]
+    ct, tag = data[:-_TAG_SIZE], data[-_TAG_SIZE:]
     try:
         padded = decryptor.update(ct) + decryptor.finalize_with_tag(tag)
     except InvalidTag as exc:
@@ -63,19 +166,206 @@ def decrypt(data: bytes, password: bytes, salt: bytes) -> bytes:
     return unpadder.update(padded) + unpadder.finalize()
 
 
+def _parse_header(data: bytes) -> tuple[KeyDerivation, bytes] | None:
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, kdf_id, nonce = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION or kdf_id not in _KDF_NAMES:
+        return None
+    return _KDF_NAMES[kdf_id], nonce
+
+
+def _native_cipher(
+    password: bytes,
+    salt: bytes,
+    kdf: KeyDerivation,
+    nonce: bytes,
+) -> Cipher[GCM]:
+    key = _generate_key(password=password, salt=salt, kdf=kdf)
+    return Cipher(algorithm=AES(key), mode=GCM(nonce))
+
+
+def _new_header(kdf: KeyDerivation) -> bytes:
+    if kdf not in _KDF_IDS:
+        msg = f"Unknown key derivation function '{kdf}'"
+        raise ValueError(msg)
+    return _HEADER.pack(_MAGIC, _VERSION, _KDF_IDS[kdf], os.urandom(12))
+
+
+def encrypt(data: bytes, password: bytes, salt: bytes, *, kdf: KeyDerivation = "legacy") -> bytes:
+    if kdf == "legacy":
+        return _encrypt_legacy(data, password=password, salt=salt)
+    header = _new_header(kdf)
+    encryptor = _native_cipher(password, salt, kdf, nonce=header[-12:]).encryptor()
+    encryptor.authenticate_additional_data(header)
+    return b"".join((header, encryptor.update(data), encryptor.finalize(), encryptor.tag))
+
+
+def decrypt(data: bytes, password: bytes, salt: bytes) -> bytes:
+    header = _parse_header(data)
+    if header is None or len(data) < _HEADER.size + _TAG_SIZE:
+        return _decrypt_legacy(data, password=password, salt=salt)
+    kdf, nonce = header
+    decryptor = _native_cipher(password, salt, kdf, nonce=nonce).decryptor()
+    decryptor.authenticate_additional_data(data[: _HEADER.size])
+    ct, tag = memoryview(data)[_HEADER.size : -_TAG_SIZE], data[-_TAG_SIZE:]
+    try:
+        return decryptor.update(ct) + decryptor.finalize_with_tag(tag)
+    except InvalidTag as exc:
+        msg = "Decryption failed"
+        raise ValueError(msg) from exc
+
+
+def _read_chunks(source: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    while chunk := source.read(chunk_size):
+        yield chunk
+
+
+def _hold_tag(chunks: Iterable[bytes], tag: bytearray) -> Iterator[bytes]:
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        if len(pending) > _TAG_SIZE:
+            yield pending[:-_TAG_SIZE]
+            pending = pending[-_TAG_SIZE:]
+    tag[:] = pending
+
+
+def _encrypt_chunks(
+    chunks: Iterable[bytes],
+    target: BinaryIO,
+    password: bytes,
+    salt: bytes,
+    kdf: KeyDerivation,
+) -> int:
+    header = _new_header(kdf)
+    encryptor = _native_cipher(password, salt, kdf, nonce=header[-12:]).encryptor()
+    encryptor.authenticate_additional_data(header)
+    written = target.write(header)
+    for chunk in chunks:
+        written += target.write(encryptor.update(chunk))
+    written += target.write(encryptor.finalize())
+    return written + target.write(encryptor.tag)
+
+
+def _decrypt_chunks(
+    source: BinaryIO,
+    password: bytes,
+    salt: bytes,
+    chunk_size: int,
+) -> Iterator[bytes]:
+    head = source.read(_HEADER.size)
+    header = _parse_header(head)
+    chunks: Iterator[bytes]
+    unpadder: PaddingContext | None = None
+    if header is None:
+        chunks = chain([head], _read_chunks(source, chunk_size))
+        key = _generate_key(password=password, salt=salt)
+        decryptor = _cipher(key=key, salt=salt).decryptor()
+        unpadder = PKCS7(128).unpadder()
+    else:
+        chunks = _read_chunks(source, chunk_size)
+        kdf, nonce = header
+        decryptor = _native_cipher(password, salt, kdf, nonce=nonce).decryptor()
+        decryptor.authenticate_additional_data(head)
+    tag = bytearray()
+    for chunk in _hold_tag(chunks, tag):
+        plain = decryptor.update(chunk)
+        yield plain if unpadder is None else unpadder.update(plain)
+    try:
+        plain = decryptor.finalize_with_tag(bytes(tag))
+    except (InvalidTag, ValueError) as exc:
+        msg = "Decryption failed"
+        raise ValueError(msg) from exc
+    if unpadder is None:
+        yield plain
+    else:
+        yield unpadder.update(plain) + unpadder.finalize()
+
+
+def _sized(chunks: Iterable[bytes], size: int) -> Iterator[bytes]:
+    received = 0
+    for chunk in chunks:
+        received += len(chunk)
+        yield chunk
+    if received != size:
+        msg = "Encrypted payload size mismatch"
+        raise ValueError(msg)
+
+
+def _write_verified(chunks: Iterable[bytes], target: BinaryIO) -> int:
+    if not target.seekable():
+        msg = "Decryption target must be seekable to discard unauthenticated plaintext"
+        raise ValueError(msg)
+    start = target.tell()
+    written = 0
+    try:
+        for chunk in chunks:
+            written += target.write(chunk)
+    except BaseException:
+        target.seek(start)
+        target.truncate()
+        raise
+    return written
+
+
+def encrypt_stream(  # noqa: PLR0913
+    source: BinaryIO,
+    target: BinaryIO,
+    password: bytes | str,
+    salt: bytes | str = DEFAULT_SALT,
+    *,
+    kdf: KeyDerivation = "pbkdf2",
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    chunks = _read_chunks(source, chunk_size)
+    return _encrypt_chunks(chunks, target, _to_bytes(password), _to_bytes(salt), kdf)
+
+
+def decrypt_stream(
+    source: BinaryIO,
+    target: BinaryIO,
+    password: bytes | str,
+    salt: bytes | str = DEFAULT_SALT,
+    *,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    chunks = _decrypt_chunks(source, _to_bytes(password), _to_bytes(salt), chunk_size)
+    return _write_verified(chunks, target)
+
+
+def _unpack_name(chunks: Iterable[bytes]) -> tuple[str, int, Iterator[bytes]]:
+    iterator = iter(chunks)
+    head = b""
+    for chunk in iterator:
+        head += chunk
+        if len(head) < _LENGTH.size:
+            continue
+        (name_size,) = _LENGTH.unpack_from(head)
+        data_offset = _LENGTH.size + name_size + _LENGTH.size
+        if len(head) < data_offset:
+            continue
+        name = head[_LENGTH.size : _LENGTH.size + name_size].decode("utf-8")
+        (data_size,) = _LENGTH.unpack_from(head, data_offset - _LENGTH.size)
+        return name, data_size, chain([head[data_offset:]], iterator)
+    msg = "Encrypted payload is truncated"
+    raise ValueError(msg)
+
+
 def _pack_arrays(*arrays: bytes) -> bytes:
-    packed_data = b""
+    parts: list[bytes] = []
     for arr in arrays:
-        packed_data += struct.pack("!Q", len(arr)) + arr
-    return packed_data
+        parts.extend((struct.pack("!Q", len(arr)), arr))
+    return b"".join(parts)
 
 
 def _unpack_arrays(packed_data: bytes) -> Iterator[bytes]:
-    while packed_data:
-        length = struct.unpack("!Q", packed_data[:8])[0]
-        packed_data = packed_data[8:]
-        yield packed_data[:length]
-        packed_data = packed_data[length:]
+    offset = 0
+    while offset < len(packed_data):
+        (length,) = struct.unpack_from("!Q", packed_data, offset)
+        offset += 8
+        yield packed_data[offset : offset + length]
+        offset += length
 
 
 class SecretState:
@@ -90,15 +380,55 @@ class SecretState:
     def __repr__(self) -> str:
         return f"<SecretState: {len(self.data)} bytes>"
 
+    @staticmethod
+    def pack_stream(  # noqa: PLR0913
+        source: BinaryIO,
+        target: BinaryIO,
+        name: str | StateName,
+        password: bytes | str,
+        salt: bytes | str = DEFAULT_SALT,
+        *,
+        kdf: KeyDerivation = "pbkdf2",
+        chunk_size: int = CHUNK_SIZE,
+    ) -> int:
+        position = source.tell()
+        size = source.seek(0, SEEK_END) - position
+        source.seek(position)
+        encoded_name = str(name).encode("utf-8")
+        prefix = _LENGTH.pack(len(encoded_name)) + encoded_name + _LENGTH.pack(size)
+        chunks = chain([prefix], _read_chunks(source, chunk_size))
+        return _encrypt_chunks(chunks, target, _to_bytes(password), _to_bytes(salt), kdf)
+
+    @staticmethod
+    def unpack_stream(
+        source: BinaryIO,
+        target: BinaryIO,
+        password: bytes | str,
+        salt: bytes | str = DEFAULT_SALT,
+        *,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> StateName:
+        chunks = _decrypt_chunks(source, _to_bytes(password), _to_bytes(salt), chunk_size)
+        name, size, data = _unpack_name(chunks)
+        _write_verified(_sized(data, size), target)
+        return StateName(name)
+
     @classmethod
-    def pack(cls, state: State, password: bytes | str, salt: bytes | str = DEFAULT_SALT) -> Self:
+    def pack(
+        cls,
+        state: State,
+        password: bytes | str,
+        salt: bytes | str = DEFAULT_SALT,
+        *,
+        kdf: KeyDerivation = "legacy",
+    ) -> Self:
         payload = _pack_arrays(str(state.name).encode("utf-8"), state.data)
-        data = encrypt(data=payload, password=_to_bytes(password), salt=_to_bytes(salt))
+        data = encrypt(data=payload, password=_to_bytes(password), salt=_to_bytes(salt), kdf=kdf)
         return cls(data=data)
 
 
 class Enc(State, suffix="enc"):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         data: State | SecretState,
         /,
@@ -106,6 +436,7 @@ class Enc(State, suffix="enc"):
         *,
         password: bytes | str | None = None,
         salt: bytes | str = DEFAULT_SALT,
+        kdf: KeyDerivation = "legacy",
         time: datetime | None = None,
     ) -> None:
         if isinstance(data, SecretState):
@@ -119,7 +450,7 @@ class Enc(State, suffix="enc"):
             msg = "Password is required for encryption."
             raise ValueError(msg)
         super().__init__(
-            SecretState.pack(state=data, password=password, salt=salt).data,
+            SecretState.pack(state=data, password=password, salt=salt, kdf=kdf).data,
             name=name or str(data.name),
             time=time,
         )
@@ -1,10 +1,64 @@
 __all__ = ["Gzip"]
 
 import gzip
+import struct
+import zlib
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
+from typing import Any, BinaryIO, cast
 
-from iokit.state import State
+from iokit.state import State, StateName, Streamable
+
+BLOCK_SIZE = 1 << 24
+
+_WINDOW_SIZE = 1 << 15
+_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00"
+_OS_UNKNOWN = b"\xff"
+
+
+def _extra_flags(compression: int) -> bytes:
+    if compression == zlib.Z_BEST_COMPRESSION:
+        return b"\x02"
+    if compression == zlib.Z_BEST_SPEED:
+        return b"\x04"
+    return b"\x00"
+
+
+def _deflate_block(
+    block: memoryview,
+    dictionary: memoryview,
+    compression: int,
+    *,
+    last: bool,
+) -> bytes:
+    compressor = zlib.compressobj(compression, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary)
+    head = compressor.compress(block)
+    return head + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+def _gzip_parallel(data: memoryview, compression: int, workers: int, block_size: int) -> bytes:
+    size = data.nbytes
+    starts = range(0, size, block_size)
+    parts = [_HEADER, _extra_flags(compression), _OS_UNKNOWN]
+    crc = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _deflate_block,
+                data[start : start + block_size],
+                data[max(start - _WINDOW_SIZE, 0) : start],
+                compression,
+                last=start + block_size >= size,
+            )
+            for start in starts
+        ]
+        for start, future in zip(starts, futures, strict=True):
+            crc = zlib.crc32(data[start : start + block_size], crc)
+            parts.append(future.result())
+    parts.append(struct.pack("<II", crc, size & 0xFFFFFFFF))
+    return b"".join(parts)
 
 
 class Gzip(State, suffix="gz"):
@@ -15,13 +69,35 @@ class Gzip(State, suffix="gz"):
         *,
         compression: int = 1,
         time: datetime | None = None,
+        workers: int | None = None,
+        block_size: int = BLOCK_SIZE,
     ) -> None:
+        if workers is not None and data.size > block_size:
+            memory = data.memory.cast("B")
+            compressed = _gzip_parallel(memory, compression, workers, block_size)
+            super().__init__(compressed, name=data.name, time=time)
+            return
         with BytesIO() as buffer:
             gzip_file = gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=compression, mtime=0)
             with gzip_file as gzip_buffer:
                 gzip_buffer.write(data.data)
             super().__init__(buffer.getvalue(), name=data.name, time=time)
 
+    @property
+    def inner_name(self) -> StateName:
+        return StateName(str(self.name).removesuffix(".gz"))
+
+    def open(self) -> BinaryIO:
+        return cast("BinaryIO", gzip.GzipFile(fileobj=self.buffer, mode="rb"))
+
+    def iter(self, **options: Any) -> Iterator[Any]:  # noqa: ANN401
+        klass = type(State(b"", name=self.inner_name).cast())
+        if not issubclass(klass, Streamable):
+            msg = f"State '{klass.__name__}' does not support streaming"
+            raise NotImplementedError(msg)
+        with self.open() as stream:
+            yield from klass.iter_stream(stream, **options)
+
     def load(self) -> State:
-        with gzip.GzipFile(fileobj=self.buffer, mode="rb") as file:
-            return State(file.read(), name=str(self.name).removesuffix(".gz")).cast()
+        with self.open() as file:
+            return State(file.read(), name=self.inner_name).cast()
@@ -1,13 +1,22 @@
-__all__ = ["Json"]
+__all__ = ["Json", "JsonEngine", "json_decoder", "json_encoder"]
 
 import json
+import math
 from collections.abc import Callable
 from datetime import datetime
 from functools import lru_cache
-from typing import Any
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any, Literal
+
+from typing_extensions import Buffer
 
 from iokit.state import State, StateName
 
+JsonEngine = Literal["auto", "orjson", "ujson", "stdlib"]
+
+_FAST_ENGINES: tuple[JsonEngine, ...] = ("orjson", "ujson")
+
 
 @lru_cache
 def json_dumps(
@@ -26,6 +35,131 @@ def json_dumps(
     ).encode
 
 
+@lru_cache
+def _installed(engine: JsonEngine) -> bool:
+    return engine == "stdlib" or find_spec(engine) is not None
+
+
+def _supports(engine: JsonEngine, *, compact: bool, ensure_ascii: bool) -> bool:
+    match engine:
+        case "orjson":
+            return compact and not ensure_ascii
+        case "ujson":
+            return compact
+        case _:
+            return True
+
+
+def _module(engine: JsonEngine) -> Any:  # noqa: ANN401
+    if not _installed(engine):
+        msg = f"JSON engine '{engine}' is not installed"
+        raise ModuleNotFoundError(msg)
+    return import_module(engine)
+
+
+def _resolve_encoder(engine: JsonEngine, *, compact: bool, ensure_ascii: bool) -> JsonEngine:
+    # fast encoders differ from the stdlib in float formatting and supported types
+    if engine == "auto":
+        return "stdlib"
+    if engine not in ("stdlib", *_FAST_ENGINES):
+        msg = f"Unknown JSON engine '{engine}'"
+        raise ValueError(msg)
+    if not _supports(engine, compact=compact, ensure_ascii=ensure_ascii):
+        msg = f"JSON engine '{engine}' does not support {compact=} with {ensure_ascii=}"
+        raise ValueError(msg)
+    return engine
+
+
+def _has_non_finite(data: Any) -> bool:  # noqa: ANN401
+    match data:
+        case float():
+            return not math.isfinite(data)
+        case dict():
+            return any(_has_non_finite(k) or _has_non_finite(v) for k, v in data.items())
+        case list() | tuple():
+            return any(_has_non_finite(item) for item in data)
+        case _:
+            return False
+
+
+@lru_cache
+def json_encoder(
+    *,
+    compact: bool,
+    ensure_ascii: bool,
+    allow_nan: bool,
+    engine: JsonEngine = "auto",
+) -> Callable[[Any], bytes]:
+    dumps = json_dumps(compact=compact, ensure_ascii=ensure_ascii, allow_nan=allow_nan)
+
+    def stdlib_encode(data: Any) -> bytes:  # noqa: ANN401
+        return dumps(data).encode("utf-8")
+
+    match _resolve_encoder(engine, compact=compact, ensure_ascii=ensure_ascii):
+        case "orjson":
+            orjson = _module("orjson")
+            option = orjson.OPT_NON_STR_KEYS
+
+            def orjson_encode(data: Any) -> bytes:  # noqa: ANN401
+                # orjson silently writes NaN and Infinity as null
+                if _has_non_finite(data):
+                    return stdlib_encode(data)
+                try:
+                    encoded: bytes = orjson.dumps(data, option=option)
+                except TypeError:
+                    return stdlib_encode(data)
+                return encoded
+
+            return orjson_encode
+        case "ujson":
+            ujson = _module("ujson")
+
+            def ujson_encode(data: Any) -> bytes:  # noqa: ANN401
+                try:
+                    encoded: str = ujson.dumps(
+                        data,
+                        ensure_ascii=ensure_ascii,
+                        escape_forward_slashes=False,
+                        allow_nan=allow_nan,
+                    )
+                except (TypeError, OverflowError, ValueError):
+                    return stdlib_encode(data)
+                return encoded.encode("utf-8")
+
+            return ujson_encode
+        case _:
+            return stdlib_encode
+
+
+def _stdlib_loads(data: Buffer | str) -> Any:  # noqa: ANN401
+    if isinstance(data, str | bytes | bytearray):
+        return json.loads(data)
+    return json.loads(bytes(data))
+
+
+@lru_cache
+def json_decoder(engine: JsonEngine = "auto") -> Callable[[Buffer | str], Any]:
+    if engine == "auto":
+        engine = next((e for e in _FAST_ENGINES if _installed(e)), "stdlib")
+    match engine:
+        case "orjson" | "ujson":
+            loads = _module(engine).loads
+            binary = engine == "orjson"
+
+            def decode(data: Buffer | str) -> Any:  # noqa: ANN401
+                try:
+                    return loads(data if binary or isinstance(data, str) else bytes(data))
+                except ValueError:
+                    return _stdlib_loads(data)
+
+            return decode
+        case "stdlib":
+            return _stdlib_loads
+        case other:
+            msg = f"Unknown JSON engine '{other}'"
+            raise ValueError(msg)
+
+
 class Json(State, suffix="json"):
     def __init__(  # noqa: PLR0913
         self,
@@ -36,10 +170,16 @@ class Json(State, suffix="json"):
         compact: bool = False,
         ensure_ascii: bool = False,
         allow_nan: bool = False,
+        engine: JsonEngine = "auto",
         time: datetime | None = None,
     ) -> None:
-        dumps = json_dumps(compact=compact, ensure_ascii=ensure_ascii, allow_nan=allow_nan)
-        super().__init__(dumps(data).encode("utf-8"), name=name, time=time)
+        encode = json_encoder(
+            compact=compact,
+            ensure_ascii=ensure_ascii,
+            allow_nan=allow_nan,
+            engine=engine,
+        )
+        super().__init__(encode(data), name=name, time=time)
 
-    def load(self) -> object:
-        return json.load(self.buffer)
+    def load(self, *, engine: JsonEngine = "auto") -> object:
+        return json_decoder(engine)(self.memory)
@@ -1,18 +1,58 @@
-__all__ = ["Jsonl"]
+__all__ = ["Jsonl", "JsonlWriter"]
 
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from io import BytesIO
-from typing import Any
+from itertools import islice
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO
 
 from jsonlines import Reader, Writer
+from typing_extensions import Self
 
-from iokit.state import State, StateName
+from iokit.state import State, StateName, Streamable
 
-from .json import json_dumps
+from .json import JsonEngine, json_decoder, json_encoder
 
+CHUNK_SIZE = 1 << 24
 
-class Jsonl(State, suffix="jsonl"):
+_NEWLINE_WINDOW = 1 << 16
+
+
+def _parse_chunk(chunk: bytes, engine: JsonEngine) -> list[Any]:
+    with Reader(BytesIO(chunk), loads=json_decoder(engine)) as reader:
+        return list(reader)
+
+
+def _line_end(memory: memoryview, position: int) -> int:
+    while position < len(memory):
+        window = memory[position : position + _NEWLINE_WINDOW].tobytes()
+        newline = window.find(b"\n")
+        if newline >= 0:
+            return position + newline + 1
+        position += len(window)
+    return len(memory)
+
+
+def _split_chunks(memory: memoryview, chunk_size: int) -> Iterator[bytes]:
+    start = 0
+    while start < len(memory):
+        stop = _line_end(memory, min(start + chunk_size, len(memory)) - 1)
+        yield memory[start:stop].tobytes()
+        start = stop
+
+
+def _batched(records: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class Jsonl(State, Streamable, suffix="jsonl"):
     def __init__(  # noqa: PLR0913
         self,
         data: Iterable[dict[str, Any]],
@@ -22,15 +62,142 @@ class Jsonl(State, suffix="jsonl"):
         compact: bool = True,
         ensure_ascii: bool = False,
         allow_nan: bool = False,
+        engine: JsonEngine = "auto",
         time: datetime | None = None,
     ) -> None:
         with BytesIO() as buffer:
-            dumps = json_dumps(compact=compact, ensure_ascii=ensure_ascii, allow_nan=allow_nan)
-            with Writer(buffer, compact=compact, sort_keys=False, dumps=dumps) as writer:
-                for item in data:
-                    writer.write(item)
+            with JsonlWriter(
+                buffer,
+                compact=compact,
+                ensure_ascii=ensure_ascii,
+                allow_nan=allow_nan,
+                engine=engine,
+            ) as writer:
+                writer.write_all(data)
             super().__init__(buffer.getvalue(), name=name, time=time)
 
-    def load(self) -> list[Any]:
-        with Reader(self.buffer) as reader:
-            return list(reader)
+    def _parallel(self, workers: int, chunk_size: int, engine: JsonEngine) -> Iterator[Any]:
+        chunks = _split_chunks(self.memory, chunk_size)
+        parse = partial(_parse_chunk, engine=engine)
+        executor = ProcessPoolExecutor(max_workers=workers)
+        pending: deque[Future[list[Any]]] = deque()
+        try:
+            for chunk in islice(chunks, workers * 2):
+                pending.append(executor.submit(parse, chunk))
+            while pending:
+                records = pending.popleft().result()
+                for chunk in islice(chunks, 1):
+                    pending.append(executor.submit(parse, chunk))
+                yield from records
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def iter(  # noqa: PLR0913
+        self,
+        *,
+        skip: int = 0,
+        limit: int | None = None,
+        workers: int | None = None,
+        chunk_size: int = CHUNK_SIZE,
+        engine: JsonEngine = "auto",
+    ) -> Iterator[Any]:
+        if chunk_size <= 0:
+            msg = f"Chunk size must be positive, got {chunk_size}"
+            raise ValueError(msg)
+        return self._records(skip, limit, workers, chunk_size, engine)
+
+    def _records(  # noqa: PLR0913
+        self,
+        skip: int,
+        limit: int | None,
+        workers: int | None,
+        chunk_size: int,
+        engine: JsonEngine,
+    ) -> Iterator[Any]:
+        stop = None if limit is None else skip + limit
+        if workers is not None:
+            yield from islice(self._parallel(workers, chunk_size, engine), skip, stop)
+            return
+        yield from islice(self.iter_stream(self.buffer, engine=engine), skip, stop)
+
+    @classmethod
+    def iter_stream(
+        cls,
+        stream: BinaryIO,
+        /,
+        *,
+        engine: JsonEngine = "auto",
+        **options: Any,  # noqa: ANN401
+    ) -> Iterator[Any]:
+        with Reader(stream, loads=json_decoder(engine), **options) as reader:
+            yield from reader
+
+    def iter_batches(  # noqa: PLR0913
+        self,
+        size: int,
+        *,
+        skip: int = 0,
+        limit: int | None = None,
+        workers: int | None = None,
+        chunk_size: int = CHUNK_SIZE,
+        engine: JsonEngine = "auto",
+    ) -> Iterator[list[Any]]:
+        if size <= 0:
+            msg = f"Batch size must be positive, got {size}"
+            raise ValueError(msg)
+        records = self.iter(
+            skip=skip,
+            limit=limit,
+            workers=workers,
+            chunk_size=chunk_size,
+            engine=engine,
+        )
+        return _batched(records, size)
+
+    def load(self, *, engine: JsonEngine = "auto") -> list[Any]:
+        return list(self.iter(engine=engine))
+
+
+class JsonlWriter:
+    def __init__(  # noqa: PLR0913
+        self,
+        target: Path | str | BinaryIO,
+        /,
+        *,
+        compact: bool = True,
+        ensure_ascii: bool = False,
+        allow_nan: bool = False,
+        engine: JsonEngine = "auto",
+    ) -> None:
+        self._file: BinaryIO | None = None
+        if isinstance(target, Path | str):
+            target = self._file = Path(target).open("ab")  # noqa: SIM115
+        dumps = json_encoder(
+            compact=compact,
+            ensure_ascii=ensure_ascii,
+            allow_nan=allow_nan,
+            engine=engine,
+        )
+        self._writer = Writer(target, compact=compact, sort_keys=False, dumps=dumps)
+
+    def write(self, record: object) -> None:
+        self._writer.write(record)
+
+    def write_all(self, records: Iterable[object]) -> None:
+        self._writer.write_all(records)
+
+    def close(self) -> None:
+        self._writer.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
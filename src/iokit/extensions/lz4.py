@@ -0,0 +1,32 @@
+__all__ = ["Lz4"]
+
+from datetime import datetime
+from importlib import import_module
+from typing import Any
+
+from iokit.state import State
+
+
+def _lz4() -> Any:  # noqa: ANN401
+    try:
+        return import_module("lz4.frame")
+    except ModuleNotFoundError as exc:
+        msg = "Lz4 requires the 'lz4' package, install it with 'pip install iokit[lz4]'"
+        raise ModuleNotFoundError(msg) from exc
+
+
+class Lz4(State, suffix="lz4"):
+    def __init__(
+        self,
+        data: State,
+        /,
+        *,
+        compression: int = 0,
+        time: datetime | None = None,
+    ) -> None:
+        compressed = _lz4().compress(data.memory, compression_level=compression)
+        super().__init__(compressed, name=data.name, time=time)
+
+    def load(self) -> State:
+        data = _lz4().decompress(self.memory)
+        return State(data, name=str(self.name).removesuffix(".lz4")).cast()
@@ -1,14 +1,19 @@
 __all__ = ["Npy"]
 
 from datetime import datetime
+from functools import cached_property
 from io import BytesIO
+from operator import index as as_index
 from typing import Any
 
 import numpy as np
+from numpy.lib import format as npy_format
 from numpy.typing import NDArray
 
 from iokit.state import State, StateName
 
+NpyHeader = tuple[tuple[int, ...], bool, np.dtype[Any], int]
+
 
 class Npy(State, suffix="npy"):
     def __init__(
@@ -23,5 +28,65 @@ class Npy(State, suffix="npy"):
             np.save(buffer, data, allow_pickle=False)
             super().__init__(buffer.getvalue(), name=name, time=time)
 
-    def load(self) -> NDArray[Any]:
+    @cached_property
+    def _header(self) -> NpyHeader:
+        buffer = self.buffer
+        match npy_format.read_magic(buffer):
+            case (1, 0):
+                shape, fortran_order, dtype = npy_format.read_array_header_1_0(buffer)
+            case (2, 0):
+                shape, fortran_order, dtype = npy_format.read_array_header_2_0(buffer)
+            case version:
+                msg = f"Unsupported npy format version {version}"
+                raise ValueError(msg)
+        return shape, fortran_order, dtype, buffer.tell()
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._header[0]
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        return self._header[2]
+
+    def _frombuffer(self, count: int, offset: int) -> NDArray[Any]:
+        if self.dtype.hasobject:
+            msg = "Object arrays cannot be loaded without copying"
+            raise ValueError(msg)
+        return np.frombuffer(self.memory, dtype=self.dtype, count=count, offset=offset)
+
+    def _view(self) -> NDArray[Any]:
+        shape, fortran_order, _, offset = self._header
+        array = self._frombuffer(int(np.prod(shape)), offset)
+        if fortran_order:
+            return array.reshape(shape[::-1]).transpose()
+        return array.reshape(shape)
+
+    def rows(self, key: int | slice, /, *, copy: bool = True) -> NDArray[Any]:
+        shape, fortran_order, dtype, offset = self._header
+        if not shape:
+            msg = "Cannot slice rows of a 0-dimensional array"
+            raise IndexError(msg)
+        if fortran_order:
+            array: NDArray[Any] = self._view()[key]
+            return array.copy() if copy else array
+        if isinstance(key, slice):
+            span = range(*key.indices(shape[0]))
+        else:
+            row = as_index(key)
+            if not -shape[0] <= row < shape[0]:
+                msg = f"Row {row} is out of bounds for axis 0 with size {shape[0]}"
+                raise IndexError(msg)
+            span = range(row % shape[0], row % shape[0] + 1)
+        low, high = (min(span[0], span[-1]), max(span[0], span[-1]) + 1) if span else (0, 0)
+        items = int(np.prod(shape[1:]))
+        array = self._frombuffer((high - low) * items, offset + low * items * dtype.itemsize)
+        array = array.reshape(high - low, *shape[1:])[:: span.step]
+        if not isinstance(key, slice):
+            array = array.reshape(shape[1:])
+        return array.copy() if copy else array
+
+    def load(self, *, copy: bool = True) -> NDArray[Any]:
+        if not copy:
+            return self._view()
         return np.load(self.buffer, allow_pickle=False)
@@ -1,14 +1,29 @@
 __all__ = ["Csv", "Tsv"]
 
+from collections.abc import Iterator
 from datetime import datetime
 from io import BytesIO
+from typing import Any, BinaryIO
 
 from pandas import DataFrame, read_csv
 
-from iokit.state import State, StateName
+from iokit.state import State, StateName, Streamable
 
+CHUNK_SIZE = 100_000
 
-class Csv(State, suffix="csv"):
+
+def _read_chunks(
+    stream: BinaryIO,
+    *,
+    sep: str,
+    chunksize: int,
+    **options: Any,  # noqa: ANN401
+) -> Iterator[DataFrame]:
+    with read_csv(stream, sep=sep, chunksize=chunksize, **options) as reader:
+        yield from reader
+
+
+class Csv(State, Streamable, suffix="csv"):
     def __init__(
         self,
         data: DataFrame,
@@ -25,8 +40,22 @@ class Csv(State, suffix="csv"):
     def load(self) -> DataFrame:
         return read_csv(self.buffer)
 
+    def iter(self, *, chunksize: int = CHUNK_SIZE) -> Iterator[DataFrame]:
+        return self.iter_stream(self.buffer, chunksize=chunksize)
+
+    @classmethod
+    def iter_stream(
+        cls,
+        stream: BinaryIO,
+        /,
+        *,
+        chunksize: int = CHUNK_SIZE,
+        **options: Any,  # noqa: ANN401
+    ) -> Iterator[DataFrame]:
+        return _read_chunks(stream, sep=",", chunksize=chunksize, **options)
 
-class Tsv(State, suffix="tsv"):
+
+class Tsv(State, Streamable, suffix="tsv"):
     def __init__(
         self,
         data: DataFrame,
@@ -42,3 +71,17 @@ class Tsv(State, suffix="tsv"):
 
     def load(self) -> DataFrame:
         return read_csv(self.buffer, sep="\t")
+
+    def iter(self, *, chunksize: int = CHUNK_SIZE) -> Iterator[DataFrame]:
+        return self.iter_stream(self.buffer, chunksize=chunksize)
+
+    @classmethod
+    def iter_stream(
+        cls,
+        stream: BinaryIO,
+        /,
+        *,
+        chunksize: int = CHUNK_SIZE,
+        **options: Any,  # noqa: ANN401
+    ) -> Iterator[DataFrame]:
+        return _read_chunks(stream, sep="\t", chunksize=chunksize, **options)
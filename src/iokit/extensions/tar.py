@@ -1,13 +1,20 @@
-__all__ = ["Tar"]
+__all__ = ["Tar", "TarArchive", "TarWriter"]
 
 import tarfile
 from collections.abc import Iterable, Iterator
 from datetime import datetime
 from io import BytesIO
+from pathlib import Path
+from types import TracebackType
+from typing import IO, BinaryIO, Literal
+
+from typing_extensions import Self
 
 from iokit.state import State, StateName
 from iokit.tools.time import fromtimestamp
 
+from .archive import Archive
+
 
 class Tar(State, suffix="tar"):
     def __init__(
@@ -19,25 +26,110 @@ class Tar(State, suffix="tar"):
         time: datetime | None = None,
     ) -> None:
         with BytesIO() as buffer:
-            with tarfile.open(fileobj=buffer, mode="w") as tar_buffer:
+            with TarWriter(buffer) as writer:
                 for state in data:
-                    file_data = tarfile.TarInfo(name=str(state.name))
-                    file_data.size = state.size
-                    file_data.mtime = int(state.time.timestamp())
-                    tar_buffer.addfile(fileobj=state.buffer, tarinfo=file_data)
-
+                    writer.write(state)
             super().__init__(buffer.getvalue(), name=name, time=time)
 
+    def open(self) -> "TarArchive":
+        return TarArchive(self)
+
     def load(self) -> Iterator[State]:
-        with tarfile.open(fileobj=self.buffer, mode="r") as tar_buffer:
-            for member in tar_buffer.getmembers():
-                if not member.isfile():
-                    continue
-                member_buffer = tar_buffer.extractfile(member)
-                if member_buffer is None:
-                    continue
-                yield State(
-                    member_buffer.read(),
-                    name=member.name,
-                    time=fromtimestamp(member.mtime),
-                )
+        with self.open() as archive:
+            yield from archive
+
+
+class TarArchive(Archive):
+    def __init__(self, source: State | Path | str | BinaryIO, /) -> None:
+        self._memory: memoryview | None = None
+        if isinstance(source, State):
+            self._memory = source.memory
+            source = source.buffer
+        if isinstance(source, Path | str):
+            self._tar = tarfile.open(name=source, mode="r")  # noqa: SIM115
+        else:
+            self._tar = tarfile.open(fileobj=source, mode="r")  # noqa: SIM115
+            if self._tar.fileobj is not source:
+                self._memory = None
+        self._members = {
+            member.name: member for member in self._tar.getmembers() if member.isfile()
+        }
+
+    def names(self) -> list[str]:
+        return list(self._members)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._members
+
+    def _member(self, name: str) -> tarfile.TarInfo:
+        try:
+            return self._members[name]
+        except KeyError:
+            raise self._missing(name) from None
+
+    def open(self, name: str) -> IO[bytes]:
+        stream = self._tar.extractfile(self._member(name))
+        if stream is None:
+            raise self._missing(name)
+        return stream
+
+    def time(self, name: str) -> datetime:
+        return fromtimestamp(self._member(name).mtime)
+
+    def _read(self, name: str) -> bytes | memoryview:
+        member = self._member(name)
+        if self._memory is None or member.issparse():
+            return super()._read(name)
+        return self._memory[member.offset_data : member.offset_data + member.size]
+
+    def close(self) -> None:
+        self._tar.close()
+
+
+TarCompression = Literal["gz", "bz2", "xz"]
+
+
+class TarWriter:
+    def __init__(
+        self,
+        target: Path | str | BinaryIO,
+        /,
+        *,
+        compression: TarCompression | None = None,
+        compresslevel: int | None = None,
+    ) -> None:
+        mode = f"w:{compression or ''}"
+        options: dict[str, int] = {}
+        if compresslevel is not None:
+            if compression is None:
+                msg = "Compression level requires a tar compression"
+                raise ValueError(msg)
+            options["preset" if compression == "xz" else "compresslevel"] = compresslevel
+        if isinstance(target, Path | str):
+            self._tar = tarfile.open(name=target, mode=mode, **options)  # type: ignore[call-overload]  # noqa: SIM115
+        else:
+            self._tar = tarfile.open(fileobj=target, mode=mode, **options)  # type: ignore[call-overload]  # noqa: SIM115
+
+    def write(self, state: State) -> None:
+        info = tarfile.TarInfo(name=str(state.name))
+        info.size = state.size
+        info.mtime = int(state.time.timestamp())
+        self._tar.addfile(fileobj=state.buffer, tarinfo=info)
+
+    def write_file(self, path: Path | str, name: str | StateName | None = None) -> None:
+        path = Path(path)
+        self._tar.add(path, arcname=str(name or path.name), recursive=False)
+
+    def close(self) -> None:
+        self._tar.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
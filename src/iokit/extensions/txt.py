@@ -1,12 +1,15 @@
 __all__ = ["Txt"]
 
 
+from collections.abc import Iterator
 from datetime import datetime
+from io import TextIOWrapper
+from typing import Any, BinaryIO
 
-from iokit.state import State, StateName
+from iokit.state import State, StateName, Streamable
 
 
-class Txt(State, suffix="txt"):
+class Txt(State, Streamable, suffix="txt"):
     def __init__(
         self,
         data: str,
@@ -19,3 +22,22 @@ class Txt(State, suffix="txt"):
 
     def load(self) -> str:
         return self.data.decode("utf-8")
+
+    def iter(self) -> Iterator[str]:
+        return self.iter_stream(self.buffer)
+
+    @classmethod
+    def iter_stream(
+        cls,
+        stream: BinaryIO,
+        /,
+        *,
+        encoding: str = "utf-8",
+        **options: Any,  # noqa: ANN401
+    ) -> Iterator[str]:
+        text = TextIOWrapper(stream, encoding=encoding, **options)
+        try:
+            for line in text:
+                yield line.removesuffix("\n")
+        finally:
+            text.detach()
@@ -0,0 +1,23 @@
+__all__ = ["Xz"]
+
+import lzma
+from datetime import datetime
+
+from iokit.state import State
+
+
+class Xz(State, suffix="xz"):
+    def __init__(
+        self,
+        data: State,
+        /,
+        *,
+        compression: int = 6,
+        time: datetime | None = None,
+    ) -> None:
+        compressed = lzma.compress(data.memory, format=lzma.FORMAT_XZ, preset=compression)
+        super().__init__(compressed, name=data.name, time=time)
+
+    def load(self) -> State:
+        data = lzma.decompress(self.memory, format=lzma.FORMAT_XZ)
+        return State(data, name=str(self.name).removesuffix(".xz")).cast()
@@ -1,13 +1,22 @@
-__all__ = ["Zip"]
+__all__ = ["Zip", "ZipArchive", "ZipWriter"]
 
+import shutil
+import zipfile
 from collections.abc import Iterable, Iterator
 from contextlib import suppress
 from datetime import datetime
 from io import BytesIO
-from zipfile import ZipFile
+from pathlib import Path
+from types import TracebackType
+from typing import IO, BinaryIO, Literal
+from zipfile import ZipFile, ZipInfo
+
+from typing_extensions import Self
 
 from iokit.state import State, StateName
 
+from .archive import Archive
+
 
 class Zip(State, suffix="zip"):
     def __init__(
@@ -19,19 +28,117 @@ class Zip(State, suffix="zip"):
         time: datetime | None = None,
     ) -> None:
         with BytesIO() as buffer:
-            with ZipFile(buffer, mode="w") as archive:
+            with ZipWriter(buffer) as writer:
                 for state in data:
-                    archive.writestr(str(state.name), data=state.data)
+                    writer.write(state)
             super().__init__(buffer.getvalue(), name=name, time=time)
 
+    def open(self) -> "ZipArchive":
+        return ZipArchive(self)
+
     def load(self) -> Iterator[State]:
-        with ZipFile(self.buffer, mode="r") as archive:
-            for file in archive.namelist():
-                info = archive.getinfo(file)
-                if info.is_dir():
-                    continue
-                time: datetime | None = None
-                with suppress(ValueError):
-                    time = datetime(*info.date_time)
-                with archive.open(file) as member_buffer:
-                    yield State(member_buffer.read(), name=file, time=time).cast()
+        with self.open() as archive:
+            yield from archive
+
+
+class ZipArchive(Archive):
+    def __init__(self, source: State | Path | str | BinaryIO, /) -> None:
+        if isinstance(source, State):
+            source = source.buffer
+        self._zip = ZipFile(source, mode="r")
+        self._members = {info.filename: info for info in self._zip.infolist() if not info.is_dir()}
+
+    def names(self) -> list[str]:
+        return list(self._members)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._members
+
+    def _member(self, name: str) -> ZipInfo:
+        try:
+            return self._members[name]
+        except KeyError:
+            raise self._missing(name) from None
+
+    def open(self, name: str) -> IO[bytes]:
+        return self._zip.open(self._member(name))
+
+    def time(self, name: str) -> datetime | None:
+        with suppress(ValueError):
+            return datetime(*self._member(name).date_time)
+        return None
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+ZipCompression = Literal["stored", "deflated", "bzip2", "lzma", "zstd"]
+
+_CHUNK_SIZE = 1 << 20
+
+
+def _compression_method(compression: ZipCompression) -> int:
+    match compression:
+        case "stored":
+            return zipfile.ZIP_STORED
+        case "deflated":
+            return zipfile.ZIP_DEFLATED
+        case "bzip2":
+            return zipfile.ZIP_BZIP2
+        case "lzma":
+            return zipfile.ZIP_LZMA
+        case "zstd":
+            method: int | None = getattr(zipfile, "ZIP_ZSTANDARD", None)
+            if method is None:
+                msg = "Zip compression 'zstd' requires Python 3.14 or newer"
+                raise ValueError(msg)
+            return method
+        case other:
+            msg = f"Unknown zip compression '{other}'"
+            raise ValueError(msg)
+
+
+class ZipWriter:
+    def __init__(
+        self,
+        target: Path | str | BinaryIO,
+        /,
+        *,
+        compression: ZipCompression = "stored",
+        compresslevel: int | None = None,
+    ) -> None:
+        self._zip = ZipFile(
+            target,
+            mode="w",
+            compression=_compression_method(compression),
+            compresslevel=compresslevel,
+        )
+
+    def write(self, state: State) -> None:
+        force_zip64 = state.size > zipfile.ZIP64_LIMIT
+        with self._zip.open(str(state.name), mode="w", force_zip64=force_zip64) as member:
+            member.write(state.memory)
+
+    def write_file(self, path: Path | str, name: str | StateName | None = None) -> None:
+        path = Path(path)
+        force_zip64 = path.stat().st_size > zipfile.ZIP64_LIMIT
+        arcname = str(name or path.name)
+        with (
+            path.open("rb") as source,
+            self._zip.open(arcname, mode="w", force_zip64=force_zip64) as member,
+        ):
+            shutil.copyfileobj(source, member, _CHUNK_SIZE)
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
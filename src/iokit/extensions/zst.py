@@ -0,0 +1,34 @@
+__all__ = ["Zst"]
+
+from datetime import datetime
+from importlib import import_module
+from typing import Any
+
+from iokit.state import State
+
+
+def _zstandard() -> Any:  # noqa: ANN401
+    try:
+        return import_module("zstandard")
+    except ModuleNotFoundError as exc:
+        msg = "Zst requires the 'zstandard' package, install it with 'pip install iokit[zstd]'"
+        raise ModuleNotFoundError(msg) from exc
+
+
+class Zst(State, suffix="zst"):
+    def __init__(
+        self,
+        data: State,
+        /,
+        *,
+        compression: int = 3,
+        threads: int = -1,
+        time: datetime | None = None,
+    ) -> None:
+        compressor = _zstandard().ZstdCompressor(level=compression, threads=threads)
+        super().__init__(compressor.compress(data.memory), name=data.name, time=time)
+
+    def load(self) -> State:
+        with _zstandard().ZstdDecompressor().stream_reader(self.buffer) as reader:
+            data = reader.read()
+        return State(data, name=str(self.name).removesuffix(".zst")).cast()
@@ -1,19 +1,22 @@
 __all__ = [
     "State",
+    "Streamable",
     "filter_states",
     "find_state",
 ]
 
+from abc import ABC, abstractmethod
 from collections.abc import Generator, Iterable, Iterator
 from contextlib import suppress
 from datetime import datetime
 from fnmatch import fnmatch
 from io import BytesIO
-from typing import TypeVar, overload
+from typing import Any, BinaryIO, TypeVar, cast, overload
 
 from humanize import naturalsize
 from typing_extensions import Self
 
+from iokit.tools.buffer import MemoryBuffer
 from iokit.tools.time import now
 
 from .checksum import ChecksumMixin
@@ -77,7 +80,7 @@ class State(ChecksumMixin):
 
     def __init__(
         self,
-        data: bytes,
+        data: bytes | memoryview,
         /,
         name: str | StateName = "",
         *,
@@ -134,10 +137,18 @@ class State(ChecksumMixin):
 
     @property
     def data(self) -> bytes:
+        if isinstance(self._data, memoryview):
+            return self._data.tobytes()
         return self._data
 
     @property
-    def buffer(self) -> BytesIO:
+    def memory(self) -> memoryview:
+        return memoryview(self._data).toreadonly()
+
+    @property
+    def buffer(self) -> BinaryIO:
+        if isinstance(self._data, memoryview):
+            return cast("BinaryIO", MemoryBuffer(self._data))
         return BytesIO(self._data)
 
     @property
@@ -168,7 +179,7 @@ class State(ChecksumMixin):
         try:
             klass = self._by_suffix(self.name.suffix)
             state = klass.__new__(klass)
-            state._data = self.data  # noqa: SLF001
+            state._data = self._data  # noqa: SLF001
             state._name = self.name  # noqa: SLF001
             state._time = self.time  # noqa: SLF001
         except ValueError:
@@ -193,6 +204,12 @@ class State(ChecksumMixin):
         return state.load()
 
 
+class Streamable(ABC):
+    @classmethod
+    @abstractmethod
+    def iter_stream(cls, stream: BinaryIO, /, **options: Any) -> Iterator[Any]: ...  # noqa: ANN401
+
+
 def _sub_extensions(kls: type[State]) -> Iterator[str]:
     for k in kls.__subclasses__():
         if suffix := k.suffix():
@@ -1,12 +1,35 @@
 __all__ = [
+    "AsyncLocalStorage",
+    "AsyncMemoryStorage",
+    "AsyncStorage",
+    "AsyncStorageAdapter",
+    "CacheStats",
+    "CachedStorage",
+    "Downloader",
+    "PackStorage",
+    "PipelineStats",
     "ReadOnlyStorage",
+    "RecordInfo",
+    "SqliteStorage",
     "Storage",
+    "TieredStorage",
+    "checksum_tree",
     "download_file",
     "load_file",
+    "migrate_layout",
     "save_file",
     "save_temp",
+    "verify_tree",
 ]
 
-from .local import load_file, save_file, save_temp
+from .aio import AsyncLocalStorage, AsyncMemoryStorage, AsyncStorage, AsyncStorageAdapter
+from .cache import CachedStorage, CacheStats
+from .index import RecordInfo
+from .layout import migrate_layout
+from .local import PipelineStats, load_file, save_file, save_temp
+from .manifest import checksum_tree, verify_tree
+from .pack import PackStorage
+from .sqlite import SqliteStorage
 from .storage import ReadOnlyStorage, Storage
-from .web import download_file
+from .tiered import TieredStorage
+from .web import Downloader, download_file
@@ -0,0 +1,168 @@
+__all__ = [
+    "AsyncLocalStorage",
+    "AsyncMemoryStorage",
+    "AsyncStorage",
+    "AsyncStorageAdapter",
+]
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from types import TracebackType
+from typing import Generic, TypeVar
+
+from typing_extensions import Self
+
+from .local import FsyncMode, LocalStorage, MemoryStorage
+from .storage import Storage
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY = 16
+
+
+class AsyncStorage(ABC, Generic[T]):
+    def __init__(self, *, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        if concurrency <= 0:
+            msg = f"Concurrency must be positive, got {concurrency}"
+            raise ValueError(msg)
+        self._concurrency = concurrency
+
+    @abstractmethod
+    async def pull(self, uid: str) -> T:
+        msg = "Method 'pull' must be implemented in a subclass"
+        raise NotImplementedError(msg)
+
+    @abstractmethod
+    async def push(self, uid: str, record: T, *, force: bool = False) -> None:
+        msg = "Method 'push' must be implemented in a subclass"
+        raise NotImplementedError(msg)
+
+    @abstractmethod
+    async def remove(self, uid: str) -> None:
+        msg = "Method 'remove' must be implemented in a subclass"
+        raise NotImplementedError(msg)
+
+    @abstractmethod
+    async def exists(self, uid: str) -> bool:
+        msg = "Method 'exists' must be implemented in a subclass"
+        raise NotImplementedError(msg)
+
+    @abstractmethod
+    async def index(self, prefix: str | None = None) -> list[str]:
+        msg = "Method 'index' must be implemented in a subclass"
+        raise NotImplementedError(msg)
+
+    async def _gather(self, calls: Iterable[Callable[[], Awaitable[R]]]) -> list[R]:
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def limited(call: Callable[[], Awaitable[R]]) -> R:
+            async with semaphore:
+                return await call()
+
+        return await asyncio.gather(*(limited(call) for call in calls))
+
+    async def pull_many(self, uids: Iterable[str]) -> list[T]:
+        return await self._gather(partial(self.pull, uid) for uid in uids)
+
+    async def push_many(self, items: Iterable[tuple[str, T]], *, force: bool = False) -> None:
+        await self._gather(partial(self.push, uid, record, force=force) for uid, record in items)
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+
+class AsyncStorageAdapter(AsyncStorage[T]):
+    def __init__(
+        self,
+        storage: Storage[T],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        executor: Executor | None = None,
+    ) -> None:
+        super().__init__(concurrency=concurrency)
+        self._storage = storage
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=concurrency)
+
+    async def _run(self, func: Callable[[], R]) -> R:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+    async def pull(self, uid: str) -> T:
+        return await self._run(partial(self._storage.pull, uid))
+
+    async def push(self, uid: str, record: T, *, force: bool = False) -> None:
+        await self._run(partial(self._storage.push, uid, record, force=force))
+
+    async def remove(self, uid: str) -> None:
+        await self._run(partial(self._storage.remove, uid))
+
+    async def exists(self, uid: str) -> bool:
+        return await self._run(partial(self._storage.exists, uid))
+
+    async def index(self, prefix: str | None = None) -> list[str]:
+        return await self._run(lambda: list(self._storage.index(prefix)))
+
+    async def close(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+
+class AsyncLocalStorage(AsyncStorageAdapter[bytes | memoryview]):
+    def __init__(  # noqa: PLR0913
+        self,
+        root: Path | str,
+        *,
+        mmap: bool = False,
+        workers: int | None = None,
+        fanout: int | None = None,
+        fsync: FsyncMode = "none",
+        indexed: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        executor: Executor | None = None,
+    ) -> None:
+        storage = LocalStorage(
+            root,
+            mmap=mmap,
+            workers=workers,
+            fanout=fanout,
+            fsync=fsync,
+            indexed=indexed,
+        )
+        super().__init__(storage, concurrency=concurrency, executor=executor)
+
+
+class AsyncMemoryStorage(AsyncStorage[bytes | memoryview]):
+    def __init__(self, *, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        super().__init__(concurrency=concurrency)
+        self._storage = MemoryStorage()
+
+    async def pull(self, uid: str) -> bytes:
+        return self._storage.pull(uid)
+
+    async def push(self, uid: str, record: bytes | memoryview, *, force: bool = False) -> None:
+        self._storage.push(uid, record, force=force)
+
+    async def remove(self, uid: str) -> None:
+        self._storage.remove(uid)
+
+    async def exists(self, uid: str) -> bool:
+        return self._storage.exists(uid)
+
+    async def index(self, prefix: str | None = None) -> list[str]:
+        return list(self._storage.index(prefix))
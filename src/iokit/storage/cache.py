@@ -0,0 +1,225 @@
+__all__ = ["CacheStats", "CachedStorage", "SizedLru"]
+
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from threading import Lock
+from time import monotonic
+from typing import Generic, TypeVar
+
+from .storage import Storage
+
+T = TypeVar("T")
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    items: int = 0
+    bytes: int = 0
+
+
+def _sizeof(record: object) -> int:
+    nbytes = getattr(record, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(record, bytes | bytearray | str):
+        return len(record)
+    return sys.getsizeof(record)
+
+
+class SizedLru(Generic[V]):
+    def __init__(self, *, max_bytes: int | None = None, max_items: int | None = None) -> None:
+        self._max_bytes = max_bytes
+        self._max_items = max_items
+        self._entries: OrderedDict[str, tuple[V, int]] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, uid: object) -> bool:
+        return uid in self._entries
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def fits(self, size: int) -> bool:
+        return self._max_bytes is None or size <= self._max_bytes
+
+    def get(self, uid: str) -> V | None:
+        entry = self._entries.get(uid)
+        if entry is None:
+            return None
+        self._entries.move_to_end(uid)
+        return entry[0]
+
+    def put(self, uid: str, value: V, size: int) -> None:
+        self.pop(uid)
+        self._entries[uid] = (value, size)
+        self._bytes += size
+
+    def pop(self, uid: str) -> V | None:
+        entry = self._entries.pop(uid, None)
+        if entry is None:
+            return None
+        self._bytes -= entry[1]
+        return entry[0]
+
+    def overflow(self) -> str | None:
+        if not self._entries:
+            return None
+        over_items = self._max_items is not None and len(self._entries) > self._max_items
+        over_bytes = self._max_bytes is not None and self._bytes > self._max_bytes
+        return next(iter(self._entries)) if over_items or over_bytes else None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+
+@dataclass
+class _Entry(Generic[T]):
+    record: T
+    expires: float | None
+
+
+class CachedStorage(Storage[T]):
+    def __init__(  # noqa: PLR0913
+        self,
+        storage: Storage[T],
+        *,
+        max_bytes: int | None = None,
+        max_items: int | None = None,
+        ttl: float | None = None,
+        sizeof: Callable[[T], int] = _sizeof,
+        copy: bool | Callable[[T], T] = False,
+    ) -> None:
+        super().__init__()
+        self._storage = storage
+        self._ttl = ttl
+        self._sizeof = sizeof
+        self._copy: Callable[[T], T] | None = deepcopy if copy is True else copy or None
+        self._entries: SizedLru[_Entry[T]] = SizedLru(max_bytes=max_bytes, max_items=max_items)
+        self._stats = CacheStats()
+        self._lock = Lock()
+        self._generation = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return replace(self._stats, items=len(self._entries), bytes=self._entries.bytes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _invalidate(self, uids: Iterable[str]) -> None:
+        # records pulled before this point may be stale and must not be cached
+        with self._lock:
+            for uid in uids:
+                self._entries.pop(uid)
+            self._generation += 1
+
+    def _lookup(self, uid: str) -> _Entry[T] | None:
+        entry = self._entries.get(uid)
+        if entry is None:
+            return None
+        if entry.expires is not None and entry.expires <= monotonic():
+            self._entries.pop(uid)
+            return None
+        return entry
+
+    def _store(self, uid: str, record: T) -> None:
+        size = self._sizeof(record)
+        if not self._entries.fits(size):
+            return
+        expires = None if self._ttl is None else monotonic() + self._ttl
+        self._entries.put(uid, _Entry(record, expires), size)
+        while (victim := self._entries.overflow()) is not None:
+            self._entries.pop(victim)
+            self._stats.evictions += 1
+
+    def _detach(self, record: T) -> T:
+        return record if self._copy is None else self._copy(record)
+
+    def pull(self, uid: str) -> T:
+        with self._lock:
+            entry = self._lookup(uid)
+            if entry is not None:
+                self._stats.hits += 1
+                return self._detach(entry.record)
+            self._stats.misses += 1
+            generation = self._generation
+        record = self._storage.pull(uid)
+        with self._lock:
+            if generation == self._generation:
+                self._store(uid, record)
+        return self._detach(record)
+
+    def pull_many(self, uids: Iterable[str]) -> list[T]:
+        uids = list(uids)
+        records: dict[str, T] = {}
+        with self._lock:
+            for uid in uids:
+                entry = self._lookup(uid)
+                if entry is not None:
+                    records[uid] = entry.record
+            missing = list(dict.fromkeys(uid for uid in uids if uid not in records))
+            self._stats.hits += len(uids) - len(missing)
+            self._stats.misses += len(missing)
+            generation = self._generation
+        pulled = self._storage.pull_many(missing)
+        with self._lock:
+            for uid, record in zip(missing, pulled, strict=True):
+                records[uid] = record
+                if generation == self._generation:
+                    self._store(uid, record)
+        return [self._detach(records[uid]) for uid in uids]
+
+    def push(self, uid: str, record: T, *, force: bool = False) -> None:
+        self._invalidate([uid])
+        try:
+            self._storage.push(uid, record, force=force)
+        finally:
+            self._invalidate([uid])
+
+    def push_many(self, items: Iterable[tuple[str, T]], *, force: bool = False) -> None:
+        items = list(items)
+        uids = [uid for uid, _ in items]
+        self._invalidate(uids)
+        try:
+            self._storage.push_many(items, force=force)
+        finally:
+            self._invalidate(uids)
+
+    def remove(self, uid: str) -> None:
+        self._invalidate([uid])
+        try:
+            self._storage.remove(uid)
+        finally:
+            self._invalidate([uid])
+
+    def remove_many(self, uids: Iterable[str]) -> None:
+        uids = list(uids)
+        self._invalidate(uids)
+        try:
+            self._storage.remove_many(uids)
+        finally:
+            self._invalidate(uids)
+
+    def exists(self, uid: str) -> bool:
+        with self._lock:
+            if self._lookup(uid) is not None:
+                return True
+        return self._storage.exists(uid)
+
+    def index(self, prefix: str | None = None) -> Iterator[str]:
+        return self._storage.index(prefix)
@@ -0,0 +1,108 @@
+__all__ = ["INDEX_FILE", "RecordIndex", "RecordInfo"]
+
+import sqlite3
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+
+from iokit.tools.prefix import prefix_upper_bound
+from iokit.tools.time import fromtimestamp
+
+INDEX_FILE = ".iokit-index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    uid TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+@dataclass(frozen=True)
+class RecordInfo:
+    uid: str
+    size: int
+    mtime: float
+
+    @property
+    def time(self) -> datetime:
+        return fromtimestamp(self.mtime)
+
+
+class RecordIndex:
+    def __init__(self, path: Path | str) -> None:
+        self._path = Path(path)
+        self._connection = sqlite3.connect(self._path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+        self._lock = Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def add_many(self, records: Iterable[RecordInfo]) -> None:
+        rows = [(record.uid, record.size, record.mtime) for record in records]
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?)", rows)
+
+    def add(self, record: RecordInfo) -> None:
+        self.add_many([record])
+
+    def discard_many(self, uids: Iterable[str]) -> None:
+        rows = [(uid,) for uid in uids]
+        with self._lock, self._connection:
+            self._connection.executemany("DELETE FROM records WHERE uid = ?", rows)
+
+    def discard(self, uid: str) -> None:
+        self.discard_many([uid])
+
+    def get(self, uid: str) -> RecordInfo | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT uid, size, mtime FROM records WHERE uid = ?",
+                (uid,),
+            ).fetchone()
+        return None if row is None else RecordInfo(*row)
+
+    def __contains__(self, uid: object) -> bool:
+        return isinstance(uid, str) and self.get(uid) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM records").fetchone()
+        return int(count)
+
+    def query(self, prefix: str | None = None) -> list[RecordInfo]:
+        query = "SELECT uid, size, mtime FROM records"
+        params: tuple[str, ...] = ()
+        if prefix:
+            upper = prefix_upper_bound(prefix)
+            if upper is None:
+                query += " WHERE uid >= ?"
+                params = (prefix,)
+            else:
+                query += " WHERE uid >= ? AND uid < ?"
+                params = (prefix, upper)
+        with self._lock:
+            rows = self._connection.execute(f"{query} ORDER BY uid", params).fetchall()
+        return [RecordInfo(*row) for row in rows]
+
+    def uids(self, prefix: str | None = None) -> Iterator[str]:
+        for record in self.query(prefix):
+            yield record.uid
+
+    def rebuild(self, records: Iterable[RecordInfo]) -> None:
+        rows = [(record.uid, record.size, record.mtime) for record in records]
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM records")
+            self._connection.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?)", rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,185 @@
+__all__ = [
+    "LAYOUT_FILE",
+    "MAX_FANOUT",
+    "migrate_layout",
+    "shard_path",
+    "shard_root",
+    "walk_records",
+]
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import xxhash
+
+LAYOUT_FILE = ".iokit-layout"
+
+_SHARD_WIDTH = 2
+_DIGEST_WIDTH = 16
+MAX_FANOUT = _DIGEST_WIDTH // _SHARD_WIDTH
+
+
+def _check_fanout(fanout: int) -> None:
+    if not 0 <= fanout <= MAX_FANOUT:
+        msg = f"Fanout must be between 0 and {MAX_FANOUT}, got {fanout}"
+        raise ValueError(msg)
+
+
+def _read_layout(root: Path) -> dict[str, int] | None:
+    try:
+        layout = json.loads((root / LAYOUT_FILE).read_text())
+    except FileNotFoundError:
+        return None
+    return {key: int(value) for key, value in layout.items() if key in ("fanout", "target")}
+
+
+def _write_layout(root: Path, layout: dict[str, int]) -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    temp = root / f"{LAYOUT_FILE}.tmp"
+    temp.write_text(json.dumps({**layout, "hash": "xxh64"}))
+    temp.replace(root / LAYOUT_FILE)
+
+
+def read_fanout(root: Path) -> int | None:
+    layout = _read_layout(root)
+    if layout is None:
+        return None
+    if "target" in layout:
+        msg = (
+            f"Root '{root!s}' has an unfinished migration to fanout {layout['target']}, "
+            "rerun migrate_layout to complete it"
+        )
+        raise ValueError(msg)
+    return layout["fanout"]
+
+
+def write_fanout(root: Path, fanout: int) -> None:
+    if fanout == 0:
+        (root / LAYOUT_FILE).unlink(missing_ok=True)
+        return
+    _write_layout(root, {"fanout": fanout})
+
+
+def resolve_fanout(root: Path, fanout: int | None) -> int:
+    stored = read_fanout(root)
+    if fanout is None:
+        return stored or 0
+    _check_fanout(fanout)
+    if stored is None and fanout > 0 and root.exists() and any(walk_records(root, 0)):
+        msg = f"Root '{root!s}' has a flat layout, use migrate_layout to shard it"
+        raise ValueError(msg)
+    if stored is not None and stored != fanout:
+        msg = f"Root '{root!s}' uses fanout {stored}, use migrate_layout to change it"
+        raise ValueError(msg)
+    if stored is None and fanout > 0:
+        write_fanout(root, fanout)
+    return fanout
+
+
+def shard_root(root: Path, uid: str, fanout: int) -> Path:
+    if fanout == 0:
+        return root
+    digest = xxhash.xxh64_hexdigest(uid.encode("utf-8"))
+    shards = [digest[i * _SHARD_WIDTH : (i + 1) * _SHARD_WIDTH] for i in range(fanout)]
+    return root.joinpath(*shards)
+
+
+def shard_path(root: Path, uid: str, fanout: int) -> Path:
+    return shard_root(root, uid, fanout) / uid
+
+
+def _may_contain(relative: str, prefix: str | None) -> bool:
+    return prefix is None or prefix.startswith(relative) or relative.startswith(prefix)
+
+
+def _walk(directory: Path, relative: str, prefix: str | None) -> Iterator[str]:
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        uid = f"{relative}{entry.name}"
+        if entry.is_dir(follow_symlinks=False):
+            if _may_contain(f"{uid}/", prefix):
+                yield from _walk(Path(entry.path), f"{uid}/", prefix)
+        elif prefix is None or uid.startswith(prefix):
+            yield uid
+
+
+def _shards(directory: Path, depth: int) -> Iterator[Path]:
+    if depth == 0:
+        yield directory
+        return
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if len(entry.name) == _SHARD_WIDTH and entry.is_dir(follow_symlinks=False):
+            yield from _shards(Path(entry.path), depth - 1)
+
+
+def walk_records(root: Path, fanout: int, prefix: str | None = None) -> Iterator[str]:
+    for shard in _shards(root, fanout):
+        yield from _walk(shard, "", prefix)
+
+
+def _prune(directory: Path, root: Path) -> None:
+    while directory != root:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
+
+
+def _layout_uid(relative: str, fanout: int) -> str | None:
+    if fanout == 0:
+        return relative
+    parts = relative.split("/", fanout)
+    if len(parts) <= fanout:
+        return None
+    uid = parts[fanout]
+    return uid if shard_path(Path(), uid, fanout).as_posix() == relative else None
+
+
+def _pending_records(root: Path, current: int, fanout: int, *, resume: bool) -> Iterator[str]:
+    for relative in list(_walk(root, "", None)):
+        uid = _layout_uid(relative, current)
+        if uid is None:
+            continue
+        # records already moved by an interrupted run are recognized by their shard digest
+        if resume and fanout > 0 and _layout_uid(relative, fanout) is not None:
+            continue
+        yield uid
+
+
+def migrate_layout(root: Path | str, fanout: int) -> int:
+    _check_fanout(fanout)
+    root = Path(root).resolve()
+    layout = _read_layout(root) or {"fanout": 0}
+    current = layout["fanout"]
+    resume = "target" in layout
+    if resume and layout["target"] != fanout:
+        msg = (
+            f"Root '{root!s}' has an unfinished migration to fanout {layout['target']}, "
+            f"cannot migrate to fanout {fanout}"
+        )
+        raise ValueError(msg)
+    if current == fanout:
+        return 0
+    _write_layout(root, {"fanout": current, "target": fanout})
+    moved = 0
+    for uid in _pending_records(root, current, fanout, resume=resume):
+        source = shard_path(root, uid, current)
+        target = shard_path(root, uid, fanout)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        source.replace(target)
+        _prune(source.parent, root)
+        moved += 1
+    write_fanout(root, fanout)
+    return moved
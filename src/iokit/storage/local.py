@@ -1,50 +1,139 @@
 __all__ = [
     "LocalStorage",
     "MemoryStorage",
+    "PipelineStats",
     "StateStorage",
     "load_file",
     "save_file",
     "save_temp",
 ]
 
+import mmap
+import os
 import tempfile
-from collections.abc import Generator, Iterator
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from secrets import token_hex
+from time import perf_counter
 from typing import Any, Literal, TypeVar, overload
 
 from iokit import Enc, auto_state, supported_extensions
+from iokit.extensions.codec import Compression
 from iokit.state import ExpectedStateType, State
 from iokit.tools.time import fromtimestamp
 
+from .index import INDEX_FILE, RecordIndex, RecordInfo
+from .layout import resolve_fanout, shard_path, shard_root, walk_records
 from .storage import BackendStorage, Storage
 
 PathLike = str | Path
 
 S = TypeVar("S", bound=State)
+A = TypeVar("A")
+R = TypeVar("R")
+
+FsyncMode = Literal["none", "file", "full"]
+
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+_TEMP_ATTEMPTS = 100
+
+
+def _map_file(path: Path) -> bytes | memoryview:
+    with path.open("rb") as file:
+        if path.stat().st_size == 0:
+            return b""
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
 
 
 @overload
-def load_file(path: PathLike, expected_type: type[S]) -> S: ...
+def load_file(path: PathLike, expected_type: type[S], *, mmap: bool = False) -> S: ...
 
 
 @overload
-def load_file(path: PathLike, expected_type: None = None) -> State: ...
+def load_file(path: PathLike, expected_type: None = None, *, mmap: bool = False) -> State: ...
 
 
-def load_file(path: PathLike, expected_type: type[S] | None = None) -> S | State:
+def load_file(
+    path: PathLike,
+    expected_type: type[S] | None = None,
+    *,
+    mmap: bool = False,
+) -> S | State:
     path = Path(path).resolve()
     mtime = fromtimestamp(path.stat().st_mtime)
-    return State(path.read_bytes(), name=path.name, time=mtime).cast(expected_type)
+    data = _map_file(path) if mmap else path.read_bytes()
+    return State(data, name=path.name, time=mtime).cast(expected_type)
+
+
+def _fsync_dir(path: PathLike) -> None:
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _claim(temp: Path, path: Path) -> None:
+    try:
+        os.link(temp, path)
+    except FileExistsError:
+        raise
+    except OSError:
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+        temp.replace(path)
+    else:
+        temp.unlink()
+
+
+def _create_temp(path: Path) -> tuple[int, Path]:
+    for _ in range(_TEMP_ATTEMPTS):
+        temp = path.with_name(f".{path.name}.{token_hex(8)}.tmp")
+        try:
+            # the kernel applies the current umask to 0o666, like a plain open()
+            return os.open(temp, _TEMP_FLAGS, 0o666), temp
+        except FileExistsError:
+            continue
+    msg = f"Failed to create a temporary file next to path='{path!s}'"
+    raise FileExistsError(msg)
+
+
+def _write_atomic(path: Path, data: memoryview, *, force: bool, fsync: FsyncMode) -> None:
+    fd, temp = _create_temp(path)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            if fsync != "none":
+                file.flush()
+                os.fsync(file.fileno())
+        if force:
+            temp.replace(path)
+        else:
+            _claim(temp, path)
+    except FileExistsError as exc:
+        temp.unlink(missing_ok=True)
+        msg = f"File already exists: path='{path!s}'"
+        raise FileExistsError(msg) from exc
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+    if fsync == "full":
+        _fsync_dir(path.parent)
 
 
-def save_file(
+def save_file(  # noqa: PLR0913
     state: State,
     /,
     root: PathLike = "",
     *,
     parents: bool = False,
     force: bool = False,
+    fsync: FsyncMode = "none",
 ) -> Path:
     root = Path(root).resolve()
     path = (root / str(state.name)).resolve()
@@ -56,7 +145,7 @@ def save_file(
         raise FileExistsError(msg)
     root.mkdir(parents=parents, exist_ok=True)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(state.data)
+    _write_atomic(path, state.memory, force=force, fsync=fsync)
     return path
 
 
@@ -67,37 +156,148 @@ def save_temp(state: State, /) -> Generator[Path, None, None]:
 
 
 class LocalStorage(BackendStorage):
-    def __init__(self, root: Path | str) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        root: Path | str,
+        *,
+        mmap: bool = False,
+        workers: int | None = None,
+        fanout: int | None = None,
+        fsync: FsyncMode = "none",
+        indexed: bool = False,
+    ) -> None:
         super().__init__()
         self._root = Path(root).resolve()
-
-    def pull(self, uid: str) -> bytes:
-        return load_file(self._root / uid).data
-
-    def push(self, uid: str, record: bytes, *, force: bool = False) -> None:
+        self._mmap = mmap
+        self._workers = workers
+        self._fanout = resolve_fanout(self._root, fanout)
+        self._fsync = fsync
+        self._index: RecordIndex | None = None
+        if indexed:
+            path = self._root / INDEX_FILE
+            fresh = not path.exists()
+            self._root.mkdir(parents=True, exist_ok=True)
+            self._index = RecordIndex(path)
+            if fresh:
+                self.reindex()
+
+    def _map(self, func: Callable[[A], R], items: Iterable[A]) -> list[R]:
+        items = list(items)
+        if len(items) < 2 or self._workers == 1:  # noqa: PLR2004
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            return list(executor.map(func, items))
+
+    @property
+    def fanout(self) -> int:
+        return self._fanout
+
+    def path(self, uid: str) -> Path:
+        return shard_path(self._root, uid, self._fanout)
+
+    def _info(self, uid: str, path: Path | None = None) -> RecordInfo:
+        stat = (path or self.path(uid)).stat()
+        return RecordInfo(uid, stat.st_size, stat.st_mtime)
+
+    def pull(self, uid: str) -> bytes | memoryview:
+        state = load_file(self.path(uid), mmap=self._mmap)
+        return state.memory if self._mmap else state.data
+
+    def _push(
+        self,
+        uid: str,
+        record: bytes | memoryview,
+        *,
+        force: bool,
+        fsync: FsyncMode,
+    ) -> Path:
+        root = shard_root(self._root, uid, self._fanout)
         try:
-            save_file(State(record, name=uid), root=self._root, force=force)
+            return save_file(
+                State(record, name=uid),
+                root=root,
+                parents=True,
+                force=force,
+                fsync=fsync,
+            )
         except FileExistsError as exc:
             msg = f"Record with uid '{uid}' already exists"
             raise FileExistsError(msg) from exc
 
+    def push(self, uid: str, record: bytes | memoryview, *, force: bool = False) -> None:
+        path = self._push(uid, record, force=force, fsync=self._fsync)
+        if self._index is not None:
+            self._index.add(self._info(uid, path))
+
     def remove(self, uid: str) -> None:
-        path = Path(self._root / uid)
+        self._remove_file(uid)
+        if self._index is not None:
+            self._index.discard(uid)
+
+    def exists(self, uid: str) -> bool:
+        return self.path(uid).exists()
+
+    def pull_many(self, uids: Iterable[str]) -> list[bytes | memoryview]:
+        return self._map(self.pull, uids)
+
+    def push_many(
+        self,
+        items: Iterable[tuple[str, bytes | memoryview]],
+        *,
+        force: bool = False,
+    ) -> None:
+        items = list(items)
+        fsync: FsyncMode = "file" if self._fsync == "full" else self._fsync
+        try:
+            paths = self._map(lambda item: self._push(*item, force=force, fsync=fsync), items)
+            if self._fsync == "full":
+                for directory in {path.parent for path in paths}:
+                    _fsync_dir(directory)
+        finally:
+            if self._index is not None:
+                self._index.add_many(self._info(uid) for uid, _ in items if self.path(uid).exists())
+
+    def remove_many(self, uids: Iterable[str]) -> None:
+        uids = list(uids)
+        for uid in uids:
+            if not self.path(uid).exists():
+                msg = f"Record with uid '{uid}' does not exist"
+                raise FileNotFoundError(msg)
+        try:
+            self._map(self._remove_file, uids)
+        finally:
+            if self._index is not None:
+                self._index.discard_many(uid for uid in uids if not self.path(uid).exists())
+
+    def _remove_file(self, uid: str) -> None:
+        path = self.path(uid)
         if not path.exists():
             msg = f"Record with uid '{uid}' does not exist"
             raise FileNotFoundError(msg)
         path.unlink()
 
-    def exists(self, uid: str) -> bool:
-        return Path(self._root / uid).exists()
-
     def index(self, prefix: str | None = None) -> Iterator[str]:
-        pattern = "*" if prefix is None else f"{prefix}*"
-        for p in self._root.rglob(pattern):
-            uid = str(p.relative_to(self._root))
-            if uid.startswith("."):
-                continue
-            yield uid
+        if self._index is not None:
+            return self._index.uids(prefix)
+        return walk_records(self._root, self._fanout, prefix)
+
+    def records(self, prefix: str | None = None) -> Iterator[RecordInfo]:
+        if self._index is not None:
+            yield from self._index.query(prefix)
+            return
+        for uid in walk_records(self._root, self._fanout, prefix):
+            yield self._info(uid)
+
+    def reindex(self) -> None:
+        if self._index is None:
+            msg = "LocalStorage was created without an index"
+            raise RuntimeError(msg)
+        uids = walk_records(self._root, self._fanout)
+        self._index.rebuild(self._info(uid) for uid in uids)
+
+    def close(self) -> None:
+        if self._index is not None:
+            self._index.close()
 
 
 class MemoryStorage(BackendStorage):
@@ -112,11 +312,11 @@ class MemoryStorage(BackendStorage):
             msg = f"Record with uid '{uid}' does not exist"
             raise FileNotFoundError(msg) from exc
 
-    def push(self, uid: str, record: bytes, *, force: bool = False) -> None:
+    def push(self, uid: str, record: bytes | memoryview, *, force: bool = False) -> None:
         if uid in self._records and not force:
             msg = f"Record with uid '{uid}' already exists"
             raise FileExistsError(msg)
-        self._records[uid] = record
+        self._records[uid] = bytes(record)
 
     def remove(self, uid: str) -> None:
         if uid not in self._records:
@@ -127,18 +327,63 @@ class MemoryStorage(BackendStorage):
     def exists(self, uid: str) -> bool:
         return uid in self._records
 
+    def push_many(
+        self,
+        items: Iterable[tuple[str, bytes | memoryview]],
+        *,
+        force: bool = False,
+    ) -> None:
+        records = {uid: bytes(record) for uid, record in items}
+        if not force:
+            for uid in records:
+                if uid in self._records:
+                    msg = f"Record with uid '{uid}' already exists"
+                    raise FileExistsError(msg)
+        self._records.update(records)
+
+    def remove_many(self, uids: Iterable[str]) -> None:
+        uids = list(uids)
+        for uid in uids:
+            if uid not in self._records:
+                msg = f"Record with uid '{uid}' does not exist"
+                raise FileNotFoundError(msg)
+        for uid in uids:
+            self._records.pop(uid, None)
+
+    def exists_many(self, uids: Iterable[str]) -> list[bool]:
+        return [uid in self._records for uid in uids]
+
     def index(self, prefix: str | None = None) -> Iterator[str]:
         for uid in self._records:
             if prefix is None or uid.startswith(prefix):
                 yield uid
 
 
+@dataclass
+class PipelineStats:
+    records: int = 0
+    bytes: int = 0
+    encode_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    write_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+
+_Encoded = tuple[str, str, bytes, float]
+
+
+def _encode_record(uid: str, record: object, options: dict[str, Any]) -> _Encoded:
+    start = perf_counter()
+    state = auto_state(record, name=uid, **options)
+    return uid, str(state.name), state.data, perf_counter() - start
+
+
 class StateStorage(Storage[Any]):
     def __init__(  # noqa: PLR0913
         self,
-        backend: BackendStorage,
+        backend: Storage[bytes | memoryview],
         *,
-        compression: int | bool | None = None,
+        compression: Compression | None = None,
         password: str | None = None,
         waveform_to: Literal["wav", "flac", "mp3", "ogg"] = "wav",
         dataframe_to: Literal["csv", "tsv"] = "csv",
@@ -153,6 +398,7 @@ class StateStorage(Storage[Any]):
         self._waveform_to = waveform_to
         self._dataframe_to = dataframe_to
         self._builtin_to = builtin_to
+        self._names: dict[str, str] | None = None
 
     def _remove_extension(self, name: str) -> str:
         while True:
@@ -165,12 +411,29 @@ class StateStorage(Storage[Any]):
                 break
         return name
 
+    def _scan(self) -> dict[str, str]:
+        names: dict[str, str] = {}
+        for name in self._backend.index():
+            names.setdefault(self._remove_extension(name), name)
+        return names
+
+    def _index(self) -> dict[str, str]:
+        if self._names is None:
+            self._names = self._scan()
+        return self._names
+
+    def reindex(self) -> None:
+        self._names = self._scan()
+
+    def invalidate(self) -> None:
+        self._names = None
+
     def _name(self, uid: str) -> str:
-        for name in self._backend.index(prefix=uid):
-            if self._remove_extension(name) == uid:
-                return name
-        msg = f"Record with uid '{uid}' does not exist"
-        raise FileNotFoundError(msg)
+        try:
+            return self._index()[uid]
+        except KeyError as exc:
+            msg = f"Record with uid '{uid}' does not exist"
+            raise FileNotFoundError(msg) from exc
 
     @overload
     def pull_state(self, uid: str, expected_type: ExpectedStateType[S]) -> S: ...
@@ -187,46 +450,184 @@ class StateStorage(Storage[Any]):
         try:
             data = self._backend.pull(name)
         except FileNotFoundError as exc:
+            self._index().pop(uid, None)
             msg = f"Record with uid '{uid}' does not exist"
             raise FileNotFoundError(msg) from exc
         else:
             return State(data, name=name).cast(expected_type)
 
-    def pull(self, uid: str) -> object:
+    def _decode(self, state: State) -> object:
         if self._password is not None:
-            state = self.pull_state(uid, Enc).load().load(password=self._password)
-        else:
-            state = self.pull_state(uid)
+            state = state.cast(Enc).load().load(password=self._password)
         if self._compression is not None:
             state = state.load()
         return state.load()
 
+    def pull(self, uid: str) -> object:
+        return self._decode(self.pull_state(uid))
+
+    def pull_many(self, uids: Iterable[str]) -> list[object]:
+        uids = list(uids)
+        names = [self._name(uid) for uid in uids]
+        try:
+            records = self._backend.pull_many(names)
+        except FileNotFoundError:
+            return [self.pull(uid) for uid in uids]
+        return [
+            self._decode(State(data, name=name)) for name, data in zip(names, records, strict=True)
+        ]
+
+    def _options(self) -> dict[str, Any]:
+        return {
+            "compression": self._compression,
+            "password": self._password,
+            "waveform_to": self._waveform_to,
+            "dataframe_to": self._dataframe_to,
+            "builtin_to": self._builtin_to,
+        }
+
+    def _encode(self, uid: str, record: object) -> State:
+        return auto_state(record, name=uid, **self._options())
+
     def push(self, uid: str, record: object, *, force: bool = False) -> None:
-        state = auto_state(
-            record,
-            name=uid,
-            compression=self._compression,
-            password=self._password,
-            waveform_to=self._waveform_to,
-            dataframe_to=self._dataframe_to,
-            builtin_to=self._builtin_to,
-        )
+        state = self._encode(uid, record)
+        names = self._index()
+        name = str(state.name)
+        previous = names.get(uid)
+        if previous is not None and not force:
+            msg = f"Record with uid '{uid}' already exists"
+            raise FileExistsError(msg)
         try:
-            return self._backend.push(uid=str(state.name), record=state.data, force=force)
+            self._backend.push(uid=name, record=state.data, force=force)
         except FileExistsError as exc:
             msg = f"Record with uid '{uid}' already exists"
             raise FileExistsError(msg) from exc
+        if previous is not None and previous != name:
+            self._backend.remove(previous)
+        names[uid] = name
+
+    def _commit(self, encoded: Iterable[tuple[str, str, bytes]], *, force: bool) -> None:
+        records = {uid: (name, data) for uid, name, data in encoded}
+        names = self._index()
+        if not force:
+            for uid in records:
+                if uid in names:
+                    msg = f"Record with uid '{uid}' already exists"
+                    raise FileExistsError(msg)
+        try:
+            self._backend.push_many(records.values(), force=force)
+        except FileExistsError as exc:
+            self.invalidate()
+            msg = "Some records already exist"
+            raise FileExistsError(msg) from exc
+        stale = []
+        for uid, (name, _) in records.items():
+            previous = names.get(uid)
+            if previous is not None and previous != name:
+                stale.append(previous)
+            names[uid] = name
+        self._backend.remove_many(stale)
+
+    def push_many(self, items: Iterable[tuple[str, object]], *, force: bool = False) -> None:
+        states = ((uid, self._encode(uid, record)) for uid, record in items)
+        self._commit(((uid, str(state.name), state.data) for uid, state in states), force=force)
+
+    def _submit(
+        self,
+        pool: Executor,
+        items: Iterable[tuple[str, object]],
+        *,
+        force: bool,
+    ) -> Iterator[Future[_Encoded]]:
+        options = self._options()
+        names = self._index()
+        for uid, record in items:
+            if not force and uid in names:
+                msg = f"Record with uid '{uid}' already exists"
+                raise FileExistsError(msg)
+            yield pool.submit(_encode_record, uid, record, options)
+
+    def push_pipeline(  # noqa: PLR0913
+        self,
+        items: Iterable[tuple[str, object]],
+        *,
+        force: bool = False,
+        workers: int | None = None,
+        executor: Literal["process", "thread"] = "process",
+        max_pending: int | None = None,
+        batch_size: int = 64,
+    ) -> PipelineStats:
+        workers = workers or os.cpu_count() or 1
+        max_pending = max_pending or 2 * workers
+        pool_type = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        pool: Executor = pool_type(max_workers=workers)
+        stats = PipelineStats()
+        start = perf_counter()
+        pending: deque[Future[_Encoded]] = deque()
+        batch: list[tuple[str, str, bytes]] = []
+
+        def flush() -> None:
+            written = perf_counter()
+            self._commit(batch, force=force)
+            stats.write_seconds += perf_counter() - written
+            stats.records += len(batch)
+            stats.bytes += sum(len(data) for _, _, data in batch)
+            batch.clear()
+
+        def collect(future: Future[_Encoded]) -> None:
+            waited = perf_counter()
+            uid, name, data, elapsed = future.result()
+            stats.wait_seconds += perf_counter() - waited
+            stats.encode_seconds += elapsed
+            batch.append((uid, name, data))
+            if len(batch) >= batch_size:
+                flush()
+
+        with pool:
+            try:
+                for future in self._submit(pool, items, force=force):
+                    pending.append(future)
+                    if len(pending) >= max_pending:
+                        collect(pending.popleft())
+                while pending:
+                    collect(pending.popleft())
+                flush()
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        stats.total_seconds = perf_counter() - start
+        return stats
 
     def remove(self, uid: str) -> None:
+        names = self._index()
         try:
-            return self._backend.remove(self._name(uid))
+            self._backend.remove(self._name(uid))
         except FileNotFoundError as exc:
+            names.pop(uid, None)
             msg = f"Record with uid '{uid}' does not exist"
             raise FileNotFoundError(msg) from exc
+        names.pop(uid, None)
+
+    def remove_many(self, uids: Iterable[str]) -> None:
+        uids = list(uids)
+        names = self._index()
+        try:
+            self._backend.remove_many([self._name(uid) for uid in uids])
+        except FileNotFoundError:
+            self.invalidate()
+            raise
+        for uid in uids:
+            names.pop(uid, None)
 
     def exists(self, uid: str) -> bool:
-        return self._backend.exists(self._name(uid))
+        return uid in self._index()
+
+    def exists_many(self, uids: Iterable[str]) -> list[bool]:
+        names = self._index()
+        return [uid in names for uid in uids]
 
     def index(self, prefix: str | None = None) -> Iterator[str]:
-        for idx in self._backend.index(prefix=prefix):
-            yield self._remove_extension(idx)
+        for uid in list(self._index()):
+            if prefix is None or uid.startswith(prefix):
+                yield uid
@@ -0,0 +1,77 @@
+__all__ = ["checksum_tree", "verify_tree"]
+
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from iokit.checksum import CHUNK_SIZE, HashAlgorithm, stream_hexdigest
+from iokit.state import State
+
+from .local import LocalStorage
+from .storage import Storage
+
+
+def _local_hasher(
+    storage: LocalStorage,
+    algorithm: HashAlgorithm,
+    chunk_size: int,
+) -> Callable[[str], str]:
+    def hasher(uid: str) -> str:
+        with storage.path(uid).open("rb") as file:
+            return stream_hexdigest(file, algorithm, chunk_size=chunk_size)
+
+    return hasher
+
+
+def _storage_hasher(
+    storage: Storage[bytes | memoryview],
+    algorithm: HashAlgorithm,
+) -> Callable[[str], str]:
+    def hasher(uid: str) -> str:
+        return State(storage.pull(uid), name=uid).hexdigest(algorithm)
+
+    return hasher
+
+
+def checksum_tree(
+    source: Storage[bytes | memoryview] | Path | str,
+    algorithm: HashAlgorithm = "xxh128",
+    *,
+    prefix: str | None = None,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> dict[str, str]:
+    if not isinstance(source, Storage):
+        source = LocalStorage(source)
+    if isinstance(source, LocalStorage):
+        uids = [uid for uid in source.index(prefix) if source.path(uid).is_file()]
+        hasher = _local_hasher(source, algorithm, chunk_size)
+    else:
+        uids = list(source.index(prefix))
+        hasher = _storage_hasher(source, algorithm)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(uids, executor.map(hasher, uids), strict=True))
+
+
+def verify_tree(  # noqa: PLR0913
+    source: Storage[bytes | memoryview] | Path | str,
+    manifest: Mapping[str, str],
+    algorithm: HashAlgorithm = "xxh128",
+    *,
+    prefix: str | None = None,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> list[str]:
+    actual = checksum_tree(
+        source,
+        algorithm,
+        prefix=prefix,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+    expected = {
+        uid: digest for uid, digest in manifest.items() if prefix is None or uid.startswith(prefix)
+    }
+    return sorted(
+        uid for uid in actual.keys() | expected.keys() if actual.get(uid) != expected.get(uid)
+    )
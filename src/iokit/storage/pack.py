@@ -0,0 +1,348 @@
+__all__ = ["PackStorage"]
+
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from threading import RLock
+from types import TracebackType
+from typing import BinaryIO
+
+from typing_extensions import Self
+
+from iokit.tools.prefix import prefix_upper_bound
+
+from .storage import BackendStorage
+
+if sys.platform != "win32":
+    import fcntl
+
+SEGMENT_SIZE = 1 << 28
+
+_INDEX_FILE = "index.sqlite"
+_LOCK_FILE = "lock"
+_SEGMENT_SUFFIX = ".pack"
+_HEADER = struct.Struct("!IQ")
+_BATCH_SIZE = 512
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    uid TEXT PRIMARY KEY,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    size INTEGER NOT NULL
+) WITHOUT ROWID
+"""
+
+Location = tuple[int, int, int]
+MemoryMap = mmap.mmap
+
+
+def _batched(items: Iterable[str]) -> Iterator[list[str]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, _BATCH_SIZE)):
+        yield batch
+
+
+class PackStorage(BackendStorage):
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        segment_size: int = SEGMENT_SIZE,
+        mmap: bool = False,
+        fsync: bool = False,
+    ) -> None:
+        super().__init__()
+        self._root = Path(root).resolve()
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._segment_size = segment_size
+        self._mmap = mmap
+        self._fsync = fsync
+        self._lock = RLock()
+        self._connection = sqlite3.connect(self._root / _INDEX_FILE, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+        self._files: dict[int, int] = {}
+        self._maps: dict[int, MemoryMap] = {}
+        # descriptors with preads in flight are closed by the last reader
+        self._reading: dict[int, int] = {}
+        self._retired: set[int] = set()
+        numbers = [int(path.stem) for path in self._root.glob(f"*{_SEGMENT_SUFFIX}")]
+        self._segment = max(numbers, default=1)
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._root / f"{segment:08d}{_SEGMENT_SUFFIX}"
+
+    def segments(self) -> list[Path]:
+        return sorted(self._root.glob(f"*{_SEGMENT_SUFFIX}"))
+
+    @contextmanager
+    def _writing(self) -> Generator[None, None, None]:
+        with self._lock, (self._root / _LOCK_FILE).open("a") as lock:
+            if sys.platform != "win32":
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            while self._segment_path(self._segment + 1).exists():
+                self._segment += 1
+            yield
+
+    def _locate(self, uid: str) -> Location | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT segment, offset, size FROM records WHERE uid = ?",
+                (uid,),
+            ).fetchone()
+        return None if row is None else (row[0], row[1], row[2])
+
+    def _locate_many(self, uids: Iterable[str]) -> dict[str, Location]:
+        locations: dict[str, Location] = {}
+        for batch in _batched(uids):
+            marks = ", ".join("?" * len(batch))
+            with self._lock:
+                rows = self._connection.execute(
+                    f"SELECT uid, segment, offset, size FROM records WHERE uid IN ({marks})",  # noqa: S608
+                    batch,
+                ).fetchall()
+            locations.update((uid, (segment, offset, size)) for uid, segment, offset, size in rows)
+        return locations
+
+    def _missing(self, uid: str) -> FileNotFoundError:
+        msg = f"Record with uid '{uid}' does not exist"
+        return FileNotFoundError(msg)
+
+    def _fd(self, segment: int) -> int:
+        fd = self._files.get(segment)
+        if fd is None:
+            fd = self._files[segment] = os.open(self._segment_path(segment), os.O_RDONLY)
+        return fd
+
+    def _view(self, segment: int, end: int) -> MemoryMap:
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped) < end:
+            mapped = mmap.mmap(self._fd(segment), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapped
+        return mapped
+
+    def _pin(self, segment: int) -> int:
+        with self._lock:
+            fd = self._fd(segment)
+            self._reading[fd] = self._reading.get(fd, 0) + 1
+        return fd
+
+    def _unpin(self, fd: int) -> None:
+        with self._lock:
+            self._reading[fd] -= 1
+            if self._reading[fd] > 0:
+                return
+            del self._reading[fd]
+            if fd in self._retired:
+                self._retired.discard(fd)
+                os.close(fd)
+
+    def _read(self, location: Location) -> bytes | memoryview:
+        segment, offset, size = location
+        if self._mmap and size > 0:
+            with self._lock:
+                mapped = self._view(segment, offset + size)
+            return memoryview(mapped)[offset : offset + size]
+        fd = self._pin(segment)
+        try:
+            return os.pread(fd, size, offset)
+        finally:
+            self._unpin(fd)
+
+    def pull(self, uid: str) -> bytes | memoryview:
+        for _ in range(2):
+            location = self._locate(uid)
+            if location is None:
+                break
+            try:
+                return self._read(location)
+            except FileNotFoundError:
+                continue
+        raise self._missing(uid)
+
+    def pull_many(self, uids: Iterable[str]) -> list[bytes | memoryview]:
+        uids = list(uids)
+        locations = self._locate_many(uids)
+        records: list[bytes | memoryview] = []
+        for uid in uids:
+            location = locations.get(uid)
+            if location is None:
+                raise self._missing(uid)
+            try:
+                records.append(self._read(location))
+            except FileNotFoundError:
+                records.append(self.pull(uid))
+        return records
+
+    def _open_segment(self) -> BinaryIO:
+        file = self._segment_path(self._segment).open("ab")
+        if file.tell() >= self._segment_size:
+            file.close()
+            self._segment += 1
+            file = self._segment_path(self._segment).open("ab")
+        return file
+
+    def _append(
+        self,
+        items: Iterable[tuple[str, bytes | memoryview]],
+    ) -> list[tuple[str, int, int, int]]:
+        rows: list[tuple[str, int, int, int]] = []
+        file = self._open_segment()
+        try:
+            for uid, record in items:
+                if file.tell() >= self._segment_size:
+                    self._sync(file)
+                    file.close()
+                    file = self._open_segment()
+                key = uid.encode("utf-8")
+                size = memoryview(record).nbytes
+                file.write(_HEADER.pack(len(key), size))
+                file.write(key)
+                rows.append((uid, self._segment, file.tell(), size))
+                file.write(record)
+            self._sync(file)
+        finally:
+            file.close()
+        return rows
+
+    def _sync(self, file: BinaryIO) -> None:
+        file.flush()
+        if self._fsync:
+            os.fsync(file.fileno())
+
+    def push(self, uid: str, record: bytes | memoryview, *, force: bool = False) -> None:
+        self.push_many([(uid, record)], force=force)
+
+    def push_many(
+        self,
+        items: Iterable[tuple[str, bytes | memoryview]],
+        *,
+        force: bool = False,
+    ) -> None:
+        items = list(items)
+        with self._writing():
+            if not force:
+                existing = set(self._locate_many(uid for uid, _ in items))
+                for uid, _ in items:
+                    if uid in existing:
+                        msg = f"Record with uid '{uid}' already exists"
+                        raise FileExistsError(msg)
+                    existing.add(uid)
+            rows = self._append(items)
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+
+    def remove(self, uid: str) -> None:
+        self.remove_many([uid])
+
+    def remove_many(self, uids: Iterable[str]) -> None:
+        uids = list(uids)
+        with self._writing():
+            existing = self._locate_many(uids)
+            for uid in uids:
+                if uid not in existing:
+                    raise self._missing(uid)
+            with self._connection:
+                self._connection.executemany(
+                    "DELETE FROM records WHERE uid = ?",
+                    [(uid,) for uid in uids],
+                )
+
+    def exists(self, uid: str) -> bool:
+        return self._locate(uid) is not None
+
+    def exists_many(self, uids: Iterable[str]) -> list[bool]:
+        uids = list(uids)
+        locations = self._locate_many(uids)
+        return [uid in locations for uid in uids]
+
+    def index(self, prefix: str | None = None) -> Iterator[str]:
+        query = "SELECT uid FROM records"
+        params: tuple[str, ...] = ()
+        if prefix:
+            upper = prefix_upper_bound(prefix)
+            query += " WHERE uid >= ?" if upper is None else " WHERE uid >= ? AND uid < ?"
+            params = (prefix,) if upper is None else (prefix, upper)
+        with self._lock:
+            rows = self._connection.execute(f"{query} ORDER BY uid", params).fetchall()
+        for (uid,) in rows:
+            yield uid
+
+    def _live_bytes(self) -> dict[int, int]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT segment, SUM(size + length(CAST(uid AS BLOB)) + ?) "
+                "FROM records GROUP BY segment",
+                (_HEADER.size,),
+            ).fetchall()
+        return dict(rows)
+
+    def _release(self, segment: int) -> None:
+        self._maps.pop(segment, None)
+        fd = self._files.pop(segment, None)
+        if fd in self._reading:
+            self._retired.add(fd)
+        elif fd is not None:
+            os.close(fd)
+
+    def compact(self, min_garbage: float = 0.0) -> int:
+        with self._writing():
+            live = self._live_bytes()
+            candidates: dict[int, int] = {}
+            for path in self.segments():
+                segment = int(path.stem)
+                total = path.stat().st_size
+                garbage = total - live.get(segment, 0)
+                if garbage > 0 and garbage >= min_garbage * total:
+                    candidates[segment] = total
+            if not candidates:
+                return 0
+            self._segment = max(self._segment, *candidates) + 1
+            copied = 0
+            for segment in sorted(candidates):
+                with self._lock:
+                    rows = self._connection.execute(
+                        "SELECT uid, offset, size FROM records WHERE segment = ?",
+                        (segment,),
+                    ).fetchall()
+                items = ((uid, self._read((segment, offset, size))) for uid, offset, size in rows)
+                moved = self._append(items)
+                copied += sum(
+                    _HEADER.size + len(uid.encode("utf-8")) + size for uid, _, _, size in moved
+                )
+                with self._connection:
+                    self._connection.executemany(
+                        "UPDATE records SET segment = ?, offset = ? WHERE uid = ?",
+                        [(new, offset, uid) for uid, new, offset, _ in moved],
+                    )
+                self._release(segment)
+                self._segment_path(segment).unlink()
+            return sum(candidates.values()) - copied
+
+    def close(self) -> None:
+        with self._lock:
+            for segment in list(self._files):
+                self._release(segment)
+            self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
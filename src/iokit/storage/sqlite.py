@@ -0,0 +1,194 @@
+__all__ = ["SqliteStorage"]
+
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from threading import RLock
+from types import TracebackType
+
+from typing_extensions import Self
+
+from iokit.tools.prefix import prefix_upper_bound
+
+from .storage import BackendStorage
+
+BLOB_THRESHOLD = 1 << 20
+CHUNK_SIZE = 1 << 20
+
+_BATCH_SIZE = 512
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    uid TEXT NOT NULL UNIQUE,
+    data BLOB NOT NULL
+)
+"""
+
+
+class SqliteStorage(BackendStorage):
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        timeout: float = 5.0,
+        blob_threshold: int = BLOB_THRESHOLD,
+        synchronous: bool = True,
+    ) -> None:
+        super().__init__()
+        self._path = Path(path).resolve()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._blob_threshold = blob_threshold
+        self._blob = hasattr(sqlite3.Connection, "blobopen")
+        self._lock = RLock()
+        self._connection = sqlite3.connect(
+            self._path,
+            timeout=timeout,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(f"PRAGMA synchronous={'NORMAL' if synchronous else 'OFF'}")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _missing(self, uid: str) -> FileNotFoundError:
+        msg = f"Record with uid '{uid}' does not exist"
+        return FileNotFoundError(msg)
+
+    def _read(self, row_id: int, size: int, data: bytes | None) -> bytes:
+        if data is not None:
+            return data
+        buffer = bytearray(size)
+        with self._connection.blobopen("records", "data", row_id, readonly=True) as blob:
+            view = memoryview(buffer)
+            for start in range(0, size, CHUNK_SIZE):
+                view[start : start + CHUNK_SIZE] = blob.read(CHUNK_SIZE)
+        return bytes(buffer)
+
+    def _select(self, where: str) -> str:
+        if not self._blob:
+            return f"SELECT uid, id, length(data), data FROM records WHERE {where}"  # noqa: S608
+        return (
+            "SELECT uid, id, length(data), "  # noqa: S608
+            f"CASE WHEN length(data) > {self._blob_threshold:d} THEN NULL ELSE data END "
+            f"FROM records WHERE {where}"
+        )
+
+    def pull(self, uid: str) -> bytes:
+        with self._lock:
+            row = self._connection.execute(self._select("uid = ?"), (uid,)).fetchone()
+            if row is None:
+                raise self._missing(uid)
+            return self._read(*row[1:])
+
+    def pull_many(self, uids: Iterable[str]) -> list[bytes | memoryview]:
+        uids = list(uids)
+        records: dict[str, bytes | memoryview] = {}
+        with self._lock:
+            for start in range(0, len(uids), _BATCH_SIZE):
+                batch = uids[start : start + _BATCH_SIZE]
+                marks = ", ".join("?" * len(batch))
+                query = self._select(f"uid IN ({marks})")
+                for uid, row_id, size, data in self._connection.execute(query, batch):
+                    records[uid] = self._read(row_id, size, data)
+        for uid in uids:
+            if uid not in records:
+                raise self._missing(uid)
+        return [records[uid] for uid in uids]
+
+    def _insert(self, uid: str, record: bytes | memoryview, *, force: bool) -> None:
+        verb = "INSERT OR REPLACE" if force else "INSERT"
+        size = memoryview(record).nbytes
+        if not self._blob or size <= self._blob_threshold:
+            self._connection.execute(
+                f"{verb} INTO records (uid, data) VALUES (?, ?)",
+                (uid, record),
+            )
+            return
+        cursor = self._connection.execute(
+            f"{verb} INTO records (uid, data) VALUES (?, zeroblob(?))",
+            (uid, size),
+        )
+        row_id = cursor.lastrowid
+        if row_id is None:
+            msg = f"Failed to allocate a blob for uid '{uid}'"
+            raise RuntimeError(msg)
+        view = memoryview(record).cast("B")
+        with self._connection.blobopen("records", "data", row_id) as blob:
+            for start in range(0, size, CHUNK_SIZE):
+                blob.write(view[start : start + CHUNK_SIZE])
+
+    def push(self, uid: str, record: bytes | memoryview, *, force: bool = False) -> None:
+        self.push_many([(uid, record)], force=force)
+
+    def push_many(
+        self,
+        items: Iterable[tuple[str, bytes | memoryview]],
+        *,
+        force: bool = False,
+    ) -> None:
+        with self._lock:
+            uid = None
+            try:
+                with self._connection:
+                    for uid, record in items:
+                        self._insert(uid, record, force=force)
+            except sqlite3.IntegrityError as exc:
+                msg = f"Record with uid '{uid}' already exists"
+                raise FileExistsError(msg) from exc
+
+    def remove(self, uid: str) -> None:
+        self.remove_many([uid])
+
+    def remove_many(self, uids: Iterable[str]) -> None:
+        with self._lock, self._connection:
+            for uid in uids:
+                cursor = self._connection.execute("DELETE FROM records WHERE uid = ?", (uid,))
+                if cursor.rowcount == 0:
+                    raise self._missing(uid)
+
+    def exists(self, uid: str) -> bool:
+        return self.exists_many([uid])[0]
+
+    def exists_many(self, uids: Iterable[str]) -> list[bool]:
+        uids = list(uids)
+        found: set[str] = set()
+        with self._lock:
+            for start in range(0, len(uids), _BATCH_SIZE):
+                batch = uids[start : start + _BATCH_SIZE]
+                marks = ", ".join("?" * len(batch))
+                query = f"SELECT uid FROM records WHERE uid IN ({marks})"  # noqa: S608
+                found.update(uid for (uid,) in self._connection.execute(query, batch))
+        return [uid in found for uid in uids]
+
+    def index(self, prefix: str | None = None) -> Iterator[str]:
+        query = "SELECT uid FROM records"
+        params: tuple[str, ...] = ()
+        if prefix:
+            upper = prefix_upper_bound(prefix)
+            query += " WHERE uid >= ?" if upper is None else " WHERE uid >= ? AND uid < ?"
+            params = (prefix,) if upper is None else (prefix, upper)
+        with self._lock:
+            rows = self._connection.execute(f"{query} ORDER BY uid", params).fetchall()
+        for (uid,) in rows:
+            yield uid
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -5,7 +5,7 @@ __all__ = [
 
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import Generic, TypeVar
 
 T = TypeVar("T")
@@ -37,8 +37,22 @@ class Storage(ABC, Generic[T]):
         msg = "Method 'index' must be implemented in a subclass"
         raise NotImplementedError(msg)
 
+    def pull_many(self, uids: Iterable[str]) -> list[T]:
+        return [self.pull(uid) for uid in uids]
 
-class BackendStorage(Storage[bytes]):
+    def push_many(self, items: Iterable[tuple[str, T]], *, force: bool = False) -> None:
+        for uid, record in items:
+            self.push(uid, record, force=force)
+
+    def remove_many(self, uids: Iterable[str]) -> None:
+        for uid in uids:
+            self.remove(uid)
+
+    def exists_many(self, uids: Iterable[str]) -> list[bool]:
+        return [self.exists(uid) for uid in uids]
+
+
+class BackendStorage(Storage[bytes | memoryview]):
     pass
 
 
@@ -66,5 +80,11 @@ class ReadOnlyStorage(Storage[T]):
     def exists(self, uid: str) -> bool:
         return self._storage.exists(uid)
 
+    def pull_many(self, uids: Iterable[str]) -> list[T]:
+        return self._storage.pull_many(uids)
+
+    def exists_many(self, uids: Iterable[str]) -> list[bool]:
+        return self._storage.exists_many(uids)
+
     def index(self, prefix: str | None = None) -> Iterator[str]:
         return self._storage.index(prefix)
@@ -0,0 +1,228 @@
+__all__ = ["TieredStorage", "WritePolicy"]
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, suppress
+from threading import Condition, Lock, RLock
+from types import TracebackType
+from typing import Literal
+
+from typing_extensions import Self
+
+from .cache import SizedLru
+from .storage import BackendStorage, Storage
+
+WritePolicy = Literal["through", "behind"]
+
+Record = bytes | memoryview
+
+
+class TieredStorage(BackendStorage):
+    def __init__(  # noqa: PLR0913
+        self,
+        upper: Storage[Record],
+        lower: Storage[Record],
+        *,
+        max_bytes: int | None = None,
+        max_items: int | None = None,
+        write: WritePolicy = "through",
+    ) -> None:
+        super().__init__()
+        if write not in ("through", "behind"):
+            msg = f"Unknown write policy '{write}'"
+            raise ValueError(msg)
+        self._upper = upper
+        self._lower = lower
+        self._write = write
+        self._cached: SizedLru[None] = SizedLru(max_bytes=max_bytes, max_items=max_items)
+        self._dirty: set[str] = set()
+        self._generation = 0
+        # guards the bookkeeping above, tier I/O happens outside of it
+        self._lock = Lock()
+        # uids whose upper copy is being written or demoted
+        self._busy: set[str] = set()
+        self._idle = Condition(self._lock)
+        # serializes writes, reads only claim the uid they promote
+        self._writing = RLock()
+
+    @property
+    def dirty(self) -> frozenset[str]:
+        with self._lock:
+            return frozenset(self._dirty)
+
+    @contextmanager
+    def _claim(self, uid: str) -> Iterator[None]:
+        with self._lock:
+            self._idle.wait_for(lambda: uid not in self._busy)
+            self._busy.add(uid)
+        try:
+            yield
+        finally:
+            self._release(uid)
+
+    def _release(self, uid: str) -> None:
+        with self._lock:
+            self._busy.discard(uid)
+            self._idle.notify_all()
+
+    def _drop(self, uid: str) -> None:
+        with self._lock:
+            self._cached.pop(uid)
+        with suppress(FileNotFoundError):
+            self._upper.remove(uid)
+
+    def _demote(self, uid: str) -> None:
+        with self._claim(uid):
+            with self._lock:
+                if uid not in self._cached:
+                    return
+                dirty = uid in self._dirty
+            if dirty:
+                self._lower.push(uid, self._upper.pull(uid), force=True)
+                with self._lock:
+                    self._dirty.discard(uid)
+            self._drop(uid)
+
+    def _place(self, uid: str, record: Record) -> bool:
+        size = memoryview(record).nbytes
+        with self._lock:
+            fits = self._cached.fits(size)
+            cached = uid in self._cached
+        if not fits:
+            if cached:
+                self._drop(uid)
+            return False
+        self._upper.push(uid, record, force=True)
+        with self._lock:
+            self._cached.put(uid, None, size)
+        return True
+
+    def _promote(self, uid: str, record: Record, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation or uid in self._busy:
+                return
+            self._busy.add(uid)
+        try:
+            self._place(uid, record)
+        finally:
+            self._release(uid)
+        self._shrink()
+
+    def _shrink(self) -> None:
+        while (victim := self._overflow()) is not None:
+            self._demote(victim)
+
+    def _overflow(self) -> str | None:
+        with self._lock:
+            return self._cached.overflow()
+
+    def _touch(self, uid: str) -> bool:
+        with self._lock:
+            if uid in self._cached:
+                self._cached.get(uid)
+                return True
+            return False
+
+    def pull(self, uid: str) -> Record:
+        if self._touch(uid):
+            try:
+                return self._upper.pull(uid)
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            generation = self._generation
+        record = self._lower.pull(uid)
+        self._promote(uid, record, generation)
+        return record
+
+    def pull_many(self, uids: Iterable[str]) -> list[Record]:
+        uids = list(uids)
+        records: dict[str, Record] = {}
+        for uid in dict.fromkeys(uids):
+            if self._touch(uid):
+                with suppress(FileNotFoundError):
+                    records[uid] = self._upper.pull(uid)
+        missing = [uid for uid in dict.fromkeys(uids) if uid not in records]
+        with self._lock:
+            generation = self._generation
+        for uid, record in zip(missing, self._lower.pull_many(missing), strict=True):
+            records[uid] = record
+            self._promote(uid, record, generation)
+        return [records[uid] for uid in uids]
+
+    def _invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+
+    def push(self, uid: str, record: Record, *, force: bool = False) -> None:
+        with self._writing:
+            if not force and self.exists(uid):
+                msg = f"Record with uid '{uid}' already exists"
+                raise FileExistsError(msg)
+            self._invalidate()
+            with self._claim(uid):
+                if self._write == "through":
+                    self._lower.push(uid, record, force=force)
+                with self._lock:
+                    if self._write == "through":
+                        self._dirty.discard(uid)
+                    else:
+                        self._dirty.add(uid)
+                if not self._place(uid, record) and self._write == "behind":
+                    self._lower.push(uid, record, force=True)
+                    with self._lock:
+                        self._dirty.discard(uid)
+            self._shrink()
+
+    def remove(self, uid: str) -> None:
+        with self._writing:
+            self._invalidate()
+            with self._claim(uid):
+                with self._lock:
+                    cached = uid in self._cached
+                    dirty = uid in self._dirty
+                    self._dirty.discard(uid)
+                if cached:
+                    self._drop(uid)
+                try:
+                    self._lower.remove(uid)
+                except FileNotFoundError:
+                    if not (cached or dirty):
+                        raise
+
+    def exists(self, uid: str) -> bool:
+        with self._lock:
+            if uid in self._cached:
+                return True
+        return self._lower.exists(uid)
+
+    def index(self, prefix: str | None = None) -> Iterator[str]:
+        with self._lock:
+            pending = {uid for uid in self._dirty if prefix is None or uid.startswith(prefix)}
+        for uid in self._lower.index(prefix):
+            pending.discard(uid)
+            yield uid
+        yield from sorted(pending)
+
+    def flush(self) -> None:
+        with self._writing:
+            for uid in sorted(self.dirty):
+                with self._claim(uid):
+                    if uid not in self.dirty:
+                        continue
+                    self._lower.push(uid, self._upper.pull(uid), force=True)
+                    with self._lock:
+                        self._dirty.discard(uid)
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
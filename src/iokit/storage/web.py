@@ -1,13 +1,21 @@
-__all__ = ["download_file"]
+__all__ = ["Downloader", "download_file"]
 
 from contextlib import suppress
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BufferedIOBase
 from pathlib import Path
-from typing import TYPE_CHECKING, TypeVar, overload
+from threading import Lock
+from time import sleep
+from types import TracebackType
+from typing import TYPE_CHECKING, BinaryIO, TypeVar, overload
 from urllib.parse import urlparse
 
 import requests
 from dateutil.parser import parse as datetimeparse
+from requests.adapters import HTTPAdapter
+from typing_extensions import Buffer, Self
+from urllib3.util.retry import Retry
 
+from iokit.checksum import CHUNK_SIZE, HashAlgorithm, Hasher, new_hasher
 from iokit.state import ExpectedStateType, State
 
 if TYPE_CHECKING:
@@ -15,6 +23,341 @@ if TYPE_CHECKING:
 
 S = TypeVar("S", bound=State)
 
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_RANGE_NOT_SATISFIABLE = 416
+_PARTIAL_CONTENT = 206
+_VALIDATOR_SUFFIX = ".validator"
+_STREAM_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+def _parse_time(value: str | None) -> "datetime | None":
+    if value is None:
+        return None
+    mtime: datetime | None = None
+    with suppress(Exception):
+        mtime = datetimeparse(value)
+    return mtime
+
+
+def _validator(response: requests.Response) -> str | None:
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def _complete_size(response: requests.Response) -> int | None:
+    unit, _, total = response.headers.get("Content-Range", "").partition(" */")
+    if unit != "bytes" or not total.isdigit():
+        return None
+    return int(total)
+
+
+def _read_validator(path: Path | None) -> str | None:
+    if path is None:
+        return None
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
+def _write_validator(path: Path | None, validator: str | None) -> None:
+    if path is None:
+        return
+    if validator is None:
+        path.unlink(missing_ok=True)
+    else:
+        path.write_text(validator)
+
+
+class _ByteBuffer(BufferedIOBase):
+    def __init__(self) -> None:
+        super().__init__()
+        self._data = bytearray()
+        self._size = 0
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def reserve(self, capacity: int) -> None:
+        if capacity > len(self._data):
+            self._data.extend(bytes(capacity - len(self._data)))
+
+    def write(self, data: Buffer, /) -> int:
+        view = memoryview(data).cast("B")
+        start = self._position
+        inside = max(min(len(self._data) - start, len(view)), 0)
+        self._data[start : start + inside] = view[:inside]
+        self._data += view[inside:]
+        self._position = start + len(view)
+        self._size = max(self._size, self._position)
+        return len(view)
+
+    def read(self, size: int | None = -1, /) -> bytes:
+        stop = self._size if size is None or size < 0 else min(self._position + size, self._size)
+        data = bytes(self._data[self._position : stop])
+        self._position = max(stop, self._position)
+        return data
+
+    def seek(self, offset: int, whence: int = SEEK_SET, /) -> int:
+        base = {SEEK_SET: 0, SEEK_CUR: self._position, SEEK_END: self._size}[whence]
+        self._position = base + offset
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def truncate(self, size: int | None = None, /) -> int:
+        self._size = min(self._size, self._position if size is None else size)
+        return self._size
+
+    def getbuffer(self) -> memoryview:
+        return memoryview(self._data)[: self._size]
+
+
+def _file_name(url: str, *, keep_path: bool) -> str:
+    name = urlparse(url).path
+    return name if keep_path else Path(name).name
+
+
+class Downloader:
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        timeout: float = 60,
+        retries: int = 3,
+        backoff: float = 0.5,
+        pool_size: int = 10,
+        chunk_size: int = CHUNK_SIZE,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self._timeout = timeout
+        self._retries = retries
+        self._backoff = backoff
+        self._chunk_size = chunk_size
+        self._session = requests.Session()
+        if headers is not None:
+            self._session.headers.update(headers)
+        # transport errors are retried by _fetch, which can resume the body
+        retry = Retry(
+            total=retries,
+            connect=0,
+            read=0,
+            other=0,
+            backoff_factor=backoff,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=("GET", "HEAD"),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session
+
+    def _hasher(
+        self,
+        target: BinaryIO | _ByteBuffer,
+        offset: int,
+        algorithm: HashAlgorithm | None,
+    ) -> Hasher | None:
+        if algorithm is None:
+            return None
+        hasher = new_hasher(algorithm)
+        target.seek(0)
+        while offset > 0 and (chunk := target.read(min(self._chunk_size, offset))):
+            hasher.update(chunk)
+            offset -= len(chunk)
+        target.seek(0, 2)
+        return hasher
+
+    def _restart(
+        self,
+        target: BinaryIO | _ByteBuffer,
+        algorithm: HashAlgorithm | None,
+    ) -> Hasher | None:
+        target.seek(0)
+        target.truncate()
+        return self._hasher(target, 0, algorithm)
+
+    def _consume(
+        self,
+        response: requests.Response,
+        target: BinaryIO | _ByteBuffer,
+        hasher: Hasher | None,
+    ) -> None:
+        length = response.headers.get("Content-Length", "")
+        if isinstance(target, _ByteBuffer) and length.isdigit():
+            target.reserve(target.tell() + int(length))
+        for chunk in response.iter_content(self._chunk_size):
+            target.write(chunk)
+            if hasher is not None:
+                hasher.update(chunk)
+
+    def _fetch(
+        self,
+        url: str,
+        target: BinaryIO | _ByteBuffer,
+        algorithm: HashAlgorithm | None,
+        validator_path: Path | None = None,
+    ) -> tuple["datetime | None", str | None]:
+        validator = _read_validator(validator_path)
+        hasher = self._hasher(target, target.seek(0, 2), algorithm)
+        attempt = 0
+        while True:
+            offset = target.seek(0, 2)
+            if offset and validator is None:
+                # partial data without a validator cannot be matched to the remote file
+                offset, hasher = 0, self._restart(target, algorithm)
+            headers = (
+                {"Range": f"bytes={offset}-", "If-Range": validator}
+                if offset and validator is not None
+                else {}
+            )
+            try:
+                with self._session.get(
+                    url,
+                    headers=headers,
+                    stream=True,
+                    timeout=self._timeout,
+                ) as response:
+                    mtime = _parse_time(response.headers.get("Last-Modified"))
+                    if offset and response.status_code == _RANGE_NOT_SATISFIABLE:
+                        if _complete_size(response) == offset:
+                            return mtime, None if hasher is None else hasher.hexdigest()
+                        validator = None
+                        continue
+                    if not response.ok:
+                        msg = (
+                            f"Failed to download file: uri='{url}', "
+                            f"status_code={response.status_code}"
+                        )
+                        raise FileNotFoundError(msg)
+                    if offset and response.status_code != _PARTIAL_CONTENT:
+                        hasher = self._restart(target, algorithm)
+                    validator = _validator(response)
+                    _write_validator(validator_path, validator)
+                    self._consume(response, target, hasher)
+                    return mtime, None if hasher is None else hasher.hexdigest()
+            except _STREAM_ERRORS:
+                attempt += 1
+                if attempt > self._retries:
+                    raise
+                sleep(self._backoff * 2 ** (attempt - 1))
+
+    def _verify(self, url: str, hexdigest: str | None, checksum: str | None) -> None:
+        if checksum is not None and hexdigest != checksum:
+            msg = f"Checksum mismatch for uri='{url}': expected {checksum!r}, got {hexdigest!r}"
+            raise ValueError(msg)
+
+    @overload
+    def download(
+        self,
+        url: str,
+        expected_type: ExpectedStateType[S],
+        *,
+        keep_path: bool = False,
+        checksum: str | None = None,
+        algorithm: HashAlgorithm = "sha256",
+    ) -> S: ...
+
+    @overload
+    def download(
+        self,
+        url: str,
+        expected_type: None = None,
+        *,
+        keep_path: bool = False,
+        checksum: str | None = None,
+        algorithm: HashAlgorithm = "sha256",
+    ) -> State: ...
+
+    def download(  # noqa: PLR0913
+        self,
+        url: str,
+        expected_type: ExpectedStateType[S] | None = None,
+        *,
+        keep_path: bool = False,
+        checksum: str | None = None,
+        algorithm: HashAlgorithm = "sha256",
+    ) -> S | State:
+        buffer = _ByteBuffer()
+        mtime, hexdigest = self._fetch(url, buffer, None if checksum is None else algorithm)
+        self._verify(url, hexdigest, checksum)
+        data = buffer.getbuffer()
+        name = _file_name(url, keep_path=keep_path)
+        return State(data, name=name, time=mtime).cast(expected_type)
+
+    def download_to(  # noqa: PLR0913
+        self,
+        url: str,
+        path: Path | str,
+        *,
+        resume: bool = True,
+        checksum: str | None = None,
+        algorithm: HashAlgorithm = "sha256",
+    ) -> Path:
+        path = Path(path)
+        if path.is_dir():
+            path = path / _file_name(url, keep_path=False)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.part")
+        validator = partial.with_name(f"{partial.name}{_VALIDATOR_SUFFIX}")
+        if not resume:
+            partial.unlink(missing_ok=True)
+            validator.unlink(missing_ok=True)
+        with partial.open("a+b") as file:
+            hashing = None if checksum is None else algorithm
+            _, hexdigest = self._fetch(url, file, hashing, validator)
+        validator.unlink(missing_ok=True)
+        try:
+            self._verify(url, hexdigest, checksum)
+        except ValueError:
+            partial.unlink()
+            raise
+        partial.replace(path)
+        return path
+
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+_DOWNLOADERS: dict[float, Downloader] = {}
+_DOWNLOADERS_LOCK = Lock()
+
+
+def _default_downloader(timeout: float) -> Downloader:
+    with _DOWNLOADERS_LOCK:
+        downloader = _DOWNLOADERS.get(timeout)
+        if downloader is None:
+            downloader = _DOWNLOADERS[timeout] = Downloader(timeout=timeout)
+        return downloader
+
 
 @overload
 def download_file(
@@ -23,6 +366,9 @@ def download_file(
     *,
     timeout: int = 60,
     keep_path: bool = False,
+    checksum: str | None = None,
+    algorithm: HashAlgorithm = "sha256",
+    downloader: Downloader | None = None,
 ) -> S: ...
 
 
@@ -33,29 +379,27 @@ def download_file(
     *,
     timeout: int = 60,
     keep_path: bool = False,
+    checksum: str | None = None,
+    algorithm: HashAlgorithm = "sha256",
+    downloader: Downloader | None = None,
 ) -> State: ...
 
 
-def download_file(
+def download_file(  # noqa: PLR0913
     url: str,
     expected_type: ExpectedStateType[S] | None = None,
     *,
     timeout: int = 60,
     keep_path: bool = False,
+    checksum: str | None = None,
+    algorithm: HashAlgorithm = "sha256",
+    downloader: Downloader | None = None,
 ) -> S | State:
-    response = requests.get(url, timeout=timeout)
-    if not response.ok:
-        msg = f"Failed to download file: uri='{url}', status_code={response.status_code}"
-        raise FileNotFoundError(msg)
-
-    mtime_str = response.headers.get("Last-Modified")
-    mtime: datetime | None = None
-    if mtime_str is not None:
-        with suppress(Exception):
-            mtime = datetimeparse(mtime_str)
-
-    name = urlparse(url).path
-    if not keep_path:
-        name = Path(name).name
-
-    return State(response.content, name=name, time=mtime).cast(expected_type)
+    downloader = downloader or _default_downloader(timeout)
+    return downloader.download(
+        url,
+        expected_type,
+        keep_path=keep_path,
+        checksum=checksum,
+        algorithm=algorithm,
+    )
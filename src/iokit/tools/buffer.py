@@ -0,0 +1,83 @@
+__all__ = ["MemoryBuffer"]
+
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BufferedIOBase
+
+from typing_extensions import Buffer
+
+_LINE_CHUNK_SIZE = 8192
+
+
+class MemoryBuffer(BufferedIOBase):
+    def __init__(self, data: Buffer, /) -> None:
+        super().__init__()
+        self._view = memoryview(data).cast("B")
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def getbuffer(self) -> memoryview:
+        return self._view.toreadonly()
+
+    def _check_closed(self) -> None:
+        if self.closed:
+            msg = "I/O operation on closed buffer"
+            raise ValueError(msg)
+
+    def _slice(self, size: int | None) -> memoryview:
+        self._check_closed()
+        start = min(self._position, len(self._view))
+        stop = len(self._view) if size is None or size < 0 else min(start + size, len(self._view))
+        self._position = stop
+        return self._view[start:stop]
+
+    def read(self, size: int | None = -1, /) -> bytes:
+        return bytes(self._slice(size))
+
+    def read1(self, size: int | None = -1, /) -> bytes:
+        return self.read(size)
+
+    def readinto(self, buffer: Buffer, /) -> int:
+        target = memoryview(buffer).cast("B")
+        chunk = self._slice(len(target))
+        target[: len(chunk)] = chunk
+        return len(chunk)
+
+    def readline(self, size: int | None = -1, /) -> bytes:
+        self._check_closed()
+        limit = len(self._view) if size is None or size < 0 else self._position + size
+        limit = min(limit, len(self._view))
+        start = stop = self._position
+        while stop < limit:
+            chunk = bytes(self._view[stop : min(stop + _LINE_CHUNK_SIZE, limit)])
+            newline = chunk.find(b"\n")
+            if newline >= 0:
+                stop += newline + 1
+                break
+            stop += len(chunk)
+        self._position = stop
+        return bytes(self._view[start:stop])
+
+    def seek(self, offset: int, whence: int = SEEK_SET, /) -> int:
+        self._check_closed()
+        if whence == SEEK_SET:
+            position = offset
+        elif whence == SEEK_CUR:
+            position = self._position + offset
+        elif whence == SEEK_END:
+            position = len(self._view) + offset
+        else:
+            msg = f"Invalid whence ({whence})"
+            raise ValueError(msg)
+        if position < 0:
+            msg = f"Negative seek position {position}"
+            raise ValueError(msg)
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        self._check_closed()
+        return self._position
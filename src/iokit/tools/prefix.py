@@ -0,0 +1,15 @@
+__all__ = ["prefix_upper_bound"]
+
+_MAX_CODE_POINT = 0x10FFFF
+_SURROGATES = range(0xD800, 0xE000)
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    while prefix:
+        last = ord(prefix[-1]) + 1
+        if last in _SURROGATES:
+            last = _SURROGATES.stop
+        if last <= _MAX_CODE_POINT:
+            return prefix[:-1] + chr(last)
+        prefix = prefix[:-1]
+    return None
@@ -0,0 +1,91 @@
+import asyncio
+from pathlib import Path
+from threading import Lock
+from time import sleep
+
+import pytest
+
+from iokit import AsyncLocalStorage, AsyncMemoryStorage, AsyncStorageAdapter
+from iokit.storage.index import INDEX_FILE
+from iokit.storage.layout import shard_path
+from iokit.storage.local import MemoryStorage, StateStorage
+
+
+def test_async_memory_storage() -> None:
+    async def run() -> None:
+        storage = AsyncMemoryStorage(concurrency=2)
+        await storage.push_many((f"item-{i}", bytes([i])) for i in range(10))
+        assert await storage.exists("item-3")
+        assert not await storage.exists("missing")
+        assert sorted(await storage.index("item-1")) == ["item-1"]
+        records = await storage.pull_many(f"item-{i}" for i in range(10))
+        assert records == [bytes([i]) for i in range(10)]
+        with pytest.raises(FileExistsError):
+            await storage.push("item-0", b"other")
+        await storage.remove("item-0")
+        with pytest.raises(FileNotFoundError):
+            await storage.pull("item-0")
+
+    asyncio.run(run())
+
+
+def test_async_local_storage(tmp_path: Path) -> None:
+    async def run() -> None:
+        async with AsyncLocalStorage(tmp_path, concurrency=4) as storage:
+            await storage.push_many([("a", b"alpha"), ("b", b"beta")])
+            assert sorted(await storage.index()) == ["a", "b"]
+            assert await storage.pull_many(["b", "a"]) == [b"beta", b"alpha"]
+            await storage.push("a", b"other", force=True)
+            assert await storage.pull("a") == b"other"
+
+    asyncio.run(run())
+    assert (tmp_path / "b").read_bytes() == b"beta"
+
+
+def test_async_local_storage_options(tmp_path: Path) -> None:
+    async def run() -> None:
+        async with AsyncLocalStorage(tmp_path, fanout=1, fsync="file", indexed=True) as storage:
+            await storage.push_many([("a", b"alpha"), ("b", b"beta")])
+            assert sorted(await storage.index()) == ["a", "b"]
+
+    asyncio.run(run())
+    assert (tmp_path / INDEX_FILE).exists()
+    assert shard_path(tmp_path, "b", 1).read_bytes() == b"beta"
+
+
+def test_async_storage_adapter_concurrency() -> None:
+    lock = Lock()
+    active = peak = 0
+
+    class SlowStorage(MemoryStorage):
+        def pull(self, uid: str) -> bytes:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            sleep(0.01)
+            with lock:
+                active -= 1
+            return super().pull(uid)
+
+    backend = SlowStorage()
+    for i in range(8):
+        backend.push(str(i), bytes([i]))
+
+    async def run() -> list[bytes]:
+        async with AsyncStorageAdapter(backend, concurrency=3) as storage:
+            return await storage.pull_many(str(i) for i in range(8))
+
+    assert asyncio.run(run()) == [bytes([i]) for i in range(8)]
+    assert 1 < peak <= 3
+
+
+def test_async_storage_adapter_state_storage() -> None:
+    async def run() -> list[object]:
+        async with AsyncStorageAdapter(StateStorage(MemoryStorage())) as storage:
+            await storage.push_many([("config", {"a": 1}), ("note", "hello")])
+            return await storage.pull_many(["note", "config"])
+
+    assert asyncio.run(run()) == ["hello", {"a": 1}]
+    with pytest.raises(ValueError, match="Concurrency"):
+        AsyncMemoryStorage(concurrency=0)
@@ -0,0 +1,119 @@
+from pathlib import Path
+from threading import Event, Thread
+from time import sleep
+
+import numpy as np
+import pytest
+
+from iokit import CachedStorage
+from iokit.storage.local import LocalStorage, MemoryStorage, StateStorage
+
+
+class CountingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.pulls = 0
+
+    def pull(self, uid: str) -> bytes:
+        self.pulls += 1
+        return super().pull(uid)
+
+
+def test_cached_storage_hits_and_invalidation() -> None:
+    backend = CountingStorage()
+    storage = CachedStorage(backend)
+    storage.push("a", b"alpha")
+    assert storage.pull("a") == b"alpha"
+    assert storage.pull("a") == b"alpha"
+    assert backend.pulls == 1
+    storage.push("a", b"other", force=True)
+    assert storage.pull("a") == b"other"
+    assert backend.pulls == 2
+    storage.remove("a")
+    assert not storage.exists("a")
+    with pytest.raises(FileNotFoundError):
+        storage.pull("a")
+    stats = storage.stats
+    assert (stats.hits, stats.misses) == (1, 3)
+
+
+def test_cached_storage_eviction() -> None:
+    backend = MemoryStorage()
+    backend.push_many((str(i), bytes(10)) for i in range(5))
+    storage = CachedStorage(backend, max_bytes=25)
+    storage.pull_many(["0", "1"])
+    storage.pull("0")
+    storage.pull("2")
+    assert storage.stats.evictions == 1
+    assert storage.stats.bytes == 20
+    storage.pull("0")
+    assert storage.stats.hits == 2
+    storage.pull("1")
+    assert storage.stats.misses == 4
+
+    storage = CachedStorage(backend, max_items=1)
+    assert storage.pull_many(["3", "4", "3"]) == [bytes(10)] * 3
+    assert storage.stats.items == 1
+    assert storage.stats.evictions == 1
+
+    storage = CachedStorage(backend, max_bytes=5)
+    storage.pull("0")
+    assert storage.stats.items == 0
+
+
+def test_cached_storage_ttl() -> None:
+    backend = CountingStorage()
+    backend.push("a", b"alpha")
+    storage = CachedStorage(backend, ttl=0.01)
+    storage.pull("a")
+    storage.pull("a")
+    sleep(0.02)
+    storage.pull("a")
+    assert backend.pulls == 2
+
+
+def test_cached_storage_raw_and_decoded(tmp_path: Path) -> None:
+    raw = CachedStorage(LocalStorage(tmp_path))
+    states = StateStorage(raw)
+    states.push("array", np.arange(4))
+    np.testing.assert_array_equal(states.pull("array"), np.arange(4))
+    states.pull("array")
+    assert raw.stats.hits == 1
+
+    decoded = CachedStorage(StateStorage(LocalStorage(tmp_path)))
+    first = decoded.pull("array")
+    assert decoded.pull("array") is first
+    assert decoded.stats.bytes == first.nbytes
+
+    copied = CachedStorage(StateStorage(LocalStorage(tmp_path)), copy=True)
+    first = copied.pull("array")
+    first[0] = 100
+    second, third = copied.pull_many(["array", "array"])
+    np.testing.assert_array_equal(second, np.arange(4))
+    assert second is not third
+    assert copied.stats.hits == 2
+
+
+def test_cached_storage_concurrent_push() -> None:
+    class SlowStorage(MemoryStorage):
+        def __init__(self) -> None:
+            super().__init__()
+            self.pulled = Event()
+            self.release = Event()
+
+        def pull(self, uid: str) -> bytes:
+            record = super().pull(uid)
+            self.pulled.set()
+            self.release.wait()
+            return record
+
+    backend = SlowStorage()
+    storage = CachedStorage(backend)
+    storage.push("a", b"old")
+    reader = Thread(target=storage.pull, args=("a",))
+    reader.start()
+    backend.pulled.wait()
+    storage.push("a", b"new", force=True)
+    backend.release.set()
+    reader.join()
+    assert storage.pull("a") == b"new"
@@ -0,0 +1,41 @@
+import hashlib
+from io import BytesIO
+
+import pytest
+import xxhash
+
+from iokit import Dat, load_file, save_temp
+from iokit.checksum import stream_hexdigest, stream_hexdigest_many
+
+
+def test_checksum_state() -> None:
+    data = bytes(range(256)) * 1000
+    state = Dat(data, name="data")
+    assert state.hexdigest("sha256") == hashlib.sha256(data).hexdigest()
+    assert state.hexdigest("xxh128") == xxhash.xxh128(data).hexdigest()
+    state.hexdigest_assert("md5", hashlib.md5(data).hexdigest())  # noqa: S324
+    with pytest.raises(AssertionError):
+        state.hexdigest_assert("md5", "0" * 32)
+    with pytest.raises(ValueError, match="Unknown hash algorithm"):
+        state.hexdigest("crc32")  # type: ignore[arg-type]
+
+
+def test_checksum_many() -> None:
+    data = b"Hello, World!" * 10_000
+    state = Dat(data, name="data")
+    digests = state.hexdigest_many(["xxh128", "sha256"])
+    assert digests == {
+        "xxh128": xxhash.xxh128(data).hexdigest(),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+    with save_temp(state) as path:
+        assert load_file(path, mmap=True).hexdigest_many(["xxh128", "sha256"]) == digests
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096, 1 << 20])
+def test_checksum_stream(chunk_size: int) -> None:
+    data = bytes(range(256)) * 100
+    expected = hashlib.blake2b(data).hexdigest()
+    assert stream_hexdigest(BytesIO(data), "blake2b", chunk_size=chunk_size) == expected
+    digests = stream_hexdigest_many(BytesIO(data), ["blake2b", "xxh64"], chunk_size=chunk_size)
+    assert digests == {"blake2b": expected, "xxh64": xxhash.xxh64(data).hexdigest()}
@@ -0,0 +1,38 @@
+import hashlib
+from pathlib import Path
+
+from iokit import Json, Txt, checksum_tree, save_file, verify_tree
+from iokit.storage.local import LocalStorage, MemoryStorage
+
+
+def test_checksum_tree_local(tmp_path: Path) -> None:
+    states = [Txt(f"text {i}", name=f"dir{i % 3}/text{i}") for i in range(20)]
+    for state in states:
+        save_file(state, root=tmp_path, parents=True)
+    manifest = checksum_tree(tmp_path, "sha256", workers=4)
+    assert manifest == {str(s.name): hashlib.sha256(s.data).hexdigest() for s in states}
+    assert checksum_tree(LocalStorage(tmp_path), "sha256", chunk_size=3) == manifest
+    assert verify_tree(tmp_path, manifest, "sha256") == []
+
+
+def test_verify_tree_changes(tmp_path: Path) -> None:
+    storage = LocalStorage(tmp_path)
+    for i in range(5):
+        storage.push(f"record{i}.json", Json({"i": i}).data)
+    manifest = checksum_tree(storage, workers=2)
+    storage.push("record1.json", Json({"i": -1}).data, force=True)
+    storage.remove("record2.json")
+    storage.push("record9.json", Json({"i": 9}).data)
+    assert verify_tree(storage, manifest) == ["record1.json", "record2.json", "record9.json"]
+
+
+def test_checksum_tree_memory() -> None:
+    storage = MemoryStorage()
+    storage.push("a", b"first")
+    storage.push("b", b"second")
+    assert checksum_tree(storage, "md5") == {
+        "a": hashlib.md5(b"first").hexdigest(),  # noqa: S324
+        "b": hashlib.md5(b"second").hexdigest(),  # noqa: S324
+    }
+    assert list(checksum_tree(storage, "md5", prefix="b")) == ["b"]
+    assert verify_tree(storage, {"a": "", "b": ""}, "md5", prefix="b") == ["b"]
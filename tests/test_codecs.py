@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from iokit import Json, Lz4, Npy, Xz, Zst, auto_state, load_file, save_temp
+from iokit.storage.local import MemoryStorage, StateStorage
+
+
+def test_xz_state() -> None:
+    data = {"key": "value" * 100}
+    state = Xz(Json(data, name="data"), compression=1)
+    assert state.name == "data.json.xz"
+    assert state.size < Json(data).size
+    with save_temp(state) as path:
+        loaded = load_file(path)
+        assert isinstance(loaded, Xz)
+        assert loaded.load().load() == data
+
+
+def test_zst_state() -> None:
+    pytest.importorskip("zstandard")
+    state = Zst(Npy(np.zeros(1000), name="zeros"), compression=1, threads=2)
+    assert state.name == "zeros.npy.zst"
+    np.testing.assert_array_equal(state.load().load(), np.zeros(1000))
+
+
+def test_lz4_state() -> None:
+    pytest.importorskip("lz4")
+    state = Lz4(Json({"a": 1}, name="data"))
+    assert state.name == "data.json.lz4"
+    assert state.load().load() == {"a": 1}
+
+
+def test_auto_state_compression() -> None:
+    assert auto_state({"a": 1}, name="a", compression=True).name == "a.json.gz"
+    assert auto_state({"a": 1}, name="a", compression=5).name == "a.json.gz"
+    assert auto_state({"a": 1}, name="a", compression="xz").name == "a.json.xz"
+    assert auto_state({"a": 1}, name="a", compression=("xz", 0)).name == "a.json.xz"
+    with pytest.raises(ValueError, match="codec"):
+        auto_state({"a": 1}, name="a", compression="brotli")  # type: ignore[arg-type]
+
+
+def test_state_storage_codec() -> None:
+    backend = MemoryStorage()
+    storage = StateStorage(backend, compression=("xz", 1))
+    storage.push("config", {"a": 1})
+    assert list(backend.index()) == ["config.json.xz"]
+    assert storage.pull("config") == {"a": 1}
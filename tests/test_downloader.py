@@ -0,0 +1,146 @@
+import hashlib
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+from typing import ClassVar
+
+import pytest
+import requests
+import urllib3.util.connection
+
+from iokit import Downloader, Json, download_file
+
+PAYLOAD = bytes(range(256)) * 64
+ETAG = '"v1"'
+
+
+class Handler(BaseHTTPRequestHandler):
+    failures = 0
+    ranges: ClassVar[list[str | None]] = []
+
+    def log_message(self, *_: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path == "/missing":
+            self.send_error(404)
+            return
+        if self.path.endswith(".json"):
+            body = b'{"a": 1}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Last-Modified", "Wed, 21 Oct 2015 07:28:00 GMT")
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        header = self.headers.get("Range")
+        type(self).ranges.append(header)
+        if self.headers.get("If-Range") != ETAG:
+            header = None
+        start = int(header.removeprefix("bytes=").removesuffix("-")) if header else 0
+        if start >= len(PAYLOAD):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(PAYLOAD)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = PAYLOAD[start:]
+        self.send_response(206 if header else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", ETAG)
+        self.end_headers()
+        if type(self).failures > 0:
+            type(self).failures -= 1
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            self.connection.close()
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    Handler.failures = 0
+    Handler.ranges = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_download_state(server: str) -> None:
+    state = download_file(f"{server}/data/config.json")
+    assert isinstance(state, Json)
+    assert state.load() == {"a": 1}
+    assert state.time.year == 2015
+    with pytest.raises(FileNotFoundError):
+        download_file(f"{server}/missing")
+
+
+def test_download_resumes_after_disconnect(server: str) -> None:
+    Handler.failures = 1
+    checksum = hashlib.sha256(PAYLOAD).hexdigest()
+    with Downloader(backoff=0, chunk_size=1024) as downloader:
+        state = downloader.download(f"{server}/blob.bin", checksum=checksum)
+    assert state.data == PAYLOAD
+    assert Handler.ranges[0] is None
+    assert Handler.ranges[1] == f"bytes={len(PAYLOAD) // 2}-"
+
+
+def test_download_retries_once_per_attempt(monkeypatch: pytest.MonkeyPatch) -> None:
+    attempts = []
+
+    def refuse(*_: object, **__: object) -> None:
+        attempts.append(None)
+        raise ConnectionRefusedError
+
+    monkeypatch.setattr(urllib3.util.connection, "create_connection", refuse)
+    with Downloader(retries=2, backoff=0) as downloader, pytest.raises(requests.ConnectionError):
+        downloader.download("http://127.0.0.1:9/blob.bin")
+    assert len(attempts) == 3
+
+
+def test_download_to_file(server: str, tmp_path: Path) -> None:
+    partial = tmp_path / "blob.bin.part"
+    partial.write_bytes(PAYLOAD[:1000])
+    (tmp_path / "blob.bin.part.validator").write_text(ETAG)
+    checksum = hashlib.sha256(PAYLOAD).hexdigest()
+    with Downloader() as downloader:
+        path = downloader.download_to(f"{server}/blob.bin", tmp_path, checksum=checksum)
+        assert path == tmp_path / "blob.bin"
+        assert path.read_bytes() == PAYLOAD
+        assert not partial.exists()
+        assert not (tmp_path / "blob.bin.part.validator").exists()
+        assert Handler.ranges == ["bytes=1000-"]
+        with pytest.raises(ValueError, match="Checksum"):
+            downloader.download_to(f"{server}/blob.bin", tmp_path / "other.bin", checksum="0")
+        assert not (tmp_path / "other.bin.part").exists()
+
+
+@pytest.mark.parametrize(
+    ("partial", "validator", "ranges"),
+    [
+        (b"stale" * 100, None, [None]),
+        (b"stale" * 100, '"v0"', ["bytes=500-"]),
+        (PAYLOAD, ETAG, ["bytes=16384-"]),
+        (PAYLOAD + b"extra", ETAG, ["bytes=16389-", None]),
+    ],
+    ids=["unvalidated", "changed", "complete", "oversized"],
+)
+def test_download_to_validates_partial(
+    server: str,
+    tmp_path: Path,
+    partial: bytes,
+    validator: str | None,
+    ranges: list[str | None],
+) -> None:
+    (tmp_path / "blob.bin.part").write_bytes(partial)
+    if validator is not None:
+        (tmp_path / "blob.bin.part.validator").write_text(validator)
+    with Downloader() as downloader:
+        path = downloader.download_to(f"{server}/blob.bin", tmp_path)
+    assert path.read_bytes() == PAYLOAD
+    assert Handler.ranges == ranges
@@ -1,8 +1,31 @@
+import os
+from io import BytesIO
+from pathlib import Path
 from typing import Any
 
 import pytest
+from cryptography.exceptions import InvalidTag
 
-from iokit import Enc, Json
+from iokit import (
+    Enc,
+    Json,
+    SecretState,
+    clear_key_cache,
+    decrypt,
+    decrypt_stream,
+    encrypt,
+    encrypt_stream,
+    load_file,
+    set_key_cache_size,
+)
+from iokit.extensions.enc import (
+    _HEADER,
+    _KEY_DERIVATIONS,
+    _LENGTH,
+    DEFAULT_SALT,
+    KEY_CACHE_SIZE,
+    KeyDerivation,
+)
 
 
 def test_encryption() -> None:
@@ -31,3 +54,133 @@ def test_encryption() -> None:
     assert loaded["dict"] == {"a": 1, "b": 2}
     assert loaded["str"] == "hello"
     assert loaded["int"] == 42
+
+
+def test_encryption_key_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[bytes] = []
+    legacy = _KEY_DERIVATIONS["legacy"]
+
+    def derive(password: bytes, salt: bytes) -> bytes:
+        calls.append(password)
+        return legacy(password, salt)
+
+    monkeypatch.setitem(_KEY_DERIVATIONS, "legacy", derive)
+    clear_key_cache()
+    state = Enc(Json({"a": 1}, name="cached"), password="pA$sw0Rd")
+    for _ in range(5):
+        assert state.load().load(password="pA$sw0Rd").load() == {"a": 1}
+    assert len(calls) == 1
+    set_key_cache_size(0)
+    try:
+        assert state.load().load(password="pA$sw0Rd").load() == {"a": 1}
+        assert state.load().load(password="pA$sw0Rd").load() == {"a": 1}
+        assert len(calls) == 3
+    finally:
+        set_key_cache_size(KEY_CACHE_SIZE)
+
+
+@pytest.mark.parametrize("kdf", ["pbkdf2", "scrypt"])
+def test_encryption_native_kdf(kdf: KeyDerivation) -> None:
+    json = Json({"a": [1, 2, 3]}, name="native")
+    state = Enc(json, password="pA$sw0Rd", kdf=kdf)
+    assert state.data.startswith(b"IOKE")
+    assert state.data != Enc(json, password="pA$sw0Rd", kdf=kdf).data
+    loaded = state.load().load(password="pA$sw0Rd")
+    assert loaded.name == "native.json"
+    assert loaded.load() == {"a": [1, 2, 3]}
+    with pytest.raises(ValueError, match="Decryption failed"):
+        state.load().load(password="password")
+    # the nonce is part of the authenticated header, the rest is ciphertext
+    for position in (_HEADER.size - 1, _HEADER.size + 1):
+        tampered = bytearray(state.data)
+        tampered[position] ^= 1
+        with pytest.raises(ValueError, match="Decryption failed") as error:
+            decrypt(bytes(tampered), password=b"pA$sw0Rd", salt=DEFAULT_SALT)
+        assert isinstance(error.value.__cause__, InvalidTag)
+
+
+def test_encryption_legacy_format() -> None:
+    payload = b"legacy payload"
+    data = encrypt(payload, password=b"secret", salt=b"salt")
+    assert len(data) == 32
+    assert decrypt(data, password=b"secret", salt=b"salt") == payload
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test_encryption_stream(chunk_size: int) -> None:
+    payload = os.urandom(100_000)
+    encrypted = BytesIO()
+    encrypt_stream(BytesIO(payload), encrypted, "pA$sw0Rd", chunk_size=chunk_size)
+    assert encrypted.getvalue().startswith(b"IOKE")
+    assert decrypt(encrypted.getvalue(), password=b"pA$sw0Rd", salt=DEFAULT_SALT) == payload
+    decrypted = BytesIO()
+    encrypted.seek(0)
+    decrypt_stream(encrypted, decrypted, "pA$sw0Rd", chunk_size=chunk_size)
+    assert decrypted.getvalue() == payload
+
+
+def test_encryption_stream_legacy() -> None:
+    payload = b"legacy payload" * 1000
+    legacy = encrypt(payload, password=b"secret", salt=DEFAULT_SALT)
+    decrypted = BytesIO()
+    decrypt_stream(BytesIO(legacy), decrypted, "secret", chunk_size=7)
+    assert decrypted.getvalue() == payload
+
+
+def test_encryption_stream_tampered() -> None:
+    encrypted = BytesIO()
+    encrypt_stream(BytesIO(b"x" * 10_000), encrypted, "pA$sw0Rd")
+    data = bytearray(encrypted.getvalue())
+    data[100] ^= 1
+    decrypted = BytesIO()
+    with pytest.raises(ValueError, match="Decryption failed"):
+        decrypt_stream(BytesIO(bytes(data)), decrypted, "pA$sw0Rd", chunk_size=1000)
+    assert decrypted.getvalue() == b""
+
+
+def test_encryption_stream_enc_file(tmp_path: Path) -> None:
+    source = tmp_path / "data.npy"
+    source.write_bytes(os.urandom(50_000))
+    target = tmp_path / "data.enc"
+    with source.open("rb") as src, target.open("wb") as dst:
+        SecretState.pack_stream(src, dst, "data.npy", "pA$sw0Rd", chunk_size=4096)
+    state = load_file(target, Enc).load().load("pA$sw0Rd")
+    assert state.name == "data.npy"
+    assert state.data == source.read_bytes()
+    restored = tmp_path / "restored"
+    with target.open("rb") as src, restored.open("wb") as dst:
+        name = SecretState.unpack_stream(src, dst, "pA$sw0Rd", chunk_size=4096)
+    assert name == "data.npy"
+    assert restored.read_bytes() == source.read_bytes()
+    legacy = Enc(Json({"a": 1}, name="legacy"), password="pA$sw0Rd")
+    restored = tmp_path / "legacy.json"
+    with restored.open("wb") as dst:
+        name = SecretState.unpack_stream(legacy.buffer, dst, "pA$sw0Rd")
+    assert name == "legacy.json"
+    assert load_file(restored, Json).load() == {"a": 1}
+
+
+def test_encryption_stream_unpack_size_mismatch() -> None:
+    name = b"data.bin"
+    payload = _LENGTH.pack(len(name)) + name + _LENGTH.pack(100) + b"short"
+    encrypted = BytesIO()
+    encrypt_stream(BytesIO(payload), encrypted, "pA$sw0Rd")
+    encrypted.seek(0)
+    restored = BytesIO()
+    with pytest.raises(ValueError, match="size mismatch"):
+        SecretState.unpack_stream(encrypted, restored, "pA$sw0Rd")
+    assert restored.getvalue() == b""
+
+
+def test_encryption_stream_requires_seekable_target() -> None:
+    class Pipe(BytesIO):
+        def seekable(self) -> bool:
+            return False
+
+    encrypted = BytesIO()
+    encrypt_stream(BytesIO(b"payload"), encrypted, "pA$sw0Rd")
+    encrypted.seek(0)
+    target = Pipe()
+    with pytest.raises(ValueError, match="seekable"):
+        decrypt_stream(encrypted, target, "pA$sw0Rd")
+    assert target.getvalue() == b""
@@ -1,6 +1,10 @@
+import gzip
 import os
 
-from iokit import Gzip, Json, load_file, save_temp
+import pandas as pd
+import pytest
+
+from iokit import Csv, Gzip, Json, Jsonl, State, Streamable, Tsv, Txt, load_file, save_temp
 
 
 def random_utf8_string(length: int) -> str:
@@ -40,3 +44,57 @@ def test_gzip_save_load_file() -> None:
     with save_temp(state) as path:
         assert load_file(path, Gzip).load().load() == data
         assert path.as_posix().endswith(".json.gz")
+
+
+def test_gzip_iter_txt() -> None:
+    lines = ["first", "second", "", "третий"]
+    state = Gzip(Txt("\n".join(lines), name="lines"))
+    assert list(state.iter()) == lines
+
+
+def test_gzip_iter_jsonl() -> None:
+    records = [{"a": i, "b": str(i)} for i in range(10)]
+    state = Gzip(Jsonl(records, name="records"))
+    assert list(state.iter()) == records
+
+
+def test_gzip_iter_csv() -> None:
+    frame = pd.DataFrame({"a": range(10), "b": [str(i) for i in range(10)]})
+    state = Gzip(Csv(frame, name="frame"))
+    chunks = list(state.iter(chunksize=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert pd.concat(chunks).reset_index(drop=True).equals(state.load().load())
+
+
+def test_gzip_iter_unsupported() -> None:
+    state = Gzip(Json({"a": 1}, name="data"))
+    with pytest.raises(NotImplementedError):
+        list(state.iter())
+
+
+@pytest.mark.parametrize("size", [0, 1000, 4096, 10_000])
+def test_gzip_parallel(size: int) -> None:
+    data = os.urandom(size // 2) + b"iokit" * (size // 10)
+    state = State(data, name="data.bin")
+    compressed = Gzip(state, workers=4, block_size=1024)
+    assert gzip.decompress(compressed.data) == data
+    assert compressed.load().data == data
+    assert compressed.name == "data.bin.gz"
+
+
+def test_gzip_parallel_ratio() -> None:
+    data = b"".join(str(i).encode() for i in range(100_000))
+    state = State(data, name="data.bin")
+    serial = Gzip(state, compression=6)
+    parallel = Gzip(state, compression=6, workers=4, block_size=1 << 16)
+    assert parallel.load().data == data
+    assert parallel.size < serial.size * 1.05
+
+
+def test_gzip_iter_options() -> None:
+    frame = pd.DataFrame({"a": range(6), "b": range(6)})
+    state = Gzip(Tsv(frame, name="frame"))
+    chunks = list(state.iter(chunksize=4, usecols=["a"]))
+    assert [list(chunk.columns) for chunk in chunks] == [["a"], ["a"]]
+    assert issubclass(Tsv, Streamable)
+    assert not issubclass(Json, Streamable)
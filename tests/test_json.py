@@ -1,6 +1,10 @@
+from datetime import datetime
+from importlib.util import find_spec
 from typing import Any
 
-from iokit.extensions.json import Json
+import pytest
+
+from iokit.extensions.json import Json, JsonEngine
 
 
 def test_json_empty() -> None:
@@ -56,3 +60,43 @@ def test_json_is_sequence() -> None:
     assert state.load() == [1, 2, 3]
     assert state.size == 9
     assert state.data == b"[1, 2, 3]"
+
+
+ENGINES = [
+    pytest.param(engine, marks=pytest.mark.skipif(find_spec(engine) is None, reason="missing"))
+    for engine in ("orjson", "ujson")
+]
+
+
+@pytest.mark.parametrize("engine", ["auto", "stdlib", *ENGINES])
+def test_json_engine_compact(engine: JsonEngine) -> None:
+    data = {"key": "значение", "list": [1, 2.5, None, True], "nested": {"1": [{}]}}
+    state = Json(data, name="engine", compact=True, engine=engine)
+    assert state.data == Json(data, compact=True, engine="stdlib").data
+    assert state.load(engine=engine) == data
+    assert state.load(engine="stdlib") == data
+
+
+@pytest.mark.parametrize("engine", ["auto", "stdlib", *ENGINES])
+def test_json_engine_nan(engine: JsonEngine) -> None:
+    with pytest.raises(ValueError, match="Out of range float values"):
+        Json([float("nan")], compact=True, engine=engine)
+    state = Json([float("inf")], compact=True, allow_nan=True, engine=engine)
+    assert state.data == b"[Infinity]"
+    assert state.load(engine=engine) == [float("inf")]
+
+
+def test_json_engine_unsupported_options() -> None:
+    if find_spec("orjson") is not None:
+        with pytest.raises(ValueError, match="does not support"):
+            Json({}, compact=False, engine="orjson")
+    with pytest.raises(ValueError, match="Unknown JSON engine"):
+        Json({}, engine="simplejson")  # type: ignore[arg-type]
+
+
+def test_json_engine_auto_matches_stdlib() -> None:
+    data = [1e16, 1e-7, 0.1, {"nested": [float("inf")]}]
+    state = Json(data, compact=True, allow_nan=True)
+    assert state.data == b'[1e+16,1e-07,0.1,{"nested":[Infinity]}]'
+    with pytest.raises(TypeError):
+        Json([datetime(2024, 1, 1)], compact=True)  # noqa: DTZ001
@@ -1,4 +1,10 @@
-from iokit import Jsonl
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from iokit import Jsonl, JsonlWriter, load_file, save_temp
+from iokit.extensions.json import JsonEngine
 
 
 def test_jsonl_empty() -> None:
@@ -28,3 +34,65 @@ def test_jsonl_multiple_similar() -> None:
     state = Jsonl(data, name="multiple")
     assert state.name == "multiple.jsonl"
     assert state.load() == data
+
+
+def test_jsonl_iter() -> None:
+    data = [{"i": i, "text": "x" * (i % 7)} for i in range(100)]
+    state = Jsonl(data, name="records")
+    assert list(state.iter()) == data
+    assert list(state.iter(skip=10, limit=5)) == data[10:15]
+    assert list(state.iter(skip=95, limit=50)) == data[95:]
+    batches = list(state.iter_batches(30))
+    assert [len(batch) for batch in batches] == [30, 30, 30, 10]
+    assert [r for batch in batches for r in batch] == data
+    assert list(state.iter_batches(4, skip=1, limit=6)) == [data[1:5], data[5:7]]
+    with pytest.raises(ValueError, match="Batch size"):
+        list(state.iter_batches(0))
+
+
+def test_jsonl_iter_parallel() -> None:
+    data = [{"i": i, "text": "x" * (i % 13)} for i in range(500)]
+    with save_temp(Jsonl(data, name="records")) as path:
+        state = load_file(path, Jsonl, mmap=True)
+        assert list(state.iter(workers=2, chunk_size=100)) == data
+        assert list(state.iter(workers=2, chunk_size=1, skip=3, limit=4)) == data[3:7]
+        batches = state.iter_batches(200, workers=2, chunk_size=1000)
+        assert [len(batch) for batch in batches] == [200, 200, 100]
+        records = state.iter(workers=2, chunk_size=1)
+        assert next(records) == data[0]
+        records.close()
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_jsonl_chunk_size_positive(chunk_size: int) -> None:
+    state = Jsonl([{"a": 1}])
+    with pytest.raises(ValueError, match="Chunk size"):
+        state.iter(workers=2, chunk_size=chunk_size)
+    with pytest.raises(ValueError, match="Chunk size"):
+        state.iter_batches(1, chunk_size=chunk_size)
+    with pytest.raises(ValueError, match="Batch size"):
+        state.iter_batches(0)
+
+
+def test_jsonl_writer(tmp_path: Path) -> None:
+    path = tmp_path / "log.jsonl"
+    with JsonlWriter(path) as writer:
+        writer.write({"a": 1})
+        writer.write_all([{"a": 2}, {"a": 3}])
+    with JsonlWriter(path) as writer:
+        writer.write({"a": 4})
+    assert path.read_bytes() == b'{"a":1}\n{"a":2}\n{"a":3}\n{"a":4}\n'
+    assert load_file(path, Jsonl).load() == [{"a": i} for i in range(1, 5)]
+    buffer = BytesIO()
+    with JsonlWriter(buffer, compact=False) as writer:
+        writer.write({"a": 1, "b": [1, 2]})
+    assert buffer.getvalue() == b'{"a": 1, "b": [1, 2]}\n'
+
+
+@pytest.mark.parametrize("engine", ["auto", "stdlib"])
+def test_jsonl_engine(engine: JsonEngine) -> None:
+    data = [{"a": i, "b": [float(i), None, "ü"]} for i in range(10)]
+    state = Jsonl(data, name="engine", engine=engine)
+    assert state.data == Jsonl(data, engine="stdlib").data
+    assert state.load(engine=engine) == data
+    assert list(state.iter(engine=engine, workers=2, chunk_size=50)) == data
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import pytest
+
+from iokit import migrate_layout
+from iokit.storage.layout import LAYOUT_FILE
+from iokit.storage.local import LocalStorage, StateStorage
+
+
+def test_sharded_local_storage(tmp_path: Path) -> None:
+    storage = LocalStorage(tmp_path, fanout=2)
+    storage.push("record", b"data")
+    storage.push("nested/record", b"nested")
+    path = storage.path("record")
+    assert path.exists()
+    assert len(path.relative_to(tmp_path).parts) == 3
+    assert sorted(storage.index()) == ["nested/record", "record"]
+    assert list(storage.index("nested/")) == ["nested/record"]
+    assert storage.pull("nested/record") == b"nested"
+    assert LocalStorage(tmp_path).fanout == 2
+    with pytest.raises(ValueError, match="fanout"):
+        LocalStorage(tmp_path, fanout=1)
+    storage.remove("record")
+    assert not storage.exists("record")
+
+
+def test_flat_index_skips_directories(tmp_path: Path) -> None:
+    storage = LocalStorage(tmp_path)
+    storage.push("dir/record", b"a")
+    storage.push("directory", b"b")
+    storage.push("other", b"c")
+    (tmp_path / ".hidden").write_bytes(b"")
+    assert sorted(storage.index()) == ["dir/record", "directory", "other"]
+    assert sorted(storage.index("dir")) == ["dir/record", "directory"]
+    assert list(storage.index("dir/")) == ["dir/record"]
+    with pytest.raises(ValueError, match="flat layout"):
+        LocalStorage(tmp_path, fanout=2)
+
+
+def test_migrate_layout(tmp_path: Path) -> None:
+    states = StateStorage(LocalStorage(tmp_path))
+    states.push_many([(f"item-{i}", {"i": i}) for i in range(20)])
+    assert migrate_layout(tmp_path, 2) == 20
+    assert (tmp_path / LAYOUT_FILE).exists()
+    assert not (tmp_path / "item-0.json").exists()
+    states = StateStorage(LocalStorage(tmp_path))
+    assert states.pull("item-7") == {"i": 7}
+    assert migrate_layout(tmp_path, 0) == 20
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(f"item-{i}.json" for i in range(20))
+
+
+@pytest.mark.parametrize(("source", "target"), [(0, 2), (2, 0), (1, 3)])
+def test_migrate_layout_resume(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    source: int,
+    target: int,
+) -> None:
+    storage = LocalStorage(tmp_path, fanout=source)
+    storage.push_many((f"dir/item-{i}", b"x") for i in range(10))
+    storage.push_many((f"item-{i}", b"y") for i in range(10))
+    replace = Path.replace
+    moves = 0
+
+    def interrupted(self: Path, destination: Path) -> Path:
+        nonlocal moves
+        moves += destination.name != LAYOUT_FILE
+        if moves > 7:
+            raise KeyboardInterrupt
+        return replace(self, destination)
+
+    monkeypatch.setattr(Path, "replace", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        migrate_layout(tmp_path, target)
+    monkeypatch.undo()
+    with pytest.raises(ValueError, match="unfinished migration"):
+        LocalStorage(tmp_path)
+    with pytest.raises(ValueError, match="unfinished migration"):
+        migrate_layout(tmp_path, target + 1)
+    assert migrate_layout(tmp_path, target) == 13
+    storage = LocalStorage(tmp_path)
+    assert storage.fanout == target
+    expected = [f"dir/item-{i}" for i in range(10)] + [f"item-{i}" for i in range(10)]
+    assert sorted(storage.index()) == sorted(expected)
+    assert storage.pull("dir/item-3") == b"x"
+
+
+def test_fanout_upper_bound(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="between 0 and 8"):
+        LocalStorage(tmp_path, fanout=9)
+    with pytest.raises(ValueError, match="between 0 and 8"):
+        migrate_layout(tmp_path, 9)
+    with pytest.raises(ValueError, match="between 0 and 8"):
+        migrate_layout(tmp_path, -1)
@@ -1,6 +1,9 @@
+from mmap import mmap
+
 import numpy as np
+import pytest
 
-from iokit import Npy
+from iokit import Npy, load_file, save_temp
 
 
 def test_npy() -> None:
@@ -9,3 +12,61 @@ def test_npy() -> None:
     assert str(state.name) == "test.npy"
     assert state.size > 0
     np.testing.assert_array_equal(state.load(), array)
+
+
+def test_npy_mmap() -> None:
+    array = np.arange(24, dtype=np.float32).reshape(4, 6)
+    with save_temp(Npy(array, name="test")) as path:
+        state = load_file(path, Npy, mmap=True)
+        assert isinstance(state.memory.obj, mmap)
+        view = state.load(copy=False)
+        assert not view.flags.writeable
+        assert np.shares_memory(view, np.frombuffer(state.memory, dtype=np.uint8))
+        np.testing.assert_array_equal(view, array)
+        np.testing.assert_array_equal(state.load(), array)
+        del view
+
+
+def test_npy_view_fortran_order() -> None:
+    array = np.asfortranarray(np.arange(12).reshape(3, 4))
+    state = Npy(array, name="test")
+    np.testing.assert_array_equal(state.load(copy=False), array)
+
+
+def test_npy_header() -> None:
+    array = np.zeros((5, 3), dtype=np.int16)
+    state = Npy(array, name="test")
+    assert state.shape == (5, 3)
+    assert state.dtype == np.int16
+
+
+@pytest.mark.parametrize(
+    "key",
+    [0, 3, -1, slice(None), slice(2, 5), slice(1, 8, 3), slice(None, None, -2), slice(4, 4)],
+)
+@pytest.mark.parametrize("fortran", [False, True])
+def test_npy_rows(key: int | slice, fortran: bool) -> None:  # noqa: FBT001
+    array = np.arange(60, dtype=np.float64).reshape(10, 6)
+    if fortran:
+        array = np.asfortranarray(array)
+    state = Npy(array, name="test")
+    np.testing.assert_array_equal(state.rows(key), array[key])
+    np.testing.assert_array_equal(state.rows(key, copy=False), array[key])
+
+
+def test_npy_rows_mmap() -> None:
+    array = np.arange(1000, dtype=np.int32).reshape(100, 10)
+    with save_temp(Npy(array, name="test")) as path:
+        state = load_file(path, Npy, mmap=True)
+        view = state.rows(slice(40, 50), copy=False)
+        assert np.shares_memory(view, np.frombuffer(state.memory, dtype=np.uint8))
+        np.testing.assert_array_equal(view, array[40:50])
+        del view
+
+
+def test_npy_rows_out_of_bounds() -> None:
+    state = Npy(np.arange(4), name="test")
+    with pytest.raises(IndexError):
+        state.rows(4)
+    with pytest.raises(IndexError):
+        Npy(np.array(1.0), name="test").rows(0)
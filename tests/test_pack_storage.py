@@ -0,0 +1,76 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from iokit import PackStorage
+from iokit.storage.local import StateStorage
+from iokit.storage.pack import _HEADER
+
+
+def test_pack_storage_records(tmp_path: Path) -> None:
+    with PackStorage(tmp_path, segment_size=64) as storage:
+        storage.push_many((f"item-{i}", bytes([i]) * 20) for i in range(10))
+        storage.push("empty", b"")
+        assert len(storage.segments()) > 1
+        assert storage.pull("item-3") == bytes([3]) * 20
+        assert storage.pull("empty") == b""
+        assert storage.pull_many(["item-9", "item-0"]) == [bytes([9]) * 20, bytes(20)]
+        assert storage.exists_many(["item-1", "missing"]) == [True, False]
+        assert list(storage.index("item-1")) == ["item-1"]
+        with pytest.raises(FileExistsError):
+            storage.push("item-1", b"other")
+        with pytest.raises(FileExistsError):
+            storage.push_many([("twice", b"1"), ("twice", b"2")])
+        assert not storage.exists("twice")
+        with pytest.raises(FileNotFoundError):
+            storage.remove_many(["item-1", "missing"])
+        assert storage.exists("item-1")
+        storage.push("item-1", b"other", force=True)
+        assert storage.pull("item-1") == b"other"
+    with PackStorage(tmp_path, mmap=True) as reader:
+        assert bytes(reader.pull("item-1")) == b"other"
+        assert len(list(reader.index())) == 11
+
+
+def test_pack_storage_compaction(tmp_path: Path) -> None:
+    storage = PackStorage(tmp_path, segment_size=100)
+    storage.push_many((f"item-{i}", bytes([i]) * 30) for i in range(10))
+    reader = PackStorage(tmp_path)
+    assert reader.pull("item-5") == bytes([5]) * 30
+    before = sum(path.stat().st_size for path in storage.segments())
+    storage.remove_many(f"item-{i}" for i in range(0, 10, 2))
+    assert storage.compact(min_garbage=1.0) == 0
+    reclaimed = storage.compact()
+    after = sum(path.stat().st_size for path in storage.segments())
+    assert reclaimed == before - after > 0
+    assert storage.compact() == 0
+    assert sorted(storage.index()) == [f"item-{i}" for i in range(1, 10, 2)]
+    assert reader.pull("item-5") == bytes([5]) * 30
+    with pytest.raises(FileNotFoundError):
+        reader.pull("item-4")
+    storage.close()
+    reader.close()
+
+
+def test_pack_storage_compaction_during_read(tmp_path: Path) -> None:
+    with PackStorage(tmp_path) as storage:
+        storage.push_many([("item", b"data"), ("garbage", b"data")])
+        storage.remove("garbage")
+        fd = storage._pin(1)
+        assert storage.compact() > 0
+        assert os.pread(fd, 4, _HEADER.size + 4) == b"data"
+        storage._unpin(fd)
+        with pytest.raises(OSError, match="Bad file descriptor"):
+            os.fstat(fd)
+        assert storage.pull("item") == b"data"
+
+
+def test_pack_storage_states(tmp_path: Path) -> None:
+    storage = StateStorage(PackStorage(tmp_path))
+    storage.push_many([(f"config-{i}", {"i": i}) for i in range(5)])
+    storage.push("note", "hello")
+    assert StateStorage(PackStorage(tmp_path)).pull_many(["note", "config-2"]) == [
+        "hello",
+        {"i": 2},
+    ]
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from iokit.storage.index import INDEX_FILE, RecordIndex, RecordInfo
+from iokit.storage.local import LocalStorage
+from iokit.tools.prefix import prefix_upper_bound
+
+
+def test_prefix_upper_bound() -> None:
+    assert prefix_upper_bound("abc") == "abd"
+    assert prefix_upper_bound("a\U0010ffff") == "b"
+    assert prefix_upper_bound("퟿") == ""
+    assert prefix_upper_bound("\U0010ffff") is None
+
+
+def test_record_index_query(tmp_path: Path) -> None:
+    index = RecordIndex(tmp_path / "index.sqlite")
+    index.add_many(RecordInfo(uid, 1, 0.0) for uid in ["a/1", "a/2", "ab", "b", "a"])
+    assert list(index.uids("a/")) == ["a/1", "a/2"]
+    assert list(index.uids("a")) == ["a", "a/1", "a/2", "ab"]
+    assert len(index) == 5
+    index.discard("ab")
+    assert "ab" not in index
+    assert index.get("b") == RecordInfo("b", 1, 0.0)
+    index.close()
+
+
+def test_indexed_local_storage(tmp_path: Path) -> None:
+    LocalStorage(tmp_path).push("existing", b"1")
+    storage = LocalStorage(tmp_path, indexed=True)
+    assert (tmp_path / INDEX_FILE).exists()
+    assert list(storage.index()) == ["existing"]
+    storage.push("dir/record", b"22")
+    storage.push_many([("dir/other", b"333"), ("directory", b"4")])
+    assert list(storage.index("dir/")) == ["dir/other", "dir/record"]
+    records = {record.uid: record for record in storage.records("dir")}
+    assert records["dir/other"].size == 3
+    assert records["dir/record"].time.timestamp() == pytest.approx(
+        (tmp_path / "dir/record").stat().st_mtime,
+    )
+    storage.remove("directory")
+    with pytest.raises(FileNotFoundError):
+        storage.remove_many(["dir/other", "missing"])
+    assert (tmp_path / "dir/other").exists()
+    assert list(storage.index()) == ["dir/other", "dir/record", "existing"]
+    storage.remove_many(["dir/other"])
+    assert list(storage.index()) == ["dir/record", "existing"]
+
+    (tmp_path / "external").write_bytes(b"")
+    assert "external" not in list(storage.index())
+    storage.reindex()
+    assert "external" in list(storage.index())
+    storage.close()
+
+    reopened = LocalStorage(tmp_path, indexed=True)
+    assert list(reopened.index()) == ["dir/record", "existing", "external"]
+    reopened.close()
+
+
+def test_indexed_push_many_partial(tmp_path: Path) -> None:
+    storage = LocalStorage(tmp_path, indexed=True, workers=1)
+    storage.push("b", b"old")
+    with pytest.raises(FileExistsError):
+        storage.push_many([("a", b"1"), ("b", b"2"), ("c", b"3")])
+    assert list(storage.index()) == ["a", "b"]
+    storage.close()
@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from iokit import Txt, save_file
+from iokit.storage.local import LocalStorage
+
+
+def test_save_file_atomic(tmp_path: Path) -> None:
+    path = save_file(Txt("first", name="note"), root=tmp_path)
+    with pytest.raises(FileExistsError):
+        save_file(Txt("second", name="note"), root=tmp_path)
+    save_file(Txt("third", name="note"), root=tmp_path, force=True, fsync="full")
+    assert path.read_text() == "third"
+    assert [p.name for p in tmp_path.iterdir()] == ["note.txt"]
+
+
+def test_save_file_exclusive_race(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "note.txt"
+    exists = Path.exists
+
+    def racing_exists(self: Path) -> bool:
+        if self == path and not exists(self):
+            path.write_text("winner")
+            return False
+        return exists(self)
+
+    monkeypatch.setattr(Path, "exists", racing_exists)
+    with pytest.raises(FileExistsError):
+        save_file(Txt("loser", name="note"), root=tmp_path)
+    monkeypatch.undo()
+    assert path.read_text() == "winner"
+    assert [p.name for p in tmp_path.iterdir()] == ["note.txt"]
+
+
+def test_save_file_without_hard_links(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_link(*_: object) -> None:
+        raise PermissionError
+
+    monkeypatch.setattr(os, "link", no_link)
+    save_file(Txt("data", name="note"), root=tmp_path)
+    with pytest.raises(FileExistsError):
+        save_file(Txt("other", name="note"), root=tmp_path)
+    assert (tmp_path / "note.txt").read_text() == "data"
+    assert [p.name for p in tmp_path.iterdir()] == ["note.txt"]
+
+
+def test_local_storage_batch_fsync(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+    fsync = os.fsync
+
+    def counting_fsync(fd: int) -> None:
+        calls.append(fd)
+        fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", counting_fsync)
+    LocalStorage(tmp_path / "none").push_many((str(i), b"x") for i in range(4))
+    assert calls == []
+    LocalStorage(tmp_path / "file", fsync="file").push_many((str(i), b"x") for i in range(4))
+    assert len(calls) == 4
+    calls.clear()
+    LocalStorage(tmp_path / "full", fsync="full").push_many((str(i), b"x") for i in range(4))
+    assert len(calls) == 5
+    calls.clear()
+    LocalStorage(tmp_path / "full", fsync="full").push("4", b"x")
+    assert len(calls) == 2
+
+
+def test_save_file_permissions(tmp_path: Path) -> None:
+    path = save_file(Txt("data", name="note"), root=tmp_path)
+    reference = tmp_path / "reference"
+    reference.write_bytes(b"")
+    assert path.stat().st_mode == reference.stat().st_mode
+
+
+@pytest.mark.skipif(os.name == "nt", reason="posix permissions")
+def test_save_file_current_umask(tmp_path: Path) -> None:
+    previous = os.umask(0o077)
+    try:
+        path = save_file(Txt("data", name="note"), root=tmp_path)
+    finally:
+        os.umask(previous)
+    assert path.stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+
+from iokit import SqliteStorage
+from iokit.storage.local import StateStorage
+
+
+def test_sqlite_storage_records(tmp_path: Path) -> None:
+    with SqliteStorage(tmp_path / "store.sqlite", blob_threshold=8) as storage:
+        storage.push_many((f"item-{i}", bytes([i]) * 4) for i in range(10))
+        storage.push("large", bytes(range(256)) * 10)
+        storage.push("empty", b"")
+        assert storage.pull("large") == bytes(range(256)) * 10
+        assert storage.pull("empty") == b""
+        assert storage.pull_many(["item-3", "large"]) == [bytes([3]) * 4, bytes(range(256)) * 10]
+        assert storage.exists_many(["item-1", "missing"]) == [True, False]
+        assert list(storage.index("item-1")) == ["item-1"]
+        with pytest.raises(FileExistsError):
+            storage.push_many([("fresh", b"x"), ("item-1", b"other")])
+        assert not storage.exists("fresh")
+        storage.push("item-1", memoryview(b"other"), force=True)
+        assert storage.pull("item-1") == b"other"
+        with pytest.raises(FileNotFoundError):
+            storage.remove_many(["item-2", "missing"])
+        assert storage.exists("item-2")
+        storage.remove("item-2")
+        with pytest.raises(FileNotFoundError):
+            storage.pull("item-2")
+    with SqliteStorage(tmp_path / "store.sqlite") as reader:
+        assert len(list(reader.index())) == 11
+
+
+def test_sqlite_storage_states(tmp_path: Path) -> None:
+    storage = StateStorage(SqliteStorage(tmp_path / "store.sqlite"))
+    storage.push_many([("config", {"a": 1}), ("note", "hello")])
+    assert storage.pull_many(["note", "config"]) == ["hello", {"a": 1}]
@@ -0,0 +1,148 @@
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+import pytest
+
+from iokit import Npy, Txt, save_file
+from iokit.storage.local import LocalStorage, MemoryStorage, StateStorage
+
+
+def test_state_storage_memory() -> None:
+    storage = StateStorage(MemoryStorage())
+    storage.push("config", {"a": 1})
+    storage.push("note", "hello")
+    assert storage.exists("config")
+    assert not storage.exists("missing")
+    assert storage.pull("config") == {"a": 1}
+    assert storage.pull("note") == "hello"
+    assert sorted(storage.index()) == ["config", "note"]
+    assert list(storage.index(prefix="co")) == ["config"]
+    with pytest.raises(FileExistsError):
+        storage.push("config", "other")
+    storage.push("config", "other", force=True)
+    assert storage.pull("config") == "other"
+    storage.remove("config")
+    assert not storage.exists("config")
+    with pytest.raises(FileNotFoundError):
+        storage.pull("config")
+    with pytest.raises(FileNotFoundError):
+        storage.remove("config")
+
+
+def test_state_storage_index_is_cached(tmp_path: Path) -> None:
+    backend = LocalStorage(tmp_path)
+    storage = StateStorage(backend)
+    storage.push("first", {"a": 1})
+    calls = 0
+    index = backend.index
+
+    def counting_index(prefix: str | None = None) -> object:
+        nonlocal calls
+        calls += 1
+        return index(prefix)
+
+    backend.index = counting_index  # type: ignore[method-assign]
+    for _ in range(10):
+        assert storage.pull("first") == {"a": 1}
+        assert storage.exists("first")
+    storage.push("second", "text")
+    assert storage.pull("second") == "text"
+    assert calls == 0
+
+
+def test_state_storage_reindex(tmp_path: Path) -> None:
+    storage = StateStorage(LocalStorage(tmp_path))
+    storage.push("first", {"a": 1})
+    save_file(Txt("external", name="second"), root=tmp_path)
+    assert not storage.exists("second")
+    storage.reindex()
+    assert storage.pull("second") == "external"
+    (tmp_path / "second.txt").unlink()
+    storage.invalidate()
+    assert not storage.exists("second")
+    assert storage.exists("first")
+    (tmp_path / "first.json").unlink()
+    with pytest.raises(FileNotFoundError):
+        storage.remove("first")
+    assert not storage.exists("first")
+
+
+def test_state_storage_local_mmap(tmp_path: Path) -> None:
+    array = np.arange(1000, dtype=np.int64)
+    StateStorage(LocalStorage(tmp_path)).push("array", array)
+    backend = LocalStorage(tmp_path, mmap=True)
+    assert isinstance(backend.pull("array.npy"), memoryview)
+    state = StateStorage(backend).pull_state("array", Npy)
+    np.testing.assert_array_equal(state.load(copy=False), array)
+
+
+def test_state_storage_batch(tmp_path: Path) -> None:
+    storage = StateStorage(LocalStorage(tmp_path, workers=4))
+    storage.push_many([("config", {"a": 1}), ("note", "hello"), ("array", np.arange(3))])
+    assert storage.exists_many(["config", "missing", "note"]) == [True, False, True]
+    config, note, array = storage.pull_many(["config", "note", "array"])
+    assert config == {"a": 1}
+    assert note == "hello"
+    np.testing.assert_array_equal(array, np.arange(3))
+    with pytest.raises(FileExistsError):
+        storage.push_many([("fresh", 1), ("note", "other")])
+    assert not storage.exists("fresh")
+    storage.push_many([("note", np.ones(2))], force=True)
+    np.testing.assert_array_equal(storage.pull_many(["note"])[0], np.ones(2))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["array.npy", "config.json", "note.npy"]
+    storage.remove_many(["config", "array"])
+    assert sorted(storage.index()) == ["note"]
+    with pytest.raises(FileNotFoundError):
+        storage.pull_many(["note", "config"])
+    with pytest.raises(FileNotFoundError):
+        storage.remove_many(["config"])
+
+
+def test_memory_storage_batch() -> None:
+    storage = MemoryStorage()
+    storage.push_many([("a", b"1"), ("b", memoryview(b"2"))])
+    assert storage.pull_many(["b", "a"]) == [b"2", b"1"]
+    with pytest.raises(FileExistsError):
+        storage.push_many([("c", b"3"), ("a", b"4")])
+    assert storage.exists_many(["a", "c"]) == [True, False]
+    with pytest.raises(FileNotFoundError):
+        storage.remove_many(["a", "c"])
+    assert storage.exists("a")
+    storage.remove_many(["a", "b"])
+    assert list(storage.index()) == []
+
+
+class RecordingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.order: list[str] = []
+
+    def push(self, uid: str, record: bytes | memoryview, *, force: bool = False) -> None:
+        super().push(uid, record, force=force)
+        self.order.append(uid)
+
+    def push_many(
+        self,
+        items: Iterable[tuple[str, bytes | memoryview]],
+        *,
+        force: bool = False,
+    ) -> None:
+        for uid, record in items:
+            self.push(uid, record, force=force)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_state_storage_push_pipeline(executor: Literal["thread", "process"]) -> None:
+    backend = RecordingStorage()
+    storage = StateStorage(backend, compression=True)
+    items = [(f"item-{i:02d}", {"i": i}) for i in range(20)]
+    stats = storage.push_pipeline(items, workers=2, executor=executor, max_pending=3, batch_size=4)
+    assert stats.records == 20
+    assert stats.bytes == sum(len(backend.pull(name)) for name in backend.order)
+    assert stats.total_seconds >= stats.write_seconds
+    assert backend.order == [f"item-{i:02d}.json.gz" for i in range(20)]
+    assert storage.pull("item-07") == {"i": 7}
+    with pytest.raises(FileExistsError):
+        storage.push_pipeline([("item-00", {})], executor="thread")
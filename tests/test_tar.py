@@ -1,4 +1,22 @@
-from iokit import Gzip, Tar, Txt, find_state
+from io import BytesIO
+from mmap import mmap
+from pathlib import Path
+
+import pytest
+
+from iokit import (
+    Gzip,
+    State,
+    Tar,
+    TarArchive,
+    TarWriter,
+    Txt,
+    find_state,
+    load_file,
+    save_file,
+    save_temp,
+)
+from iokit.extensions.tar import TarCompression
 
 
 def test_tar_state() -> None:
@@ -26,3 +44,57 @@ def test_tar_compress() -> None:
     loaded = archive1_gz.load().load()
     assert find_state(loaded, "text1.txt").load() == "First file"
     assert find_state(loaded, "text2.txt").load() == "Second file"
+
+
+def test_tar_mmap() -> None:
+    state1 = Txt("First file", name="text1")
+    state2 = Txt("Second file", name="text2")
+    with save_temp(Tar([state1, state2], name="archive")) as path:
+        archive = load_file(path, Tar, mmap=True)
+        assert archive.hexdigest("sha256") == load_file(path).hexdigest("sha256")
+        states = list(archive.load())
+        assert all(isinstance(state.memory.obj, mmap) for state in states)
+        assert find_state(states, "text1.txt").load() == "First file"
+        assert find_state(states, "text2.txt").load() == "Second file"
+
+
+def test_tar_archive_lazy(tmp_path: Path) -> None:
+    states = [Txt(f"File {i}", name=f"dir/text{i}") for i in range(5)]
+    archive = Tar(states, name="archive")
+    with archive.open() as view:
+        assert view.names() == [f"dir/text{i}.txt" for i in range(5)]
+        assert len(view) == 5
+        assert "dir/text3.txt" in view
+        assert view["dir/text3.txt"].load() == "File 3"
+        assert [s.load() for s in view.filter("*[24].txt")] == ["File 2", "File 4"]
+        with view.open("dir/text1.txt") as stream:
+            assert stream.read() == b"File 1"
+        with pytest.raises(FileNotFoundError):
+            view["missing.txt"]
+    path = save_file(Gzip(archive), root=tmp_path)
+    with TarArchive(path) as view:
+        assert view["dir/text0.txt"].load() == "File 0"
+
+
+@pytest.mark.parametrize("compression", [None, "gz", "bz2", "xz"])
+def test_tar_writer(tmp_path: Path, compression: TarCompression | None) -> None:
+    extra = tmp_path / "extra.bin"
+    extra.write_bytes(b"\x00" * 10_000)
+    path = tmp_path / "archive.tar"
+    compresslevel = None if compression is None else 1
+    with TarWriter(path, compression=compression, compresslevel=compresslevel) as writer:
+        for i in range(3):
+            writer.write(Txt(f"File {i}", name=f"text{i}"))
+        writer.write_file(extra)
+    with TarArchive(path) as view:
+        assert view.names() == ["text0.txt", "text1.txt", "text2.txt", "extra.bin"]
+        assert view["text2.txt"].load() == "File 2"
+        assert view["extra.bin"].data == extra.read_bytes()
+
+
+def test_tar_writer_stream() -> None:
+    buffer = BytesIO()
+    with TarWriter(buffer, compression="gz") as writer:
+        writer.write(Txt("First file", name="text1"))
+    archive = State(buffer.getvalue(), name="archive.tar.gz").cast(Gzip)
+    assert find_state(archive.load().load(), "text1.txt").load() == "First file"
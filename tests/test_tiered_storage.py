@@ -0,0 +1,112 @@
+from pathlib import Path
+from threading import Event, Thread
+
+import pytest
+
+from iokit import TieredStorage
+from iokit.storage.local import LocalStorage, MemoryStorage, StateStorage
+
+
+def test_tiered_storage_write_through(tmp_path: Path) -> None:
+    upper = MemoryStorage()
+    storage = TieredStorage(upper, LocalStorage(tmp_path), max_items=2)
+    storage.push_many([("a", b"1"), ("b", b"2"), ("c", b"3")])
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a", "b", "c"]
+    assert sorted(upper.index()) == ["b", "c"]
+    assert storage.pull("a") == b"1"
+    assert sorted(upper.index()) == ["a", "c"]
+    assert storage.pull_many(["c", "b"]) == [b"3", b"2"]
+    assert sorted(upper.index()) == ["b", "c"]
+    with pytest.raises(FileExistsError):
+        storage.push("a", b"other")
+    storage.remove("b")
+    assert not storage.exists("b")
+    assert not (tmp_path / "b").exists()
+    with pytest.raises(FileNotFoundError):
+        storage.remove("b")
+
+
+def test_tiered_storage_write_behind(tmp_path: Path) -> None:
+    upper = MemoryStorage()
+    lower = LocalStorage(tmp_path)
+    with TieredStorage(upper, lower, max_bytes=4, write="behind") as storage:
+        storage.push("a", b"11")
+        storage.push("b", b"22")
+        assert not lower.exists("a")
+        assert storage.dirty == {"a", "b"}
+        assert sorted(storage.index()) == ["a", "b"]
+        storage.push("c", b"33")
+        assert lower.pull("a") == b"11"
+        assert storage.dirty == {"b", "c"}
+        storage.push("big", b"12345")
+        assert lower.pull("big") == b"12345"
+        assert not upper.exists("big")
+        storage.remove("c")
+        assert not storage.exists("c")
+    assert sorted(lower.index()) == ["a", "b", "big"]
+
+
+def test_tiered_storage_states(tmp_path: Path) -> None:
+    tiered = TieredStorage(MemoryStorage(), LocalStorage(tmp_path), max_items=8)
+    StateStorage(tiered).push("config", {"a": 1})
+    assert StateStorage(LocalStorage(tmp_path)).pull("config") == {"a": 1}
+    assert StateStorage(tiered).pull("config") == {"a": 1}
+
+
+def test_tiered_storage_reads_do_not_wait_for_lower() -> None:
+    class SlowStorage(MemoryStorage):
+        def __init__(self) -> None:
+            super().__init__()
+            self.started = Event()
+            self.release = Event()
+
+        def pull(self, uid: str) -> bytes:
+            if uid == "slow":
+                self.started.set()
+                self.release.wait(timeout=5)
+            return super().pull(uid)
+
+    lower = SlowStorage()
+    lower.push("slow", b"1")
+    storage = TieredStorage(MemoryStorage(), lower)
+    storage.push("fast", b"2")
+    reader = Thread(target=storage.pull, args=("slow",))
+    reader.start()
+    lower.started.wait()
+    fast = Thread(target=storage.pull, args=("fast",))
+    fast.start()
+    fast.join(timeout=1)
+    assert not fast.is_alive()
+    lower.release.set()
+    reader.join()
+    assert storage.pull("slow") == b"1"
+
+
+def test_tiered_storage_writes_do_not_wait_for_promotion() -> None:
+    class SlowStorage(MemoryStorage):
+        def __init__(self) -> None:
+            super().__init__()
+            self.started = Event()
+            self.release = Event()
+
+        def push(self, uid: str, data: bytes | memoryview, *, force: bool = False) -> None:
+            if uid == "slow":
+                self.started.set()
+                self.release.wait(timeout=5)
+            super().push(uid, data, force=force)
+
+    upper = SlowStorage()
+    lower = MemoryStorage()
+    lower.push("slow", b"1")
+    storage = TieredStorage(upper, lower)
+    reader = Thread(target=storage.pull, args=("slow",))
+    reader.start()
+    upper.started.wait()
+    writer = Thread(target=storage.push, args=("fast", b"2"))
+    writer.start()
+    writer.join(timeout=1)
+    assert not writer.is_alive()
+    upper.release.set()
+    reader.join()
+    assert upper.pull("slow") == b"1"
+    assert storage.pull("fast") == b"2"
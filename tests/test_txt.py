@@ -23,3 +23,8 @@ def test_txt_state_japanese() -> None:
     state = Txt(text, name="text")
     assert state.load() == text
     assert state.size > len(text) * 2
+
+
+def test_txt_iter() -> None:
+    state = Txt("first\nsecond\n", name="lines")
+    assert list(state.iter()) == ["first", "second"]
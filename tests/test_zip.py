@@ -1,4 +1,10 @@
-from iokit import Txt, Zip, find_state
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from iokit import Txt, Zip, ZipArchive, ZipWriter, find_state, load_file, save_temp
+from iokit.extensions.zip import ZipCompression
 
 
 def test_zip_state() -> None:
@@ -13,3 +19,53 @@ def test_zip_state() -> None:
     assert len(states) == 2
     assert find_state(states, "text1.txt").load() == "First file"
     assert find_state(states, "text2.txt").load() == "Second file"
+
+
+def test_zip_mmap() -> None:
+    state1 = Txt("First file", name="text1")
+    state2 = Txt("Second file", name="text2")
+    with save_temp(Zip([state1, state2], name="archive")) as path:
+        archive = load_file(path, Zip, mmap=True)
+        assert archive.size == path.stat().st_size
+        states = list(archive.load())
+        assert find_state(states, "text1.txt").load() == "First file"
+        assert find_state(states, "text2.txt").load() == "Second file"
+
+
+def test_zip_archive_lazy() -> None:
+    states = [Txt(f"File {i}", name=f"text{i}") for i in range(5)]
+    with save_temp(Zip(states, name="archive")) as path, ZipArchive(path) as view:
+        assert view.names() == [f"text{i}.txt" for i in range(5)]
+        assert view["text2.txt"].load() == "File 2"
+        assert [s.load() for s in view.filter("text[01].txt")] == ["File 0", "File 1"]
+        with view.open("text4.txt") as stream:
+            assert stream.read() == b"File 4"
+        with pytest.raises(FileNotFoundError):
+            view["missing.txt"]
+
+
+@pytest.mark.parametrize("compression", ["stored", "deflated", "bzip2", "lzma"])
+def test_zip_writer(tmp_path: Path, compression: ZipCompression) -> None:
+    extra = tmp_path / "extra.txt"
+    extra.write_text("Hello, World! " * 1000)
+    path = tmp_path / "archive.zip"
+    with ZipWriter(path, compression=compression) as writer:
+        writer.write(Txt("First file", name="text1"))
+        writer.write_file(extra, name="nested/extra.txt")
+    with ZipArchive(path) as view:
+        assert view.names() == ["text1.txt", "nested/extra.txt"]
+        assert view["text1.txt"].load() == "First file"
+        assert view["nested/extra.txt"].load() == extra.read_text()
+    if compression != "stored":
+        assert path.stat().st_size < extra.stat().st_size
+
+
+def test_zip_writer_zstd(tmp_path: Path) -> None:
+    if not hasattr(zipfile, "ZIP_ZSTANDARD"):
+        with pytest.raises(ValueError, match="zstd"):
+            ZipWriter(tmp_path / "archive.zip", compression="zstd")
+        return
+    with ZipWriter(tmp_path / "archive.zip", compression="zstd", compresslevel=3) as writer:
+        writer.write(Txt("First file", name="text1"))
+    with ZipArchive(tmp_path / "archive.zip") as view:
+        assert view["text1.txt"].load() == "First file"